@@ -13,6 +13,11 @@ from model import (
     GameRound,
     Challenge,
     RoundSubmission,
+    PrefetchJob,
+    EvaluationCacheEntry,
+    UsageRecord,
+    SessionResultSnapshot,
+    SubmissionIdempotencyRecord,
     SelfEvaluation,
     TaskNote,
     TaskResource
@@ -16,6 +16,7 @@ class AudioStorage(str, Enum):
     s3 = "s3"
     supabase = "supabase"
     gcs = "gcs"
+    local = "local"
     none = "none"
 
 class PlayMode(str, Enum):
@@ -60,4 +61,39 @@ class GameRoundStatus(str, Enum):
         return self.value
 
 
+class PrefetchJobStatus(str, Enum):
+    queued = "queued" # Waiting for a worker (new, or scheduled for a retry)
+    running = "running" # Claimed by a worker; lease expires after PREFETCH_JOB_LEASE_SECONDS
+    succeeded = "succeeded" # Round is prepared (or was already prepared)
+    skipped = "skipped" # Nothing to do: session no longer active or round already played
+    failed = "failed" # Gave up after PREFETCH_MAX_ATTEMPTS; see last_error
 
+    def __str__(self) -> str:
+        return self.value
+
+
+class GradingMode(str, Enum):
+    sync = "sync" # Every answer is scored inside the attempt request
+    background = "background" # Open-ended answers are scored by the background grader
+    end_of_session = "end_of_session" # Open-ended answers are scored together, in one request, once the session finishes
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class EvaluationStatus(str, Enum):
+    pending_evaluation = "pending_evaluation" # Stored; waiting for the background grader
+    evaluating = "evaluating" # Claimed by a grader; lease expires after GRADER_LEASE_SECONDS
+    evaluated = "evaluated" # Score and feedback are final
+    failed = "failed" # Could not be graded; see evaluation_error
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class UsageProvider(str, Enum):
+    llm = "llm" # OpenAI chat completion (challenge generation or answer evaluation)
+    tts = "tts" # ElevenLabs speech synthesis
+
+    def __str__(self) -> str:
+        return self.value
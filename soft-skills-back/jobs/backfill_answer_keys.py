@@ -0,0 +1,35 @@
+"""
+One-off backfill of precompiled answer keys for existing focus/cloze challenges.
+
+Safe to re-run: only challenges without a key, or with a key from an older
+ANSWER_KEY_VERSION, are updated.
+
+    python -m jobs.backfill_answer_keys --batch-size 500
+"""
+import argparse
+import logging
+
+from sqlmodel import Session
+
+from service.challenge import ChallengeService
+from utils.db import engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile answer keys for stored focus and cloze challenges.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    )
+
+    with Session(engine) as session:
+        counts = ChallengeService().backfill_answer_keys(session, batch_size=args.batch_size)
+
+    print(f"Scanned {counts['scanned']} challenge(s), updated {counts['updated']}, failed {counts['failed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Backfill of pre-rendered difficulty audio variants for challenges that already
+have audio. Each challenge missing a profile is synthesized again with its stored
+voice, and its original audio is replaced so it matches the variants. Safe to
+re-run: challenges with every profile are skipped.
+
+    python -m jobs.backfill_audio_variants --batch-size 100
+"""
+import argparse
+import logging
+
+from sqlmodel import Session
+
+from service.challenge import ChallengeService
+from utils.db import engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render missing difficulty audio variants for stored challenges.")
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    )
+
+    with Session(engine) as session:
+        counts = ChallengeService().backfill_audio_variants(session, batch_size=args.batch_size)
+
+    print(
+        f"Scanned {counts['scanned']} challenge(s): skipped {counts['skipped']}, re-synthesized {counts['rendered']} "
+        f"({counts['variants']} variant(s)), failed {counts['failed']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Consistency check for the running score totals kept on each game session.
+
+Reports sessions whose total_score, total_max_score or attempted_rounds differ
+from the aggregate over their rounds. With --fix the aggregate is written back,
+which is also how sessions created before the totals existed get backfilled.
+
+    python -m jobs.check_session_totals
+    python -m jobs.check_session_totals --fix
+"""
+import argparse
+import logging
+import sys
+from uuid import UUID
+
+from sqlmodel import Session
+
+from service.listening_core.session_totals import check_session_totals
+from utils.db import engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check (and optionally repair) running score totals on game sessions.")
+    parser.add_argument("--fix", action="store_true", help="Overwrite drifted totals with the aggregate over rounds")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--session-id", type=UUID, default=None, help="Check a single session")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    )
+
+    with Session(engine) as session:
+        mismatches = check_session_totals(
+            session,
+            fix=args.fix,
+            batch_size=args.batch_size,
+            game_session_id=args.session_id
+        )
+
+    action = "Repaired" if args.fix else "Found"
+    print(f"{action} {len(mismatches)} session(s) with drifted totals")
+
+    if mismatches and not args.fix:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Standalone prefetch worker.
+
+Run alongside the API when PREFETCH_WORKER_MODE=external:
+
+    python -m jobs.prefetch_worker --concurrency 4
+"""
+from jobs.runner import run_worker_cli
+from service.listening_core.prefetch_worker import PrefetchWorker
+from utils.config import settings
+
+
+def main() -> None:
+    run_worker_cli(
+        lambda concurrency, poll_interval: PrefetchWorker(
+            concurrency=concurrency,
+            poll_interval_seconds=poll_interval
+        ),
+        description="Prepare queued listening game rounds.",
+        default_concurrency=settings.PREFETCH_WORKER_CONCURRENCY,
+        default_poll_interval=settings.PREFETCH_POLL_INTERVAL_SECONDS
+    )
+
+
+if __name__ == "__main__":
+    main()
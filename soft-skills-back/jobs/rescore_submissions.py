@@ -0,0 +1,88 @@
+"""
+Re-score past submissions after an answer key or a scoring rule changes.
+
+Focus and cloze submissions are re-scored here; open-ended modes passed with
+--play-mode are put back in the grading queue for the grader worker. Progress
+is saved to the checkpoint file after every batch, and a run started with the
+same file resumes after the last written submission.
+
+    python -m jobs.rescore_submissions --dry-run
+    python -m jobs.rescore_submissions --challenge-id <uuid> --checkpoint rescore.json
+    python -m jobs.rescore_submissions --play-mode summarize --requeue-per-minute 30
+"""
+import argparse
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+from uuid import UUID
+
+from enums.listening_game import PlayMode
+from service.listening_core.rescoring import DETERMINISTIC_PLAY_MODES, RescoreCheckpoint, rescore_submissions
+
+
+def _read_checkpoint(path: Path) -> Optional[RescoreCheckpoint]:
+    if not path.exists():
+        return None
+
+    data = json.loads(path.read_text())
+    return RescoreCheckpoint(UUID(data["challenge_id"]), UUID(data["round_submission_id"]))
+
+
+def _write_checkpoint(path: Path, checkpoint: RescoreCheckpoint, counts: Dict[str, int]) -> None:
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(json.dumps({
+        "challenge_id": str(checkpoint.challenge_id),
+        "round_submission_id": str(checkpoint.round_submission_id),
+        "counts": counts
+    }))
+    os.replace(temporary, path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score stored round submissions with the current answer keys and scoring rules.")
+    parser.add_argument(
+        "--play-mode",
+        type=PlayMode,
+        action="append",
+        dest="play_modes",
+        help="Repeatable; defaults to focus and cloze. Open-ended modes are requeued for the grader"
+    )
+    parser.add_argument("--challenge-id", type=UUID, action="append", dest="challenge_ids", help="Repeatable; only these challenges")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--requeue-per-minute", type=float, default=60.0, help="Rate at which open-ended submissions are requeued")
+    parser.add_argument("--checkpoint", type=Path, default=None, help="Progress file; resumes from it when it exists")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    args = parser.parse_args()
+    if args.requeue_per_minute <= 0:
+        parser.error("--requeue-per-minute must be greater than 0")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    )
+
+    resume_after = _read_checkpoint(args.checkpoint) if args.checkpoint else None
+    if resume_after is not None:
+        logging.info(f"Resuming after {resume_after}")
+
+    counts = rescore_submissions(
+        play_modes=args.play_modes or DETERMINISTIC_PLAY_MODES,
+        challenge_ids=args.challenge_ids,
+        batch_size=args.batch_size,
+        requeue_per_minute=args.requeue_per_minute,
+        dry_run=args.dry_run,
+        resume_after=resume_after,
+        on_checkpoint=(lambda checkpoint, counts: _write_checkpoint(args.checkpoint, checkpoint, counts)) if args.checkpoint else None
+    )
+
+    verb = "Would change" if args.dry_run else "Changed"
+    print(
+        f"Scanned {counts['scanned']} submission(s). {verb} {counts['changed']}, unchanged {counts['unchanged']}, "
+        f"failed {counts['failed']}, requeued {counts['requeued']}, answer keys updated {counts['keys_updated']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
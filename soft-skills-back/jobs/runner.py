@@ -0,0 +1,36 @@
+import argparse
+import logging
+from typing import Callable
+
+from service.listening_core.polling_worker import PollingWorker
+
+
+def run_worker_cli(
+    worker_factory: Callable[[int, float], PollingWorker],
+    description: str,
+    default_concurrency: int,
+    default_poll_interval: float
+) -> None:
+    """Parse the common worker flags and run the worker in the foreground."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--concurrency", type=int, default=default_concurrency)
+    parser.add_argument("--poll-interval", type=float, default=default_poll_interval)
+    parser.add_argument("--once", action="store_true", help="Process a single batch and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    )
+
+    worker = worker_factory(args.concurrency, args.poll_interval)
+
+    if args.once:
+        processed = worker.run_once()
+        print(f"Processed {processed} item(s)")
+        return
+
+    try:
+        worker.run_forever()
+    except KeyboardInterrupt:
+        worker.stop()
@@ -0,0 +1,26 @@
+"""
+Standalone submission grader.
+
+Run alongside the API when GRADER_WORKER_MODE=external:
+
+    python -m jobs.submission_grader --concurrency 4
+"""
+from jobs.runner import run_worker_cli
+from service.listening_core.grading_worker import SubmissionGrader
+from utils.config import settings
+
+
+def main() -> None:
+    run_worker_cli(
+        lambda concurrency, poll_interval: SubmissionGrader(
+            concurrency=concurrency,
+            poll_interval_seconds=poll_interval
+        ),
+        description="Grade listening game submissions pending evaluation.",
+        default_concurrency=settings.GRADER_CONCURRENCY,
+        default_poll_interval=settings.GRADER_POLL_INTERVAL_SECONDS
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,21 @@ and execute LLM models to generate JSON responses for listening challenges.
 """
 
 from .prompt_loader import PromptLoader
-from .prompt_builder import PromptBuilder
-from .models import LLMClient
+from .prompt_builder import PromptBuilder, get_prompt_builder
+from .models import LLMClient, get_llm_client, llm_clients
 from .challenge_generator import generate_challenge_json
-from .challenge_evaluation import evaluate_clarify_questions, evaluate_summarize_answer, evaluate_paraphrase_answer
+from .challenge_evaluation import evaluate_clarify_questions, evaluate_summarize_answer, evaluate_paraphrase_answer, evaluate_batch
 
 __all__ = [
     "PromptLoader",
     "PromptBuilder", 
+    "get_prompt_builder",
     "LLMClient",
+    "get_llm_client",
+    "llm_clients",
     "generate_challenge_json",
     "evaluate_clarify_questions",
     "evaluate_summarize_answer",
-    "evaluate_paraphrase_answer"
+    "evaluate_paraphrase_answer",
+    "evaluate_batch"
 ]
@@ -5,13 +5,47 @@ Provides functions to evaluate answers for different play modes using LLM-based
 """
 
 import json
-from typing import Dict, Any
-from .models import LLMClient
-from .schemas import ClarifyEvaluationResponse, SummarizeEvaluationResponse, ParaphraseEvaluationResponse
-from .prompt_loader import PromptLoader
-from .prompt_builder import PromptBuilder
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, ValidationError
+from .models import get_llm_client
+from .schemas import (
+    ClarifyEvaluationResponse,
+    SummarizeEvaluationResponse,
+    ParaphraseEvaluationResponse,
+    BatchEvaluationItem,
+    BatchEvaluationResponse
+)
+from .prompt_builder import get_prompt_builder
+from .evaluation_cache import evaluation_cache, normalize_answer_text
 from utils.errors import APIException
 
+EVALUATION_SCHEMAS = {
+    "clarify": ClarifyEvaluationResponse,
+    "summarize": SummarizeEvaluationResponse,
+    "paraphrase": ParaphraseEvaluationResponse,
+}
+
+
+def _cache_key(
+    mode: str,
+    reference: Dict[str, Any],
+    answer: Dict[str, Any],
+    model_name: str,
+    temperature: float
+) -> Optional[str]:
+    """Cache key of an answer, the same whether it is graded alone or inside a batch."""
+    if mode == "clarify":
+        cache_reference = reference["reference_questions"]
+        cache_answer = [normalize_answer_text(question) for question in answer["questions"]]
+    elif mode == "summarize":
+        cache_reference = reference["reference_summary"]
+        cache_answer = normalize_answer_text(answer["summary"])
+    else:
+        cache_reference = {"reference_text": reference["reference_text"], "rubric": reference["rubric"]}
+        cache_answer = normalize_answer_text(answer["paraphrase"])
+    
+    return evaluation_cache.build_key(mode, model_name, temperature, reference=cache_reference, answer=cache_answer)
+
 
 def evaluate_clarify_questions(
     reference_questions: list[str],
@@ -32,10 +66,19 @@ def evaluate_clarify_questions(
         ClarifyEvaluationResponse with evaluations for each question.
     """
     try:
-        prompt_loader = PromptLoader()
-        prompt_builder = PromptBuilder(prompt_loader)
+        cache_key = _cache_key(
+            "clarify",
+            {"reference_questions": reference_questions},
+            {"questions": player_questions},
+            model_name,
+            temperature
+        )
+        cached = evaluation_cache.get("clarify", cache_key, ClarifyEvaluationResponse)
+        if cached is not None:
+            return cached
         
-        llm_client = LLMClient(model_name=model_name, temperature=temperature)
+        prompt_builder = get_prompt_builder()
+        llm_client = get_llm_client(model_name=model_name, temperature=temperature)
         prompt_template = prompt_builder.build_evaluation_prompt("clarify")
         
         evaluation = llm_client.execute_prompt(
@@ -50,6 +93,7 @@ def evaluate_clarify_questions(
                 f"El LLM devolvió {len(evaluation.per_question)} evaluaciones para {len(player_questions)} preguntas"
             )
         
+        evaluation_cache.set("clarify", cache_key, model_name, evaluation)
         return evaluation
         
     except APIException:
@@ -77,9 +121,19 @@ def evaluate_summarize_answer(
         SummarizeEvaluationResponse with evaluation.
     """
     try:
-        llm_client = LLMClient(model_name=model_name, temperature=temperature)
-        prompt_loader = PromptLoader()
-        prompt_builder = PromptBuilder(prompt_loader)
+        cache_key = _cache_key(
+            "summarize",
+            {"reference_summary": reference_summary},
+            {"summary": player_summary},
+            model_name,
+            temperature
+        )
+        cached = evaluation_cache.get("summarize", cache_key, SummarizeEvaluationResponse)
+        if cached is not None:
+            return cached
+        
+        llm_client = get_llm_client(model_name=model_name, temperature=temperature)
+        prompt_builder = get_prompt_builder()
         prompt_template = prompt_builder.build_evaluation_prompt("summarize")
         
         evaluation = llm_client.execute_prompt(
@@ -89,6 +143,7 @@ def evaluate_summarize_answer(
             player_summary=player_summary
         )
         
+        evaluation_cache.set("summarize", cache_key, model_name, evaluation)
         return evaluation
         
     except APIException:
@@ -119,9 +174,19 @@ def evaluate_paraphrase_answer(
         ParaphraseEvaluationResponse with evaluation.
     """
     try:
-        llm_client = LLMClient(model_name=model_name, temperature=temperature)
-        prompt_loader = PromptLoader()
-        prompt_builder = PromptBuilder(prompt_loader)
+        cache_key = _cache_key(
+            "paraphrase",
+            {"reference_text": reference_text, "rubric": rubric},
+            {"paraphrase": player_paraphrase},
+            model_name,
+            temperature
+        )
+        cached = evaluation_cache.get("paraphrase", cache_key, ParaphraseEvaluationResponse)
+        if cached is not None:
+            return cached
+        
+        llm_client = get_llm_client(model_name=model_name, temperature=temperature)
+        prompt_builder = get_prompt_builder()
         prompt_template = prompt_builder.build_evaluation_prompt("paraphrase")
         
         evaluation = llm_client.execute_prompt(
@@ -132,6 +197,7 @@ def evaluate_paraphrase_answer(
             rubric=json.dumps(rubric, ensure_ascii=False)
         )
         
+        evaluation_cache.set("paraphrase", cache_key, model_name, evaluation)
         return evaluation
         
     except APIException:
@@ -139,3 +205,115 @@ def evaluate_paraphrase_answer(
     except Exception as e:
         raise APIException(f"Error al evaluar respuesta de paráfrasis: {str(e)}")
 
+
+def _batch_item_from_response(item_id: str, mode: str, response: BaseModel) -> BatchEvaluationItem:
+    if mode == "clarify":
+        return BatchEvaluationItem(item_id=item_id, per_question=response.per_question)
+    
+    criterion_scores = []
+    if mode == "paraphrase":
+        criterion_scores = [response.criterion_1_0_2, response.criterion_2_0_2, response.criterion_3_0_2]
+    
+    return BatchEvaluationItem(
+        item_id=item_id,
+        score_0_2=response.score_0_2,
+        criterion_scores=criterion_scores,
+        reason=response.reason,
+        flags=response.flags
+    )
+
+
+def _response_from_batch_item(mode: str, item: BatchEvaluationItem, answer: Dict[str, Any]) -> Optional[BaseModel]:
+    """The single-request response for a batch evaluation, or None if it is incomplete (and not cacheable)."""
+    try:
+        if mode == "clarify":
+            if len(item.per_question) != len(answer["questions"]):
+                return None
+            return ClarifyEvaluationResponse(per_question=item.per_question)
+        
+        if item.score_0_2 is None:
+            return None
+        
+        if mode == "summarize":
+            return SummarizeEvaluationResponse(score_0_2=item.score_0_2, reason=item.reason, flags=item.flags)
+        
+        if len(item.criterion_scores) != 3:
+            return None
+        criterion_1, criterion_2, criterion_3 = item.criterion_scores
+        return ParaphraseEvaluationResponse(
+            criterion_1_0_2=criterion_1,
+            criterion_2_0_2=criterion_2,
+            criterion_3_0_2=criterion_3,
+            score_0_2=item.score_0_2,
+            reason=item.reason,
+            flags=item.flags
+        )
+    
+    except ValidationError:
+        return None
+
+
+def evaluate_batch(
+    items: List[Dict[str, Any]],
+    model_name: str = "gpt-4o-mini",
+    temperature: float = 0.1
+) -> BatchEvaluationResponse:
+    """
+    Evaluate several open-ended answers (summarize, paraphrase, clarify) in one LLM request.
+    
+    Args:
+        items: Answers to grade, each a dict with item_id, mode, reference and answer.
+        model_name: OpenAI model name (default: gpt-4o-mini).
+        temperature: Model temperature (default: 0.1).
+        
+    Returns:
+        BatchEvaluationResponse with at most one evaluation per input item_id.
+        Items the LLM skipped are simply missing; the caller decides how to retry them.
+        Items are looked up in (and stored to) the evaluation cache under the same key as
+        a single request, so only uncached answers are sent to the LLM.
+    """
+    try:
+        cache_keys = {
+            item["item_id"]: _cache_key(item["mode"], item["reference"], item["answer"], model_name, temperature)
+            for item in items
+        }
+        
+        by_id = {}
+        for item in items:
+            cached = evaluation_cache.get(item["mode"], cache_keys[item["item_id"]], EVALUATION_SCHEMAS[item["mode"]])
+            if cached is not None:
+                by_id[item["item_id"]] = _batch_item_from_response(item["item_id"], item["mode"], cached)
+        
+        pending_items = [item for item in items if item["item_id"] not in by_id]
+        if not pending_items:
+            return BatchEvaluationResponse(items=list(by_id.values()))
+        
+        llm_client = get_llm_client(model_name=model_name, temperature=temperature)
+        prompt_builder = get_prompt_builder()
+        prompt_template = prompt_builder.build_evaluation_prompt("batch")
+        
+        evaluation = llm_client.execute_prompt(
+            prompt_template,
+            BatchEvaluationResponse,
+            items=json.dumps(pending_items, ensure_ascii=False)
+        )
+        
+        # Keep the first evaluation per requested item; drop invented or repeated ids
+        pending_by_id = {item["item_id"]: item for item in pending_items}
+        for evaluated in evaluation.items:
+            item = pending_by_id.get(evaluated.item_id)
+            if item is None or evaluated.item_id in by_id:
+                continue
+            
+            by_id[evaluated.item_id] = evaluated
+            response = _response_from_batch_item(item["mode"], evaluated, item["answer"])
+            if response is not None:
+                evaluation_cache.set(item["mode"], cache_keys[evaluated.item_id], model_name, response)
+        
+        evaluation.items = list(by_id.values())
+        return evaluation
+        
+    except APIException:
+        raise
+    except Exception as e:
+        raise APIException(f"Error al evaluar respuestas en lote: {str(e)}")
@@ -4,15 +4,41 @@ Challenge generator module for generating listening challenges using LLM.
 Provides the main public function to generate challenge JSON based on parameters.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from enums.listening_game import PlayMode, PromptType, Difficulty, AudioLength
 from enums.common.language import Language
-from .prompt_loader import PromptLoader
-from .prompt_builder import PromptBuilder
-from .models import LLMClient
-from .schemas import FocusChallenge, ClozeChallenge, ParaphraseChallenge, SummarizeChallenge, ClarifyChallenge
+from .prompt_builder import get_prompt_builder
+from .models import get_llm_client
+from .schemas import (
+    FocusChallenge,
+    ClozeChallenge,
+    ParaphraseChallenge,
+    SummarizeChallenge,
+    ClarifyChallenge,
+    FocusChallengeBatch,
+    ClozeChallengeBatch,
+    ParaphraseChallengeBatch,
+    SummarizeChallengeBatch,
+    ClarifyChallengeBatch
+)
 from utils.errors import APIException, BadRequest
 
+CHALLENGE_SCHEMAS = {
+    PlayMode.focus: FocusChallenge,
+    PlayMode.cloze: ClozeChallenge,
+    PlayMode.paraphrase: ParaphraseChallenge,
+    PlayMode.summarize: SummarizeChallenge,
+    PlayMode.clarify: ClarifyChallenge
+}
+
+CHALLENGE_BATCH_SCHEMAS = {
+    PlayMode.focus: FocusChallengeBatch,
+    PlayMode.cloze: ClozeChallengeBatch,
+    PlayMode.paraphrase: ParaphraseChallengeBatch,
+    PlayMode.summarize: SummarizeChallengeBatch,
+    PlayMode.clarify: ClarifyChallengeBatch
+}
+
 def _validate_combination(play_mode: PlayMode, prompt_type: PromptType) -> None:
     """Validate that the play mode and prompt type combination is allowed, raising BadRequest if invalid."""
     if play_mode == PlayMode.paraphrase and prompt_type == PromptType.dialogue:
@@ -55,24 +81,15 @@ def generate_challenge_json(
     _validate_combination(play_mode, prompt_type)
     
     try:
-        prompt_loader = PromptLoader()
-        prompt_builder = PromptBuilder(prompt_loader)
-        llm_client = LLMClient(model_name=model_name, temperature=temperature)
+        prompt_builder = get_prompt_builder()
+        llm_client = get_llm_client(model_name=model_name, temperature=temperature)
         
         chat_template = prompt_builder.build_chat_prompt(
             play_mode=play_mode,
             difficulty=difficulty
         )
         
-        schema_map = {
-            PlayMode.focus: FocusChallenge,
-            PlayMode.cloze: ClozeChallenge,
-            PlayMode.paraphrase: ParaphraseChallenge,
-            PlayMode.summarize: SummarizeChallenge,
-            PlayMode.clarify: ClarifyChallenge
-        }
-        
-        response_schema = schema_map[play_mode]
+        response_schema = CHALLENGE_SCHEMAS[play_mode]
         
         structured_response = llm_client.execute_prompt(
             chat_template,
@@ -83,7 +100,11 @@ def generate_challenge_json(
             difficulty=difficulty.value
         )
         
-        return structured_response.model_dump()
+        challenge_json = structured_response.model_dump()
+        # Recorded with the challenge so A/B prompt versions can be compared later
+        challenge_json["prompt_version"] = (chat_template.metadata or {}).get("prompt_version")
+        
+        return challenge_json
         
     except FileNotFoundError as e:
         raise APIException(
@@ -102,3 +123,73 @@ def generate_challenge_json(
         raise APIException(
             f"Error al generar desafío: {str(e)}"
         )
+
+
+def generate_challenge_batch_json(
+    play_mode: PlayMode,
+    prompt_type: PromptType,
+    difficulty: Difficulty,
+    audio_length: AudioLength,
+    locale: Language,
+    count: int,
+    model_name: str = "gpt-4o-mini",
+    temperature: float = 0.7
+) -> List[Dict[str, Any]]:
+    """
+    Generate several listening challenges of the same kind with one LLM call.
+    
+    The items are only shaped by the response schema; callers validate each one
+    and keep the good ones. Takes the same arguments as generate_challenge_json,
+    plus the number of challenges to ask for.
+    
+    Returns:
+        List of challenge dictionaries, each with its prompt_version.
+    """
+    _validate_combination(play_mode, prompt_type)
+    
+    try:
+        prompt_builder = get_prompt_builder()
+        llm_client = get_llm_client(model_name=model_name, temperature=temperature)
+        
+        chat_template = prompt_builder.build_batch_chat_prompt(
+            play_mode=play_mode,
+            difficulty=difficulty
+        )
+        
+        structured_response = llm_client.execute_prompt(
+            chat_template,
+            CHALLENGE_BATCH_SCHEMAS[play_mode],
+            prompt_type=prompt_type.value,
+            audio_length=audio_length.value,
+            locale=locale.value,
+            difficulty=difficulty.value,
+            challenge_count=count
+        )
+        
+        prompt_version = (chat_template.metadata or {}).get("prompt_version")
+        challenges = []
+        
+        for challenge in structured_response.challenges:
+            challenge_json = challenge.model_dump()
+            challenge_json["prompt_version"] = prompt_version
+            challenges.append(challenge_json)
+        
+        return challenges
+        
+    except FileNotFoundError as e:
+        raise APIException(
+            f"Archivo de prompt no encontrado: {str(e)}"
+        )
+
+    except ValueError as e:
+        raise APIException(
+            f"Error de configuración: {str(e)}"
+        )
+        
+    except Exception as e:
+        if isinstance(e, APIException):
+            raise e
+        
+        raise APIException(
+            f"Error al generar desafíos: {str(e)}"
+        )
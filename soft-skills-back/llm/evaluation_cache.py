@@ -0,0 +1,212 @@
+"""
+Evaluation cache module for reusing LLM evaluations of identical answers.
+
+Two tiers: an in-process LRU in front of the listening_evaluation_cache table.
+Keys hash the evaluation type, a fingerprint of the evaluation prompt files,
+the model settings, the reference material and the normalized player answer,
+so editing a prompt file changes every key for that evaluation type.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import unicodedata
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlmodel import Session, delete
+from sqlalchemy.exc import IntegrityError
+
+from model.listening_core.evaluation_cache import EvaluationCacheEntry
+from utils.config import settings
+from utils.db import engine
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+
+def normalize_answer_text(text: str) -> str:
+    """
+    Normalize a player answer for cache lookups.
+
+    Case, Unicode form and whitespace are folded; accents and punctuation are kept
+    because they can change what the grader sees.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class EvaluationCache:
+    """Two-tier (memory LRU + database) cache of structured LLM evaluations."""
+
+    def __init__(
+        self,
+        max_entries: int = 5000,
+        enabled: bool = True,
+        prompts_dir: Path = PROMPTS_DIR
+    ):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.prompts_dir = prompts_dir
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._fingerprints: dict[str, tuple[tuple, str]] = {}
+        self._lock = threading.Lock()
+
+    def _prompt_files(self, evaluation_type: str) -> list[Path]:
+        evaluation_dir = self.prompts_dir / "evaluation" / evaluation_type
+        return [evaluation_dir / "system.txt", evaluation_dir / "user.txt"]
+
+    def prompt_fingerprint(self, evaluation_type: str) -> str:
+        """
+        Hash of the evaluation prompt files, recomputed only when their mtime or size
+        changes. A change drops stale entries for that evaluation type.
+        """
+        files = self._prompt_files(evaluation_type)
+        signature = tuple(
+            (stat.st_mtime_ns, stat.st_size)
+            for stat in (path.stat() for path in files)
+        )
+
+        with self._lock:
+            cached = self._fingerprints.get(evaluation_type)
+            if cached and cached[0] == signature:
+                return cached[1]
+
+        digest = hashlib.sha256()
+        for path in files:
+            digest.update(path.read_bytes())
+        fingerprint = digest.hexdigest()
+
+        with self._lock:
+            previous = self._fingerprints.get(evaluation_type)
+            self._fingerprints[evaluation_type] = (signature, fingerprint)
+
+        if previous and previous[1] != fingerprint:
+            logger.info(f"Evaluation prompt '{evaluation_type}' changed; purging cached evaluations")
+            self.purge_stale(evaluation_type, fingerprint)
+
+        return fingerprint
+
+    def build_key(
+        self,
+        evaluation_type: str,
+        model_name: str,
+        temperature: float,
+        reference: Any,
+        answer: Any
+    ) -> Optional[str]:
+        """Cache key for an evaluation, or None when the cache is disabled (no prompt files are read)."""
+        if not self.enabled:
+            return None
+
+        payload = json.dumps(
+            [evaluation_type, self.prompt_fingerprint(evaluation_type), model_name, temperature, reference, answer],
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _remember(self, cache_key: str, entry: dict) -> None:
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(
+        self,
+        evaluation_type: str,
+        cache_key: Optional[str],
+        response_schema: Type[ResponseT]
+    ) -> Optional[ResponseT]:
+        """Return the cached evaluation, or None on a miss (or if the cache is unavailable)."""
+        if not self.enabled or cache_key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+
+        if entry is not None:
+            metrics.increment("llm_evaluation_cache_requests_total", evaluation_type=evaluation_type, result="memory_hit")
+            return response_schema.model_validate(entry["response"])
+
+        try:
+            with Session(engine) as db_session:
+                row = db_session.get(EvaluationCacheEntry, cache_key)
+                response = dict(row.response) if row else None
+        except Exception as err:
+            logger.warning(f"Evaluation cache lookup failed: {err}")
+            response = None
+
+        if response is None:
+            metrics.increment("llm_evaluation_cache_requests_total", evaluation_type=evaluation_type, result="miss")
+            return None
+
+        self._remember(cache_key, {"evaluation_type": evaluation_type, "response": response})
+        metrics.increment("llm_evaluation_cache_requests_total", evaluation_type=evaluation_type, result="db_hit")
+        return response_schema.model_validate(response)
+
+    def set(self, evaluation_type: str, cache_key: Optional[str], model_name: str, evaluation: BaseModel) -> None:
+        """Store an evaluation in both tiers. Failures are logged, never raised."""
+        if not self.enabled or cache_key is None:
+            return
+
+        response = evaluation.model_dump(mode="json")
+        self._remember(cache_key, {"evaluation_type": evaluation_type, "response": response})
+
+        try:
+            with Session(engine) as db_session:
+                db_session.add(EvaluationCacheEntry(
+                    cache_key=cache_key,
+                    evaluation_type=evaluation_type,
+                    prompt_fingerprint=self.prompt_fingerprint(evaluation_type),
+                    model_name=model_name,
+                    response=response
+                ))
+                db_session.commit()
+        except IntegrityError:
+            pass  # Another request stored the same evaluation first
+        except Exception as err:
+            logger.warning(f"Evaluation cache write failed: {err}")
+
+    def purge_stale(self, evaluation_type: str, current_fingerprint: str) -> None:
+        with self._lock:
+            stale_keys = [
+                key for key, entry in self._entries.items()
+                if entry["evaluation_type"] == evaluation_type
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+
+        try:
+            with Session(engine) as db_session:
+                db_session.exec(
+                    delete(EvaluationCacheEntry).where(
+                        EvaluationCacheEntry.evaluation_type == evaluation_type,
+                        EvaluationCacheEntry.prompt_fingerprint != current_fingerprint
+                    )
+                )
+                db_session.commit()
+        except Exception as err:
+            logger.warning(f"Could not purge stale '{evaluation_type}' evaluations: {err}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+evaluation_cache = EvaluationCache(
+    max_entries=settings.EVALUATION_CACHE_MAX_ENTRIES,
+    enabled=settings.EVALUATION_CACHE_ENABLED,
+)
@@ -0,0 +1,185 @@
+"""
+Offline stand-ins for LLMClient, selected with LLM_BACKEND.
+
+- "fake": replays recorded structured responses per response schema, with
+  simulated latency and failures. An exact recording of the same prompt is
+  preferred; otherwise a random recording for the schema is used, and as a
+  last resort a placeholder instance is built from the schema itself.
+- "record": calls OpenAI as usual and saves every response for later replay.
+"""
+
+import logging
+import time
+import types
+import typing
+from typing import Any, Type
+
+from annotated_types import Ge, Le
+from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel
+
+from utils.config import settings
+from utils.errors import APIException
+from utils.fake_backends import (
+    LatencyDistribution,
+    RecordingStore,
+    SimulatedConditions,
+    recording_key,
+)
+from utils.metrics import metrics
+from utils.usage import record_llm_call
+from .models import LLMClient
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_TEXT = "lorem ipsum"
+PLACEHOLDER_LIST_LENGTH = 3
+# Rough tokenizer-free estimate used for fake usage reporting
+CHARACTERS_PER_TOKEN = 4
+
+
+def _prompt_key(chat_template: ChatPromptTemplate, response_schema: Type[BaseModel], **kwargs) -> str:
+    messages = chat_template.format_messages(**kwargs)
+    return recording_key(response_schema.__name__, *(str(message.content) for message in messages))
+
+
+def _placeholder_value(annotation: Any, metadata: list) -> Any:
+    origin = typing.get_origin(annotation)
+
+    if origin in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _placeholder_value(args[0], metadata) if args else None
+
+    if origin in (list, typing.List):
+        (item_type,) = typing.get_args(annotation) or (str,)
+        return [_placeholder_value(item_type, []) for _ in range(PLACEHOLDER_LIST_LENGTH)]
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return placeholder_instance(annotation).model_dump()
+
+    if annotation is bool:
+        return False
+
+    if annotation in (int, float):
+        lower = next((item.ge for item in metadata if isinstance(item, Ge)), 0)
+        upper = next((item.le for item in metadata if isinstance(item, Le)), None)
+        return annotation(upper if upper is not None else max(lower, 1))
+
+    return PLACEHOLDER_TEXT
+
+
+def placeholder_instance(response_schema: Type[BaseModel]) -> BaseModel:
+    """Schema-shaped placeholder used when no recording exists (top of each 0-2 scale, filler text)."""
+    values = {
+        name: _placeholder_value(field.annotation, field.metadata)
+        for name, field in response_schema.model_fields.items()
+    }
+    return response_schema.model_validate(values)
+
+
+class FakeLLMClient:
+    """Drop-in replacement for LLMClient that never calls OpenAI."""
+
+    def __init__(
+        self,
+        model_name: str,
+        temperature: float,
+        store: RecordingStore,
+        conditions: SimulatedConditions
+    ):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.store = store
+        self.conditions = conditions
+
+    def execute_prompt(
+        self,
+        chat_template: ChatPromptTemplate,
+        response_schema: Type[BaseModel],
+        **kwargs
+    ) -> BaseModel:
+        schema_name = response_schema.__name__
+        started = time.perf_counter()
+
+        try:
+            messages = chat_template.format_messages(**kwargs)
+            key = _prompt_key(chat_template, response_schema, **kwargs)
+            self.conditions.apply(schema_name)
+        except Exception as e:
+            self._record(chat_template, started, 0, 0, succeeded=False)
+            raise APIException(f"Error en la ejecución del LLM: {str(e)}")
+
+        recording = self.store.find("llm", schema_name, key, "json")
+        source = "exact"
+
+        if recording is None:
+            recordings = self.store.list("llm", schema_name, "json")
+            recording = self.conditions.choice(recordings) if recordings else None
+            source = "replayed"
+
+        if recording is None:
+            source = "placeholder"
+            response = placeholder_instance(response_schema)
+        else:
+            response = response_schema.model_validate_json(recording.read_bytes())
+
+        metrics.increment("fake_llm_responses_total", schema=schema_name, source=source)
+        self._record(
+            chat_template,
+            started,
+            input_tokens=sum(len(str(message.content)) for message in messages) // CHARACTERS_PER_TOKEN,
+            output_tokens=len(response.model_dump_json()) // CHARACTERS_PER_TOKEN,
+            succeeded=True
+        )
+        return response
+
+    def _record(
+        self,
+        chat_template: ChatPromptTemplate,
+        started: float,
+        input_tokens: int,
+        output_tokens: int,
+        succeeded: bool
+    ) -> None:
+        """Report usage as the real client would, with token counts estimated from text length."""
+        record_llm_call(
+            model_name=self.model_name,
+            operation=(chat_template.metadata or {}).get("prompt_name", "unknown"),
+            latency_ms=(time.perf_counter() - started) * 1000,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            succeeded=succeeded
+        )
+
+
+class RecordingLLMClient(LLMClient):
+    """LLMClient that saves every structured response for the fake backend to replay."""
+
+    def __init__(self, *args, store: RecordingStore, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.store = store
+
+    def execute_prompt(
+        self,
+        chat_template: ChatPromptTemplate,
+        response_schema: Type[BaseModel],
+        **kwargs
+    ) -> BaseModel:
+        response = super().execute_prompt(chat_template, response_schema, **kwargs)
+
+        try:
+            key = _prompt_key(chat_template, response_schema, **kwargs)
+            self.store.save("llm", response_schema.__name__, key, "json", response.model_dump_json(indent=2).encode("utf-8"))
+        except Exception as err:
+            logger.warning(f"Could not record {response_schema.__name__} response: {err}")
+
+        return response
+
+
+def fake_llm_conditions() -> SimulatedConditions:
+    return SimulatedConditions(
+        backend="llm",
+        latency=LatencyDistribution.parse(settings.FAKE_LLM_LATENCY),
+        failure_rate=settings.FAKE_LLM_FAILURE_RATE,
+        seed=settings.FAKE_BACKEND_SEED
+    )
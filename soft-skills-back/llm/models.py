@@ -2,14 +2,27 @@
 LLM client module for executing prompts with LangChain and OpenAI.
 
 Handles LLM model configuration, execution, and structured response parsing.
+Clients are shared process-wide through `get_llm_client`, one per
+(model, temperature), all on a single pooled HTTP connection pool.
 """
 
+import logging
 import os
-from typing import Optional, Type
+import threading
+import time
+from typing import Dict, Optional, Tuple, Type
+
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel
+from utils.config import settings
 from utils.errors import APIException
+from utils.metrics import metrics
+from utils.usage import record_llm_call
+
+logger = logging.getLogger(__name__)
 
 
 class LLMClient:
@@ -19,7 +32,8 @@ class LLMClient:
         self, 
         model_name: str = "gpt-4o-mini",
         temperature: float = 0.7,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.Client] = None
     ):
         """
         Initialize the LLM client.
@@ -28,6 +42,8 @@ class LLMClient:
             model_name: OpenAI model name (default: gpt-4o-mini).
             temperature: Model temperature (default: 0.7).
             api_key: OpenAI API key. If None, uses OPENAI_API_KEY env var.
+            http_client: Shared HTTP client for connection pooling. If None, the
+                OpenAI SDK creates its own.
             
         Raises:
             ValueError: If API key is not provided and not found in environment.
@@ -47,8 +63,28 @@ class LLMClient:
         self.llm = ChatOpenAI(
             model=model_name,
             temperature=temperature,
-            api_key=api_key
+            api_key=api_key,
+            http_client=http_client
         )
+        self._structured_runnables: Dict[Type[BaseModel], Runnable] = {}
+        self._lock = threading.Lock()
+    
+    def get_structured_runnable(self, response_schema: Type[BaseModel]) -> Runnable:
+        """
+        Return the structured-output runnable for a schema, building it once per client.
+        It is built with include_raw so token usage can be read from the raw message.
+        """
+        runnable = self._structured_runnables.get(response_schema)
+        if runnable is not None:
+            return runnable
+        
+        with self._lock:
+            runnable = self._structured_runnables.get(response_schema)
+            if runnable is None:
+                runnable = self.llm.with_structured_output(response_schema, include_raw=True)
+                self._structured_runnables[response_schema] = runnable
+        
+        return runnable
     
     def execute_prompt(
         self, 
@@ -70,16 +106,149 @@ class LLMClient:
         Raises:
             APIException: If LLM execution fails.
         """
+        prompt_info = chat_template.metadata or {}
+        if "prompt_version" in prompt_info:
+            metrics.increment(
+                "llm_prompt_calls_total",
+                prompt=prompt_info.get("prompt_name", "unknown"),
+                version=prompt_info["prompt_version"]
+            )
+            logger.debug(f"Prompt {prompt_info.get('prompt_name')} served version {prompt_info['prompt_version']}")
+        
+        operation = prompt_info.get("prompt_name", response_schema.__name__)
+        usage = {}
+        succeeded = False
+        started = time.perf_counter()
+        
         try:
-            structured_llm = self.llm.with_structured_output(response_schema)
+            structured_llm = self.get_structured_runnable(response_schema)
             
             formatted_messages = chat_template.format_messages(**kwargs)
             
-            response = structured_llm.invoke(formatted_messages)
+            result = structured_llm.invoke(formatted_messages)
+            usage = getattr(result.get("raw"), "usage_metadata", None) or {}
+            
+            if result.get("parsing_error") is not None:
+                raise result["parsing_error"]
             
+            response = result.get("parsed")
+            if response is None:
+                raise ValueError("El LLM no devolvió una respuesta estructurada")
+            
+            succeeded = True
             return response
             
         except Exception as e:
             raise APIException(
                 f"Error en la ejecución del LLM: {str(e)}"
-            )
\ No newline at end of file
+            )
+        
+        finally:
+            record_llm_call(
+                model_name=self.model_name,
+                operation=operation,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                input_tokens=usage.get("input_tokens", 0),
+                output_tokens=usage.get("output_tokens", 0),
+                succeeded=succeeded
+            )
+
+
+class LLMClientRegistry:
+    """Process-wide LLMClient instances keyed by (model, temperature), sharing one connection pool."""
+    
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        timeout_seconds: float = 60.0,
+        backend: str = "openai"
+    ):
+        self.backend = backend
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.timeout_seconds = timeout_seconds
+        self._clients: Dict[Tuple[str, float], LLMClient] = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._fake_conditions = None
+        self._lock = threading.Lock()
+    
+    def _create_client(self, model_name: str, temperature: float) -> LLMClient:
+        """Build a client for the configured backend: openai, fake (replay) or record."""
+        if self.backend == "openai":
+            return LLMClient(
+                model_name=model_name,
+                temperature=temperature,
+                http_client=self._get_http_client()
+            )
+        
+        from llm.fake_client import FakeLLMClient, RecordingLLMClient, fake_llm_conditions
+        from utils.fake_backends import default_recordings_store
+        
+        if self.backend == "fake":
+            if self._fake_conditions is None:
+                self._fake_conditions = fake_llm_conditions()
+            return FakeLLMClient(model_name, temperature, default_recordings_store(), self._fake_conditions)
+        
+        if self.backend == "record":
+            return RecordingLLMClient(
+                model_name=model_name,
+                temperature=temperature,
+                http_client=self._get_http_client(),
+                store=default_recordings_store()
+            )
+        
+        raise ValueError(f"Unsupported LLM backend: {self.backend}")
+    
+    def _get_http_client(self) -> httpx.Client:
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections
+                ),
+                timeout=self.timeout_seconds
+            )
+        return self._http_client
+    
+    def get(self, model_name: str, temperature: float) -> LLMClient:
+        """
+        Return the shared client for a model and temperature, creating it on first use.
+        
+        Raises:
+            ValueError: If the OpenAI API key is not configured (nothing is cached),
+                or LLM_BACKEND is not one of openai, fake, record.
+        """
+        key = (model_name, float(temperature))
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create_client(model_name, temperature)
+                self._clients[key] = client
+        
+        return client
+    
+    def close(self) -> None:
+        """Drop every client and close the shared connection pool."""
+        with self._lock:
+            self._clients.clear()
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+
+
+llm_clients = LLMClientRegistry(
+    max_connections=settings.LLM_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+    timeout_seconds=settings.LLM_REQUEST_TIMEOUT_SECONDS,
+    backend=settings.LLM_BACKEND,
+)
+
+
+def get_llm_client(model_name: str = "gpt-4o-mini", temperature: float = 0.7) -> LLMClient:
+    """Shared LLMClient for the given model settings."""
+    return llm_clients.get(model_name, temperature)
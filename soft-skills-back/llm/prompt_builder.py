@@ -2,12 +2,33 @@
 Prompt builder module for constructing chat prompts with LangChain.
 
 Handles building of system and user messages using ChatPromptTemplate.
+Built templates are cached per (play_mode, difficulty, version) and per
+evaluation type, and rebuilt when any of their source files (or the manifest)
+changes on disk, so prompt edits and version switches apply without a restart.
 """
 
+import hashlib
+import logging
+import random
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 from enums.listening_game import PlayMode, Difficulty
+from utils.metrics import metrics
 from .prompt_loader import PromptLoader
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROMPT_VERSION = "v1"
+
+FileSignature = Tuple[Tuple[int, int], ...]
+
+
+def _file_signature(paths: List[Path]) -> FileSignature:
+    """(mtime, size) of each file; raises FileNotFoundError if one is missing."""
+    return tuple((stat.st_mtime_ns, stat.st_size) for stat in (path.stat() for path in paths))
+
 
 class PromptBuilder:
     """Builds chat prompts using LangChain ChatPromptTemplate."""
@@ -20,11 +41,67 @@ class PromptBuilder:
             prompt_loader: Instance of PromptLoader for loading prompts.
         """
         self.prompt_loader = prompt_loader
+        self._templates: Dict[tuple, Tuple[FileSignature, ChatPromptTemplate]] = {}
+        self._manifest: Optional[Tuple[FileSignature, Dict]] = None
+        self._lock = threading.Lock()
+    
+    def _cached(self, key: tuple, paths: List[Path]) -> Tuple[FileSignature, Optional[ChatPromptTemplate]]:
+        signature = _file_signature(paths)
+        
+        with self._lock:
+            entry = self._templates.get(key)
+        
+        if entry and entry[0] == signature:
+            metrics.increment("prompt_template_cache_requests_total", result="hit")
+            return signature, entry[1]
+        
+        metrics.increment("prompt_template_cache_requests_total", result="reload" if entry else "miss")
+        return signature, None
+    
+    def _store(self, key: tuple, signature: FileSignature, template: ChatPromptTemplate) -> ChatPromptTemplate:
+        with self._lock:
+            self._templates[key] = (signature, template)
+        return template
+    
+    def get_manifest(self) -> Dict:
+        """manifest.yml, re-read only when the file changes."""
+        manifest_path = self.prompt_loader.manifest_path()
+        signature = _file_signature([manifest_path])
+        
+        with self._lock:
+            if self._manifest and self._manifest[0] == signature:
+                return self._manifest[1]
+        
+        manifest = self.prompt_loader.load_manifest() or {}
+        with self._lock:
+            self._manifest = (signature, manifest)
+        return manifest
+    
+    def resolve_version(self, play_mode: PlayMode, difficulty: Difficulty) -> str:
+        """
+        Prompt version for a play mode and difficulty, from the manifest.
+        
+        An entry is either a version name ("v2") or a mapping of version to weight
+        ({v1: 80, v2: 20}) for A/B tests; missing entries use defaults.version.
+        """
+        manifest = self.get_manifest()
+        default_version = (manifest.get("defaults") or {}).get("version", DEFAULT_PROMPT_VERSION)
+        entry = (manifest.get(play_mode.value) or {}).get(difficulty.value)
+        
+        if isinstance(entry, dict) and entry:
+            versions = list(entry.keys())
+            weights = [max(float(weight), 0.0) for weight in entry.values()]
+            if sum(weights) > 0:
+                return str(random.choices(versions, weights=weights)[0])
+            return str(versions[0])
+        
+        return str(entry or default_version)
     
     def build_chat_prompt(
         self,
         play_mode: PlayMode,
-        difficulty: Difficulty
+        difficulty: Difficulty,
+        version: Optional[str] = None
     ) -> ChatPromptTemplate:
         """
         Build a chat prompt template with system and user messages.
@@ -32,14 +109,32 @@ class PromptBuilder:
         Args:
             play_mode: The play mode for the challenge.
             difficulty: The difficulty level.
+            version: Prompt version; resolved from the manifest when None.
             
         Returns:
-            ChatPromptTemplate ready for LLM execution.
+            ChatPromptTemplate ready for LLM execution. Its metadata carries
+            the prompt name and the version that was served.
         """
+        version = version or self.resolve_version(play_mode, difficulty)
+        key = (play_mode.value, difficulty.value, version)
+        paths = [
+            self.prompt_loader.system_base_path(),
+            self.prompt_loader.mode_prompt_path(play_mode, difficulty, version)
+        ]
+        
+        try:
+            signature, template = self._cached(key, paths)
+        except FileNotFoundError:
+            # Let the loader raise its descriptive error
+            signature, template = (), None
+        
+        if template is not None:
+            return template
+        
         system_prompt = self.prompt_loader.load_system_base()
         system_prompt = self.prompt_loader.normalize_tokens(system_prompt)
         
-        user_prompt = self.prompt_loader.load_mode_prompt(play_mode, difficulty)
+        user_prompt = self.prompt_loader.load_mode_prompt(play_mode, difficulty, version)
         user_prompt = self.prompt_loader.normalize_tokens(user_prompt)
         
         system_template = SystemMessagePromptTemplate.from_template(system_prompt)
@@ -49,8 +144,54 @@ class PromptBuilder:
             system_template,
             user_template
         ])
+        chat_template.metadata = {
+            "prompt_name": f"{play_mode.value}/{difficulty.value}",
+            "prompt_version": version
+        }
         
-        return chat_template
+        return self._store(key, signature, chat_template)
+    
+    def build_batch_chat_prompt(
+        self,
+        play_mode: PlayMode,
+        difficulty: Difficulty,
+        version: Optional[str] = None
+    ) -> ChatPromptTemplate:
+        """
+        Build the chat prompt for generating several challenges in one call:
+        the regular system and mode messages followed by the batch instruction,
+        which takes a {challenge_count} variable. The system prompt is paid once
+        for the whole batch.
+        """
+        version = version or self.resolve_version(play_mode, difficulty)
+        key = ("batch", play_mode.value, difficulty.value, version)
+        paths = [
+            self.prompt_loader.system_base_path(),
+            self.prompt_loader.mode_prompt_path(play_mode, difficulty, version),
+            self.prompt_loader.batch_instruction_path()
+        ]
+        
+        try:
+            signature, template = self._cached(key, paths)
+        except FileNotFoundError:
+            signature, template = (), None
+        
+        if template is not None:
+            return template
+        
+        single_template = self.build_chat_prompt(play_mode, difficulty, version)
+        batch_instruction = self.prompt_loader.normalize_tokens(self.prompt_loader.load_batch_instruction())
+        
+        batch_template = ChatPromptTemplate.from_messages([
+            *single_template.messages,
+            HumanMessagePromptTemplate.from_template(batch_instruction)
+        ])
+        batch_template.metadata = {
+            "prompt_name": f"{play_mode.value}/{difficulty.value}/batch",
+            "prompt_version": version
+        }
+        
+        return self._store(key, signature, batch_template)
     
     def build_evaluation_prompt(self, evaluation_type: str) -> ChatPromptTemplate:
         """
@@ -60,8 +201,19 @@ class PromptBuilder:
             evaluation_type: The evaluation type (e.g., "clarify").
             
         Returns:
-            ChatPromptTemplate ready for LLM execution.
+            ChatPromptTemplate ready for LLM execution. Evaluation prompts are not
+            versioned in the manifest, so the served version is a content hash.
         """
+        key = ("evaluation", evaluation_type)
+        
+        try:
+            signature, template = self._cached(key, self.prompt_loader.evaluation_prompt_paths(evaluation_type))
+        except FileNotFoundError:
+            signature, template = (), None
+        
+        if template is not None:
+            return template
+        
         system_prompt = self.prompt_loader.load_evaluation_system_prompt(evaluation_type)
         user_prompt = self.prompt_loader.load_evaluation_user_prompt(evaluation_type)
         
@@ -72,6 +224,58 @@ class PromptBuilder:
             generator_prompt,
             user_template
         ])
+        content_hash = hashlib.sha256(f"{system_prompt}\n{user_prompt}".encode("utf-8")).hexdigest()[:12]
+        generator_chat_prompt.metadata = {
+            "prompt_name": f"evaluation/{evaluation_type}",
+            "prompt_version": f"sha256:{content_hash}"
+        }
         
-        return generator_chat_prompt
+        return self._store(key, signature, generator_chat_prompt)
     
+    def warm(self) -> int:
+        """
+        Build every template the manifest and the evaluation directory reference.
+        Returns how many were built; broken prompts are logged and skipped.
+        """
+        manifest = self.get_manifest()
+        built = 0
+        
+        for play_mode in PlayMode:
+            for difficulty in Difficulty:
+                entry = (manifest.get(play_mode.value) or {}).get(difficulty.value)
+                versions = list(entry.keys()) if isinstance(entry, dict) else [self.resolve_version(play_mode, difficulty)]
+                
+                for version in versions:
+                    try:
+                        self.build_chat_prompt(play_mode, difficulty, str(version))
+                        built += 1
+                    except Exception as err:
+                        logger.warning(f"Could not warm prompt {play_mode.value}/{difficulty.value}/{version}: {err}")
+        
+        for evaluation_type in self.prompt_loader.list_evaluation_types():
+            try:
+                self.build_evaluation_prompt(evaluation_type)
+                built += 1
+            except Exception as err:
+                logger.warning(f"Could not warm evaluation prompt {evaluation_type}: {err}")
+        
+        return built
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self._manifest = None
+
+
+_shared_builder: Optional[PromptBuilder] = None
+_shared_builder_lock = threading.Lock()
+
+
+def get_prompt_builder() -> PromptBuilder:
+    """Process-wide PromptBuilder over the default prompts directory."""
+    global _shared_builder
+    if _shared_builder is None:
+        with _shared_builder_lock:
+            if _shared_builder is None:
+                _shared_builder = PromptBuilder(PromptLoader())
+    return _shared_builder
@@ -7,7 +7,7 @@ Handles loading of manifest.yml, system base prompts, and mode-specific prompts.
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from enums.listening_game import PlayMode, Difficulty, AudioLength
 from enums.common.language import Language
 
@@ -31,6 +31,41 @@ class PromptLoader:
         if not self.prompts_dir.exists():
             raise FileNotFoundError(f"Prompts directory not found: {self.prompts_dir}")
     
+    def manifest_path(self) -> Path:
+        return self.prompts_dir / "manifest.yml"
+    
+    def system_base_path(self) -> Path:
+        return self.prompts_dir / "base" / "system.txt"
+    
+    def batch_instruction_path(self) -> Path:
+        return self.prompts_dir / "base" / "batch.txt"
+    
+    def mode_prompt_path(self, play_mode: PlayMode, difficulty: Difficulty, version: str = "v1") -> Path:
+        """Path of the mode prompt file for a play mode, difficulty and version."""
+        difficulty_map = {
+            Difficulty.easy: "easy",
+            Difficulty.intermediate: "intermediate", 
+            Difficulty.hard: "hard"
+        }
+        
+        difficulty_dir = difficulty_map.get(difficulty)
+        if not difficulty_dir:
+            raise ValueError(f"Unsupported difficulty: {difficulty}")
+        
+        return self.prompts_dir / play_mode.value / difficulty_dir / f"{version}.txt"
+    
+    def evaluation_prompt_paths(self, evaluation_type: str) -> List[Path]:
+        """System and user prompt paths for an evaluation type."""
+        evaluation_dir = self.prompts_dir / "evaluation" / evaluation_type
+        return [evaluation_dir / "system.txt", evaluation_dir / "user.txt"]
+    
+    def list_evaluation_types(self) -> List[str]:
+        """Evaluation types that have a prompt directory."""
+        evaluation_root = self.prompts_dir / "evaluation"
+        if not evaluation_root.exists():
+            return []
+        return sorted(path.name for path in evaluation_root.iterdir() if path.is_dir())
+    
     def load_manifest(self) -> Dict:
         """
         Load the manifest.yml file.
@@ -42,7 +77,7 @@ class PromptLoader:
             FileNotFoundError: If manifest.yml doesn't exist.
             yaml.YAMLError: If manifest.yml is invalid.
         """
-        manifest_path = self.prompts_dir / "manifest.yml"
+        manifest_path = self.manifest_path()
         
         if not manifest_path.exists():
             raise FileNotFoundError(f"Manifest file not found: {manifest_path}")
@@ -63,7 +98,7 @@ class PromptLoader:
         Raises:
             FileNotFoundError: If system.txt doesn't exist.
         """
-        system_path = self.prompts_dir / "base" / "system.txt"
+        system_path = self.system_base_path()
         
         if not system_path.exists():
             raise FileNotFoundError(f"System base prompt not found: {system_path}")
@@ -73,6 +108,20 @@ class PromptLoader:
         
         return content
     
+    def load_batch_instruction(self) -> str:
+        """
+        Load the instruction appended to a mode prompt to request several challenges at once.
+        
+        Raises:
+            FileNotFoundError: If batch.txt doesn't exist.
+        """
+        batch_path = self.batch_instruction_path()
+        
+        if not batch_path.exists():
+            raise FileNotFoundError(f"Batch instruction prompt not found: {batch_path}")
+        
+        with open(batch_path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
     
     def load_mode_prompt(self, play_mode: PlayMode, difficulty: Difficulty, version: str = "v1") -> str:
         """
@@ -89,17 +138,7 @@ class PromptLoader:
         Raises:
             FileNotFoundError: If the prompt file doesn't exist.
         """
-        difficulty_map = {
-            Difficulty.easy: "easy",
-            Difficulty.intermediate: "intermediate", 
-            Difficulty.hard: "hard"
-        }
-        
-        difficulty_dir = difficulty_map.get(difficulty)
-        if not difficulty_dir:
-            raise ValueError(f"Unsupported difficulty: {difficulty}")
-        
-        prompt_path = self.prompts_dir / play_mode.value / difficulty_dir / f"{version}.txt"
+        prompt_path = self.mode_prompt_path(play_mode, difficulty, version)
         
         if not prompt_path.exists():
             raise FileNotFoundError(f"Mode prompt not found: {prompt_path}")
@@ -139,7 +178,7 @@ class PromptLoader:
         Returns:
             System prompt as string.
         """
-        system_path = self.prompts_dir / "evaluation" / evaluation_type / "system.txt"
+        system_path = self.evaluation_prompt_paths(evaluation_type)[0]
         
         if not system_path.exists():
             raise FileNotFoundError(f"Evaluation system prompt not found: {system_path}")
@@ -157,7 +196,7 @@ class PromptLoader:
         Returns:
             User prompt as string.
         """
-        user_path = self.prompts_dir / "evaluation" / evaluation_type / "user.txt"
+        user_path = self.evaluation_prompt_paths(evaluation_type)[1]
         
         if not user_path.exists():
             raise FileNotFoundError(f"Evaluation user prompt not found: {user_path}")
@@ -2,7 +2,7 @@
 Pydantic schemas for LLM structured output.
 """
 
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -40,6 +40,31 @@ class ClarifyChallenge(BaseModel):
     possible_questions: List[str]
 
 
+class FocusChallengeBatch(BaseModel):
+    """Several focus challenges generated in one request."""
+    challenges: List[FocusChallenge]
+
+
+class ClozeChallengeBatch(BaseModel):
+    """Several cloze challenges generated in one request."""
+    challenges: List[ClozeChallenge]
+
+
+class ParaphraseChallengeBatch(BaseModel):
+    """Several paraphrase challenges generated in one request."""
+    challenges: List[ParaphraseChallenge]
+
+
+class SummarizeChallengeBatch(BaseModel):
+    """Several summarize challenges generated in one request."""
+    challenges: List[SummarizeChallenge]
+
+
+class ClarifyChallengeBatch(BaseModel):
+    """Several clarify challenges generated in one request."""
+    challenges: List[ClarifyChallenge]
+
+
 class ClarifyQuestionEvaluation(BaseModel):
     """Evaluation for a single clarifying question."""
     score_0_2: int = Field(ge=0, le=2, description="Score: 0=poor, 1=okay, 2=excellent")
@@ -67,4 +92,19 @@ class ParaphraseEvaluationResponse(BaseModel):
     criterion_3_0_2: int = Field(ge=0, le=2, description="Score for third rubric criterion: 0=poor, 1=okay, 2=excellent")
     score_0_2: int = Field(ge=0, le=2, description="Average score: 0=poor, 1=okay, 2=excellent")
     reason: str = Field(description="Brief reason for the overall score (<= 15 words)")
-    flags: List[str] = Field(default_factory=list, description="Optional flags indicating issues")
\ No newline at end of file
+    flags: List[str] = Field(default_factory=list, description="Optional flags indicating issues")
+
+
+class BatchEvaluationItem(BaseModel):
+    """Evaluation of one answer inside a batch grading request."""
+    item_id: str = Field(description="item_id of the answer being graded, copied from the input")
+    score_0_2: Optional[int] = Field(default=None, ge=0, le=2, description="Overall score for summarize and paraphrase items")
+    criterion_scores: List[int] = Field(default_factory=list, description="Paraphrase only: one 0-2 score per rubric criterion, in order")
+    per_question: List[ClarifyQuestionEvaluation] = Field(default_factory=list, description="Clarify only: one evaluation per student question, in order")
+    reason: str = Field(default="", description="Brief reason for the score (<= 15 words)")
+    flags: List[str] = Field(default_factory=list, description="Optional flags indicating issues")
+
+
+class BatchEvaluationResponse(BaseModel):
+    """LLM response schema for grading several open-ended answers in one request."""
+    items: List[BatchEvaluationItem]
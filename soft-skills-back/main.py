@@ -6,6 +6,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from router import api as api_routes
+from llm.models import llm_clients
+from llm.prompt_builder import get_prompt_builder
+from service.listening_core.prefetch_worker import PrefetchWorker
+from service.listening_core.grading_worker import SubmissionGrader
 from utils.config import settings
 from utils.logger import logger_config
 
@@ -24,10 +28,30 @@ async def lifespan(app: FastAPI):
 
     logger.info("startup: triggered")
 
+    try:
+        warmed = get_prompt_builder().warm()
+        logger.info(f"startup: warmed {warmed} prompt templates")
+    except Exception as err:
+        logger.warning(f"startup: prompt warm-up failed: {err}")
+
+    background_workers = []
+    if settings.PREFETCH_WORKER_MODE == "inline":
+        background_workers.append(PrefetchWorker())
+    if settings.GRADER_WORKER_MODE == "inline":
+        background_workers.append(SubmissionGrader())
+
+    for worker in background_workers:
+        worker.start()
+
     yield
 
     logger.info("shutdown: triggered")
 
+    for worker in background_workers:
+        worker.stop()
+
+    llm_clients.close()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -8,7 +8,7 @@ from .user import User
 from .pomodoro_preferences import PomodoroPreferences
 from .self_evaluation import SelfEvaluation
 
-from .listening_core import GameSession, GameSessionConfig, GameRound, Challenge, RoundSubmission
+from .listening_core import GameSession, GameSessionConfig, GameRound, Challenge, RoundSubmission, PrefetchJob, EvaluationCacheEntry, UsageRecord, SessionResultSnapshot, SubmissionIdempotencyRecord
 
 __all__ = [
     "LearningGoal",
@@ -24,5 +24,10 @@ __all__ = [
     "GameSessionConfig",
     "GameRound",
     "Challenge",
-    "RoundSubmission"
+    "RoundSubmission",
+    "PrefetchJob",
+    "EvaluationCacheEntry",
+    "UsageRecord",
+    "SessionResultSnapshot",
+    "SubmissionIdempotencyRecord"
 ]
\ No newline at end of file
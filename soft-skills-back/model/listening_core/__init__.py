@@ -3,11 +3,21 @@ from .game_session_config import GameSessionConfigBase, GameSessionConfig
 from .game_round import GameRoundBase, GameRound
 from .challenge import ChallengeBase, Challenge
 from .round_submission import RoundSubmissionBase, RoundSubmission
+from .prefetch_job import PrefetchJobBase, PrefetchJob
+from .evaluation_cache import EvaluationCacheEntry
+from .usage_record import UsageRecord
+from .session_result_snapshot import SessionResultSnapshot
+from .submission_idempotency import SubmissionIdempotencyRecord
 
 __all__ = [
     "GameSessionBase", "GameSession",
     "GameSessionConfigBase", "GameSessionConfig",
     "GameRoundBase", "GameRound",
     "ChallengeBase", "Challenge",
-    "RoundSubmissionBase", "RoundSubmission"
+    "RoundSubmissionBase", "RoundSubmission",
+    "PrefetchJobBase", "PrefetchJob",
+    "EvaluationCacheEntry",
+    "UsageRecord",
+    "SessionResultSnapshot",
+    "SubmissionIdempotencyRecord"
 ]
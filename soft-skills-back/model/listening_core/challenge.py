@@ -35,6 +35,18 @@ class Challenge(ChallengeBase, table=True):
         default_factory=dict,
         sa_column=Column(JSON)
     )
+    # Focus/cloze key normalized at generation time (see scoring.compile_answer_key)
+    answer_key: Optional[Dict[str, Any]] = Field(
+        default=None,
+        sa_column=Column(JSON)
+    )
+    # Voice the audio was synthesized with, reused when it is synthesized again; dialogues use per-speaker voices
+    audio_voice_id: Optional[str] = Field(default=None)
+    # Effect profile hash -> URL of the audio rendered with those effects (see utils.audio_render)
+    audio_variants: Optional[Dict[str, str]] = Field(
+        default=None,
+        sa_column=Column(JSON)
+    )
 
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc), 
@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+from typing import Dict, Any
+
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field, TIMESTAMP, Column, JSON
+
+
+class EvaluationCacheEntry(SQLModel, table=True):
+    """Cached LLM evaluation, keyed by a hash of everything that determines the result."""
+    __tablename__ = "listening_evaluation_cache"
+
+    cache_key: str = Field(primary_key=True, max_length=64)
+    evaluation_type: str
+    prompt_fingerprint: str = Field(max_length=64)
+    model_name: str
+
+    response: Dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=TIMESTAMP(timezone=True)
+    )
+
+    __table_args__ = (
+        Index("ix_listening_evaluation_cache_type_prompt", "evaluation_type", "prompt_fingerprint"),
+    )
@@ -1,8 +1,8 @@
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from sqlmodel import SQLModel, Field, TIMESTAMP, Relationship
-from sqlalchemy import Index, Column, String
-from typing import List
+from sqlalchemy import Index, Column, String, text
+from typing import List, Optional
 from enums.listening_game import GameStatus
 
 
@@ -10,7 +10,10 @@ class GameSessionBase(SQLModel):
     status: GameStatus = Field(default=GameStatus.pending)
     name: str
     current_round: int = Field(default=1)
+    # Running totals over attempted rounds, kept by service.listening_core.session_totals
     total_score: float = Field(default=0.0)
+    total_max_score: float = Field(default=0.0)
+    attempted_rounds: int = Field(default=0)
 
 
 class GameSession(GameSessionBase, table=True):
@@ -53,7 +56,31 @@ class GameSession(GameSessionBase, table=True):
         back_populates="game_session",
         sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete"}
     )
+
+    prefetch_jobs: List["PrefetchJob"] = Relationship(
+        back_populates="game_session",
+        sa_relationship_kwargs={"cascade": "all, delete"}
+    )
+
+    result_snapshot: Optional["SessionResultSnapshot"] = Relationship(
+        back_populates="game_session",
+        sa_relationship_kwargs={"cascade": "all, delete", "uselist": False}
+    )
+
+    idempotency_records: List["SubmissionIdempotencyRecord"] = Relationship(
+        back_populates="game_session",
+        sa_relationship_kwargs={"cascade": "all, delete"}
+    )
     
     __table_args__ = (
         Index("ix_listening_game_session_status_created", "status", "created_at"),
+        # Covers the list route: its ordering, keyset cursor and summary columns (INCLUDE on Postgres)
+        Index(
+            "ix_listening_game_session_user_list",
+            "user_id",
+            "status",
+            text("created_at DESC"),
+            text("game_session_id DESC"),
+            postgresql_include=["name", "current_round", "total_score", "total_max_score", "attempted_rounds"]
+        ),
     )
@@ -1,7 +1,7 @@
 from uuid import UUID
 from sqlmodel import SQLModel, Field, Column, JSON, Relationship
 
-from enums.listening_game import Difficulty, PromptType, PlayMode
+from enums.listening_game import Difficulty, PromptType, PlayMode, GradingMode
 from utils.listening_defaults import DEFAULT_RESPONSE_TIME_LIMITS, DEFAULT_AUDIO_EFFECTS
 from utils.listening_helpers import serialize_response_time_limits, serialize_audio_effects
 
@@ -30,6 +30,8 @@ class GameSessionConfigBase(SQLModel):
     
     reuse_existing_challenges: bool = Field(default=False)
 
+    grading_mode: GradingMode = Field(default=GradingMode.sync)
+
     response_time_limits: dict[str, int] = Field(
         default_factory=lambda: serialize_response_time_limits(
             DEFAULT_RESPONSE_TIME_LIMITS.get(Difficulty.easy)
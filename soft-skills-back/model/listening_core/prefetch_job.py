@@ -0,0 +1,56 @@
+from uuid import UUID, uuid4
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import Index, UniqueConstraint, Text
+from sqlmodel import SQLModel, Field, TIMESTAMP, Column, Relationship
+
+from enums.listening_game import PrefetchJobStatus
+
+
+class PrefetchJobBase(SQLModel):
+    """Base model for a round prefetch job."""
+    round_number: int
+    status: PrefetchJobStatus = Field(default=PrefetchJobStatus.queued)
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None, sa_column=Column(Text))
+
+
+class PrefetchJob(PrefetchJobBase, table=True):
+    __tablename__ = "listening_prefetch_job"
+
+    prefetch_job_id: UUID = Field(default_factory=uuid4, primary_key=True)
+
+    game_session_id: UUID = Field(
+        foreign_key="listening_game_session.game_session_id",
+        index=True
+    )
+    user_id: UUID = Field(
+        foreign_key="users.user_id",
+        index=True
+    )
+    worker_id: Optional[str] = Field(default=None)
+
+    enqueued_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=TIMESTAMP(timezone=True)
+    )
+    available_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=TIMESTAMP(timezone=True)
+    )
+    started_at: datetime | None = Field(
+        default=None,
+        sa_type=TIMESTAMP(timezone=True)
+    )
+    finished_at: datetime | None = Field(
+        default=None,
+        sa_type=TIMESTAMP(timezone=True)
+    )
+
+    game_session: "GameSession" = Relationship(back_populates="prefetch_jobs")
+
+    __table_args__ = (
+        UniqueConstraint("game_session_id", "round_number", name="uq_prefetch_job_per_round"),
+        Index("ix_listening_prefetch_job_status_available", "status", "available_at"),
+    )
@@ -2,10 +2,10 @@ from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import UniqueConstraint, Index, Text
 from sqlmodel import SQLModel, Field, TIMESTAMP, Column, JSON, Relationship
 
-from enums.listening_game import PlayMode, PromptType
+from enums.listening_game import PlayMode, PromptType, EvaluationStatus
 
 
 class RoundSubmissionBase(SQLModel):
@@ -16,6 +16,7 @@ class RoundSubmissionBase(SQLModel):
     feedback_short: Optional[str] = Field(default=None)
     client_elapsed_ms: Optional[int] = None
     idempotency_key: Optional[str] = Field(default=None)
+    evaluation_status: EvaluationStatus = Field(default=EvaluationStatus.evaluated)
 
 
 class RoundSubmission(RoundSubmissionBase, table=True):
@@ -46,11 +47,23 @@ class RoundSubmission(RoundSubmissionBase, table=True):
         sa_column=Column(JSON)
     )
 
+    evaluation_attempts: int = Field(default=0)
+    evaluation_error: Optional[str] = Field(default=None, sa_column=Column(Text))
+    evaluation_started_at: Optional[datetime] = Field(
+        default=None,
+        sa_type=TIMESTAMP(timezone=True)
+    )
+    evaluated_at: Optional[datetime] = Field(
+        default=None,
+        sa_type=TIMESTAMP(timezone=True)
+    )
+
     game_session: "GameSession" = Relationship(back_populates="submissions")
     game_round: "GameRound" = Relationship(back_populates="submissions")
 
     __table_args__ = (
         UniqueConstraint("game_round_id", name="uq_submission_per_round"),
         UniqueConstraint("game_round_id", "idempotency_key", name="uq_submission_idempotency"),
+        Index("ix_submission_evaluation_status", "evaluation_status", "submitted_at"),
     )
 
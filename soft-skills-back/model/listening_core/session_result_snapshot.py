@@ -0,0 +1,28 @@
+from uuid import UUID
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from sqlmodel import SQLModel, Field, TIMESTAMP, Column, JSON, Relationship
+
+
+class SessionResultSnapshot(SQLModel, table=True):
+    """
+    Results recap of a completed session, written once nothing is left to grade.
+    Kept apart from GameSession so the blob is not loaded with every session read.
+    """
+    __tablename__ = "listening_session_result_snapshot"
+
+    game_session_id: UUID = Field(
+        foreign_key="listening_game_session.game_session_id",
+        primary_key=True
+    )
+    version: int
+    etag: str
+    result: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=TIMESTAMP(timezone=True)
+    )
+
+    game_session: "GameSession" = Relationship(back_populates="result_snapshot")
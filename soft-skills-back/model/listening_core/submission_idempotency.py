@@ -0,0 +1,31 @@
+from uuid import UUID
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from sqlmodel import SQLModel, Field, TIMESTAMP, Column, JSON, Relationship
+
+
+class SubmissionIdempotencyRecord(SQLModel, table=True):
+    """
+    What a round submission's idempotency key was used for, so retries can be
+    answered with the original response without locking the round.
+    """
+    __tablename__ = "listening_submission_idempotency"
+
+    user_id: UUID = Field(foreign_key="users.user_id", primary_key=True)
+    idempotency_key: str = Field(primary_key=True, max_length=255)
+
+    game_session_id: UUID = Field(
+        foreign_key="listening_game_session.game_session_id",
+        index=True
+    )
+    round_number: int
+    request_hash: str = Field(max_length=64)
+    response: Dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=TIMESTAMP(timezone=True)
+    )
+
+    game_session: "GameSession" = Relationship(back_populates="idempotency_records")
@@ -0,0 +1,43 @@
+from uuid import UUID, uuid4
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field, TIMESTAMP
+
+from enums.listening_game import UsageProvider, PlayMode, PromptType, Difficulty
+
+
+class UsageRecord(SQLModel, table=True):
+    """
+    One paid LLM or TTS call. game_session_id is kept without a foreign key so
+    cost history survives session deletion.
+    """
+    __tablename__ = "listening_usage_record"
+
+    usage_record_id: UUID = Field(default_factory=uuid4, primary_key=True)
+    game_session_id: Optional[UUID] = Field(default=None)
+
+    provider: UsageProvider
+    operation: str # Prompt name ("focus/easy", "evaluation/summarize") or TTS operation
+    model_name: str
+
+    play_mode: Optional[PlayMode] = Field(default=None)
+    difficulty: Optional[Difficulty] = Field(default=None)
+    prompt_type: Optional[PromptType] = Field(default=None)
+
+    latency_ms: float = Field(default=0.0)
+    input_tokens: int = Field(default=0)
+    output_tokens: int = Field(default=0)
+    characters: int = Field(default=0)
+    estimated_cost_usd: float = Field(default=0.0)
+    succeeded: bool = Field(default=True)
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=TIMESTAMP(timezone=True)
+    )
+
+    __table_args__ = (
+        Index("ix_listening_usage_record_session", "game_session_id", "created_at"),
+    )
@@ -9,6 +9,8 @@ from router import (
   roadmap, 
   game_session,
   challenge,
+  audio,
+  metrics,
   self_evaluations
 )
 
@@ -70,6 +72,18 @@ api.include_router(
   tags=["Listening challenges"]
 )
 
+api.include_router(
+  audio.router,
+  prefix="/audio",
+  tags=["Listening audio files"]
+)
+
+api.include_router(
+  metrics.router,
+  prefix="/metrics",
+  tags=["Metrics"]
+)
+
 api.include_router(
   self_evaluations.router,
   prefix="/self-evaluations",
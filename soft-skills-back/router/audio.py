@@ -0,0 +1,122 @@
+import os
+import re
+from typing import Iterator, Optional, Tuple
+
+from fastapi import APIRouter, Header, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from utils.errors import APIException, Missing, raise_http_exception
+from utils.local_storage import LocalFileStorage
+from utils.storage import get_storage_client, infer_content_type
+
+router = APIRouter()
+
+STREAM_CHUNK_SIZE = 64 * 1024
+AUDIO_CACHE_CONTROL = "public, max-age=86400"
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _parse_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range `Range` header into an inclusive (start, end) pair.
+    Returns None when the range cannot be satisfied.
+    """
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+
+    start_str, end_str = match.groups()
+
+    if not start_str and not end_str:
+        return None
+
+    if not start_str:
+        suffix_length = int(end_str)
+        if suffix_length == 0:
+            return None
+        return max(0, file_size - suffix_length), file_size - 1
+
+    start = int(start_str)
+    end = int(end_str) if end_str else file_size - 1
+    end = min(end, file_size - 1)
+
+    if start > end or start >= file_size:
+        return None
+
+    return start, end
+
+
+def _iter_file_range(path: str, start: int, end: int) -> Iterator[bytes]:
+    """Read [start, end] with positional reads, without loading the file in memory."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        offset = start
+        while offset <= end:
+            chunk = os.pread(fd, min(STREAM_CHUNK_SIZE, end - offset + 1), offset)
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk
+    finally:
+        os.close(fd)
+
+
+@router.get(
+    "/{bucket_name}/{file_path:path}",
+    summary="Servir un archivo de audio almacenado localmente (con soporte de Range)",
+    status_code=status.HTTP_200_OK,
+)
+def get_audio_file(
+    bucket_name: str,
+    file_path: str,
+    range_header: Optional[str] = Header(default=None, alias="range"),
+):
+    try:
+        storage_client = get_storage_client()
+
+        if not isinstance(storage_client, LocalFileStorage):
+            raise Missing("El almacenamiento local de audio no está habilitado")
+
+        try:
+            path = storage_client.resolve_path(bucket_name, file_path)
+        except ValueError:
+            raise Missing(f"Archivo de audio {file_path} no encontrado")
+
+        if not path.is_file():
+            raise Missing(f"Archivo de audio {file_path} no encontrado")
+
+        media_type = infer_content_type(file_path)
+        file_size = path.stat().st_size
+
+        if not range_header:
+            return FileResponse(
+                path,
+                media_type=media_type,
+                headers={"Accept-Ranges": "bytes", "Cache-Control": AUDIO_CACHE_CONTROL},
+            )
+
+        byte_range = _parse_range(range_header, file_size)
+
+        if byte_range is None:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{file_size}"},
+            )
+
+        start, end = byte_range
+
+        return StreamingResponse(
+            _iter_file_range(str(path), start, end),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=media_type,
+            headers={
+                "Accept-Ranges": "bytes",
+                "Content-Range": f"bytes {start}-{end}/{file_size}",
+                "Content-Length": str(end - start + 1),
+                "Cache-Control": AUDIO_CACHE_CONTROL,
+            },
+        )
+
+    except APIException as err:
+        raise_http_exception(err)
@@ -5,6 +5,7 @@ from sqlmodel import Session
 
 from schema.listening_core.challenge import (
     GenerateChallenge, 
+    GenerateChallengeBatch,
     ChallengeResponse,
     ChallengeAudioResponse
 )
@@ -39,6 +40,28 @@ def generate_challenge(
         raise_http_exception(err)
 
 
+@router.post(
+    "/generate-batch",
+    response_model=ChallengeResponse,
+    summary="Generar varios desafíos del mismo tipo en una sola llamada al LLM",
+    status_code=status.HTTP_201_CREATED
+)
+def generate_challenge_batch(
+    request: GenerateChallengeBatch,
+    session: Session = Depends(get_session)
+):
+    try:
+        batch = challenge_service.generate_challenge_batch(request, session)
+        
+        return ChallengeResponse(
+            message=f"{len(batch.created)} desafíos generados correctamente",
+            data=batch
+        )
+        
+    except APIException as err:
+        raise_http_exception(err)
+
+
 @router.get(
     "/{challenge_id}/audio",
     response_model=ChallengeAudioResponse,
@@ -1,6 +1,7 @@
 from typing import Optional, Any
 from uuid import UUID
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from schema.listening_core.game_session import (
     GameSessionCreate, 
@@ -24,14 +25,16 @@ from schema.listening_core.game_round import (
 from schema.listening_core.audio_replay import (
     AudioReplayCounterResponse
 )
+from schema.listening_core.prefetch_job import PrefetchJobRead
 from enums.listening_game import GameRoundStatus
-from schema.listening_core.round_submission import AttemptSubmissionRequest, AttemptSubmissionResponse
+from schema.listening_core.round_submission import AttemptSubmissionRequest, AttemptSubmissionResponse, RoundGradingResponse
 from schema.token import TokenData
 from schema.base import BaseResponse
 from service.auth_service import decode_jwt_token
 from service.listening_core.game_session import GameSessionService
-from service.listening_core.game_round_prefetch import safe_prefetch_rounds
+from service.listening_core.session_events import load_session_state, stream_session_events
 from sqlmodel import Session
+from utils.audio_render import prerendered_variant_url
 from utils.db import get_session
 from utils.errors import APIException, raise_http_exception
 
@@ -39,6 +42,25 @@ router = APIRouter()
 
 game_service = GameSessionService()
 
+# Results can still change after completion (late grading, re-scoring), so clients
+# revalidate every time; an unchanged result costs a 304 without a body
+RESULT_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match list (or "*") against the current entity tag."""
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == f'"{etag}"':
+            return True
+
+    return False
+
 
 def _build_round_response(
     game_round: Any,
@@ -50,6 +72,7 @@ def _build_round_response(
     """Build CurrentRoundResponse from round data."""
     config_minimal = CurrentRoundConfig.model_validate(config)
     audio_url = challenge.audio_url if challenge else None
+    prerendered_url = prerendered_variant_url(challenge.audio_variants, config.audio_effects) if challenge else None
     
     filtered_metadata = None
     if challenge and game_round.play_mode:
@@ -73,7 +96,8 @@ def _build_round_response(
     
     return CurrentRoundResponse(
         round_id=game_round.game_round_id,
-        audio_url=audio_url,
+        audio_url=prerendered_url or audio_url,
+        audio_effects_applied=prerendered_url is not None,
         config=config_minimal,
         current_round=game_round.round_number,
         status=game_round.status,
@@ -97,22 +121,25 @@ def _build_round_response(
     response_model=GameSessionPaginatedResponse,
 )
 def list_game_sessions(
-    offset: int = Query(0, ge=0, description="Número de elementos a omitir"),
+    offset: int = Query(0, ge=0, description="Número de elementos a omitir (se ignora si se envía cursor)"),
     limit: int = Query(10, le=100, description="Número máximo de elementos a recuperar (máx. 100)"),
+    cursor: Optional[str] = Query(None, description="next_cursor de la página anterior"),
+    include_total: bool = Query(True, description="Incluir el total de sesiones (consulta adicional)"),
     token_data: TokenData = Depends(decode_jwt_token),
     session: Session = Depends(get_session)
 ):
     try:
-        game_session_summaries, total_count = game_service.list_game_sessions(
-            token_data.user_id, offset, limit, session
+        game_session_summaries, total_count, next_cursor = game_service.list_game_sessions(
+            token_data.user_id, offset, limit, session, cursor=cursor, include_total=include_total
         )
         
         return GameSessionPaginatedResponse(
             message="Sesiones de juego obtenidas correctamente",
             data=game_session_summaries,
             total=total_count,
-            offset=offset,
-            limit=limit
+            offset=0 if cursor else offset,
+            limit=limit,
+            next_cursor=next_cursor
         )
     
     except APIException as exc:
@@ -153,7 +180,6 @@ def create_game_session(
 )
 def start_game_session(
     session_id: UUID,
-    background_tasks: BackgroundTasks,
     token_data: TokenData = Depends(decode_jwt_token),
     session: Session = Depends(get_session)
 ):
@@ -161,7 +187,7 @@ def start_game_session(
         game_session, round_1, is_first_activation = game_service.start_game_session(session_id, token_data.user_id, session)
         
         if is_first_activation:
-            background_tasks.add_task(safe_prefetch_rounds, session_id, [1, 2])
+            game_service.prefetch_scheduler.schedule(session_id, token_data.user_id, session, include_current=True)
         
         round_summary = GameRoundReadSummary.model_validate(round_1)
         
@@ -211,6 +237,57 @@ def get_game_session(
         raise_http_exception(exc)
 
 
+@router.get(
+    "/{session_id}/prefetch-jobs",
+    summary="Obtener el estado de la preparación anticipada de rondas",
+    response_model=BaseResponse[list[PrefetchJobRead]],
+)
+def get_prefetch_jobs(
+    session_id: UUID,
+    token_data: TokenData = Depends(decode_jwt_token),
+    session: Session = Depends(get_session)
+):
+    try:
+        jobs = game_service.get_prefetch_jobs(session_id, token_data.user_id, session)
+
+        return BaseResponse(
+            message="Estado de preparación de rondas obtenido correctamente",
+            data=[PrefetchJobRead.model_validate(job) for job in jobs]
+        )
+
+    except APIException as exc:
+        raise_http_exception(exc)
+
+
+@router.get(
+    "/{session_id}/events",
+    summary="Recibir los cambios de estado de la sesión en tiempo real (Server-Sent Events)",
+    response_class=StreamingResponse,
+)
+def stream_game_session_events(
+    session_id: UUID,
+    token_data: TokenData = Depends(decode_jwt_token)
+):
+    """
+    Flujo `text/event-stream` con el estado completo de la sesión al conectar y luego un evento por cambio:
+
+    - `session_status`: `{status, current_round}`
+    - `round_status`: `{round_number, status, ready}`; `ready` indica que la ronda ya puede pedirse sin esperar su preparación
+    - `grading`: `{round_number, evaluation_status, score, is_correct}`
+    - `end`: la sesión terminó y no quedan respuestas por evaluar; el flujo se cierra
+    """
+    try:
+        initial_state = load_session_state(session_id, token_data.user_id)
+    except APIException as exc:
+        raise_http_exception(exc)
+
+    return StreamingResponse(
+        stream_session_events(session_id, token_data.user_id, initial_state),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.patch(
     "/{session_id}",
     summary="Actualizar nombre y/o estado de sesión de juego",
@@ -296,7 +373,6 @@ def delete_game_session(
 )
 def get_current_round(
     session_id: UUID,
-    background_tasks: BackgroundTasks,
     token_data: TokenData = Depends(decode_jwt_token),
     session: Session = Depends(get_session)
 ):
@@ -305,18 +381,10 @@ def get_current_round(
             game_session_id=session_id, user_id=token_data.user_id, session=session
         )
         
-        current_round_number = game_round.round_number
-        next_rounds = []
-        if current_round_number + 1 <= config.total_rounds:
-            next_rounds.append(current_round_number + 1)
-        if current_round_number + 2 <= config.total_rounds:
-            next_rounds.append(current_round_number + 2)
-        
-        if next_rounds:
-            background_tasks.add_task(safe_prefetch_rounds, session_id, next_rounds)
-        
         response_data = _build_round_response(game_round, challenge, config, game_session, session)
         
+        game_service.prefetch_scheduler.schedule(session_id, token_data.user_id, session)
+        
         return BaseResponse(
             message="Ronda actual obtenida correctamente",
             data=response_data
@@ -421,6 +489,36 @@ def submit_round_attempt(
         raise_http_exception(exc)
 
 
+@router.get(
+    "/{session_id}/rounds/{round_number}/evaluation",
+    summary="Consultar el estado de evaluación del intento de una ronda",
+    response_model=BaseResponse[RoundGradingResponse],
+)
+def get_round_grading(
+    session_id: UUID,
+    round_number: int,
+    token_data: TokenData = Depends(decode_jwt_token),
+    session: Session = Depends(get_session)
+):
+    try:
+        response_data = game_service.get_round_grading(
+            session_id=session_id,
+            round_number=round_number,
+            user_id=token_data.user_id,
+            session=session
+        )
+        
+        validated_data = RoundGradingResponse.model_validate(response_data)
+        
+        return BaseResponse(
+            message="Estado de evaluación obtenido correctamente",
+            data=validated_data
+        )
+    
+    except APIException as exc:
+        raise_http_exception(exc)
+
+
 @router.post(
     "/{session_id}/finish",
     summary="Finalizar una sesión de juego",
@@ -457,21 +555,35 @@ def finish_game_session(
 )
 def get_game_session_result(
     session_id: UUID,
+    if_none_match: Optional[str] = Header(default=None, alias="if-none-match"),
     token_data: TokenData = Depends(decode_jwt_token),
     session: Session = Depends(get_session)
 ):
     try:
-        response_data = game_service.get_completion_result(
+        response_data, etag = game_service.get_completion_result(
             session_id=session_id,
             user_id=token_data.user_id,
             db_session=session
         )
         
-        validated_data = SessionResultResponse.model_validate(response_data)
+        message = "Resultado de sesión de juego obtenido correctamente"
         
-        return BaseResponse(
-            message="Resultado de sesión de juego obtenido correctamente",
-            data=validated_data
+        if etag is None:
+            validated_data = SessionResultResponse.model_validate(response_data)
+            return JSONResponse(
+                content=BaseResponse(message=message, data=validated_data).model_dump(mode="json"),
+                headers={"Cache-Control": "no-store"}
+            )
+        
+        cache_headers = {"ETag": f'"{etag}"', "Cache-Control": RESULT_CACHE_CONTROL}
+        
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+        
+        # Snapshots are stored already serialized in the response shape
+        return JSONResponse(
+            content={"message": message, "data": response_data},
+            headers=cache_headers
         )
     
     except APIException as exc:
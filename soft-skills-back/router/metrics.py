@@ -0,0 +1,67 @@
+from typing import Any, Dict
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+
+from schema.base import BaseResponse
+from schema.listening_core.usage import SessionCostResponse
+from schema.token import TokenData
+from service.auth_service import get_current_admin_user
+from service.listening_core.prefetch_queue import PrefetchQueueService
+from service.listening_core.usage import UsageService
+from sqlmodel import Session
+from utils.db import get_session
+from utils.errors import APIException, raise_http_exception, handle_db_error
+from utils.metrics import metrics
+
+router = APIRouter()
+
+prefetch_queue = PrefetchQueueService()
+usage_service = UsageService()
+
+
+@router.get(
+    "",
+    summary="Obtener métricas de la instancia (contadores, latencias y cola de preparación)",
+    response_model=BaseResponse[Dict[str, Any]],
+)
+def get_metrics(
+    _: TokenData = Depends(get_current_admin_user),
+    session: Session = Depends(get_session)
+):
+    try:
+        try:
+            queue_stats = prefetch_queue.get_queue_stats(session)
+        except Exception as err:
+            handle_db_error(err, "get_queue_stats", error_type="query")
+
+        return BaseResponse(
+            message="Métricas obtenidas correctamente",
+            data={
+                **metrics.snapshot(),
+                "prefetch_queue": queue_stats
+            }
+        )
+
+    except APIException as exc:
+        raise_http_exception(exc)
+
+
+@router.get(
+    "/sessions/{session_id}/cost",
+    summary="Obtener el costo estimado de LLM y TTS de una sesión de juego",
+    response_model=BaseResponse[SessionCostResponse],
+)
+def get_session_cost(
+    session_id: UUID,
+    _: TokenData = Depends(get_current_admin_user),
+    session: Session = Depends(get_session)
+):
+    try:
+        return BaseResponse(
+            message="Costo de la sesión obtenido correctamente",
+            data=usage_service.get_session_cost(session_id, session)
+        )
+
+    except APIException as exc:
+        raise_http_exception(exc)
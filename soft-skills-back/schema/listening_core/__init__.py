@@ -24,7 +24,8 @@ from .round_submission import (
     RoundSubmissionRead,
     RoundSubmissionSummary,
     AttemptSubmissionRequest,
-    AttemptSubmissionResponse
+    AttemptSubmissionResponse,
+    RoundGradingResponse
 )
 
 __all__ = [
@@ -47,5 +48,6 @@ __all__ = [
     "RoundSubmissionRead",
     "RoundSubmissionSummary",
     "AttemptSubmissionRequest",
-    "AttemptSubmissionResponse"
+    "AttemptSubmissionResponse",
+    "RoundGradingResponse"
 ]
@@ -1,16 +1,19 @@
 from datetime import datetime
 from typing import Optional, TypeVar
 
-from pydantic import UUID4, field_serializer, BaseModel
+from pydantic import UUID4, Field, field_serializer, BaseModel
 
 from enums.listening_game import PlayMode, PromptType, Difficulty, AudioLength
 from enums.common.language import Language
 from model.listening_core.challenge import ChallengeBase
 from schema.base import BaseResponse
 from utils.serializers import serialize_datetime_without_microseconds
+from utils.config import settings
 from utils.payloads_listening_game import (
     CHALLENGE_CREATE_EXAMPLE,
     CHALLENGE_READ_EXAMPLE,
+    CHALLENGE_BATCH_CREATE_EXAMPLE,
+    CHALLENGE_BATCH_READ_EXAMPLE,
     CHALLENGE_AUDIO_RESPONSE_EXAMPLE
 )
 
@@ -51,6 +54,28 @@ class ChallengeRead(BaseModel):
     }
 
 
+class GenerateChallengeBatch(GenerateChallenge):
+    """Schema for generating several challenges of the same kind in one LLM call."""
+    count: int = Field(default=5, ge=1, le=settings.CHALLENGE_BATCH_MAX_SIZE)
+
+    model_config = {
+        "extra": "forbid",
+        "from_attributes": True,
+        "json_schema_extra": {"example": CHALLENGE_BATCH_CREATE_EXAMPLE}
+    }
+
+
+class ChallengeBatchRead(BaseModel):
+    """Challenges stored from one batch generation; invalid items are dropped and counted."""
+    requested: int
+    rejected: int
+    created: list[ChallengeRead]
+
+    model_config = {
+        "json_schema_extra": {"example": CHALLENGE_BATCH_READ_EXAMPLE}
+    }
+
+
 class ChallengeResponse(BaseResponse[T]):
     """Generic response wrapper for challenge data."""
     pass
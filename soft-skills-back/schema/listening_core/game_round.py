@@ -6,7 +6,7 @@ from pydantic import BaseModel, field_serializer, field_validator
 
 from model.listening_core.game_round import GameRoundBase
 from schema.listening_core.audio_effects import AudioEffects
-from enums.listening_game import PlayMode, PromptType, GameRoundStatus
+from enums.listening_game import PlayMode, PromptType, GameRoundStatus, EvaluationStatus
 from utils.serializers import serialize_datetime_without_microseconds
 from utils.listening_game_validators import normalize_audio_effects
 from utils.payloads_listening_game import (
@@ -54,8 +54,9 @@ class CurrentRoundConfig(BaseModel):
 class RoundEvaluationResponse(BaseModel):
     """Response schema for round evaluation when round is attempted."""
     round_submission_id: UUID
-    is_correct: bool
+    is_correct: Optional[bool] = None
     feedback_short: Optional[str] = None
+    evaluation_status: EvaluationStatus = EvaluationStatus.evaluated
     answer_payload: Dict[str, Any]
     correct_answer: Any  # Can be str, list[str], etc. depending on play_mode
 
@@ -66,6 +67,7 @@ class CurrentRoundResponse(BaseModel):
     """Response schema for current round endpoint."""
     round_id: UUID
     audio_url: Optional[str] = None
+    audio_effects_applied: bool = False  # audio_url already has config.audio_effects rendered in
     config: CurrentRoundConfig
     current_round: int
     status: GameRoundStatus
@@ -111,6 +111,8 @@ class GameSessionResponse(BaseResponse[T]):
 class GameSessionPaginatedResponse(PaginatedResponse):
     """Paginated response for game session lists."""
     data: List[GameSessionSummary]
+    total: Optional[int] = None  # Omitted when include_total=false
+    next_cursor: Optional[str] = None  # Pass as `cursor` to get the next page; null on the last page
 
 
 class RoundAdvanceResponse(BaseModel):
@@ -129,6 +131,7 @@ class SessionFinishResponse(BaseModel):
     final_max_score: float
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
+    pending_evaluations: int = 0
 
     @field_serializer("started_at", "finished_at", when_used="json")
     def serialize_datetime_fields(self, v: datetime | None) -> str | None:
@@ -146,6 +149,7 @@ class SessionResultResponse(BaseModel):
     final_max_score: float
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
+    pending_evaluations: int = 0
     total_rounds: int
     name: str
     rounds: List[RoundRecap]
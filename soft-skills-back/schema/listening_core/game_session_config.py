@@ -3,7 +3,7 @@ from sqlmodel import SQLModel
 from pydantic import field_validator
 
 from model.listening_core.game_session_config import GameSessionConfigBase
-from enums.listening_game import Difficulty, PromptType, PlayMode
+from enums.listening_game import Difficulty, PromptType, PlayMode, GradingMode
 from schema.listening_core.audio_effects import AudioEffects
 from utils.listening_game_validators import (
     validate_total_rounds,
@@ -65,6 +65,7 @@ class GameSessionConfigUpdate(SQLModel):
     allowed_types: Optional[list[PromptType]] = None
     audio_effects: Optional[AudioEffects] = None
     reuse_existing_challenges: Optional[bool] = None
+    grading_mode: Optional[GradingMode] = None
 
     model_config = {
         "extra": "forbid",
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, computed_field
+
+from enums.listening_game import PrefetchJobStatus
+
+
+class PrefetchJobRead(BaseModel):
+    """Status of a round prefetch job."""
+    prefetch_job_id: UUID
+    round_number: int
+    status: PrefetchJobStatus
+    attempts: int
+    last_error: Optional[str] = None
+    enqueued_at: datetime
+    available_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+    @computed_field
+    @property
+    def queue_lag_ms(self) -> Optional[float]:
+        """Time the job waited for a worker after becoming runnable (latest attempt)."""
+        if self.started_at is None or self.started_at < self.available_at:
+            return None
+        return round((self.started_at - self.available_at).total_seconds() * 1000, 1)
+
+    @computed_field
+    @property
+    def preparation_ms(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return round((self.finished_at - self.started_at).total_seconds() * 1000, 1)
@@ -5,7 +5,7 @@ from uuid import UUID
 from pydantic import BaseModel, field_serializer
 
 from model.listening_core.round_submission import RoundSubmissionBase
-from enums.listening_game import PlayMode, PromptType
+from enums.listening_game import PlayMode, PromptType, EvaluationStatus
 from utils.serializers import serialize_datetime_without_microseconds
 from utils.payloads_listening_game import (
     ATTEMPT_SUBMISSION_PARAPHRASE_EXAMPLE,
@@ -13,7 +13,8 @@ from utils.payloads_listening_game import (
     ATTEMPT_SUBMISSION_SUMMARIZE_EXAMPLE,
     ATTEMPT_SUBMISSION_FOCUS_EXAMPLE,
     ATTEMPT_SUBMISSION_CLOZE_EXAMPLE,
-    ATTEMPT_SUBMISSION_RESPONSE_EXAMPLE
+    ATTEMPT_SUBMISSION_RESPONSE_EXAMPLE,
+    ROUND_GRADING_RESPONSE_EXAMPLE
 )
 
 
@@ -90,15 +91,31 @@ class AttemptSubmissionRequest(BaseModel):
 
 
 class AttemptSubmissionResponse(BaseModel):
-    """Response schema for attempt submission."""
+    """Response schema for attempt submission. Score and correctness are null while pending evaluation."""
     round_number: int
-    is_correct: bool
-    score: float
+    is_correct: Optional[bool] = None
+    score: Optional[float] = None
     feedback_short: str
     client_elapsed_ms: Optional[int] = None
     can_advance: bool = True
+    evaluation_status: EvaluationStatus = EvaluationStatus.evaluated
 
     model_config = {
         "from_attributes": True,
         "json_schema_extra": {"example": ATTEMPT_SUBMISSION_RESPONSE_EXAMPLE}
     }
+
+
+class RoundGradingResponse(BaseModel):
+    """Grading state of a round's submission, polled while it is pending evaluation."""
+    round_number: int
+    evaluation_status: EvaluationStatus
+    is_correct: Optional[bool] = None
+    score: Optional[float] = None
+    max_score: float
+    feedback_short: Optional[str] = None
+
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {"example": ROUND_GRADING_RESPONSE_EXAMPLE}
+    }
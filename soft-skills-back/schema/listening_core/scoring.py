@@ -44,6 +44,14 @@ class ClozeSpec(BaseModel):
     answers: list[str] = Field(min_length=1, description="Lista de respuestas correctas para cada espacio en blanco")
 
 
+class CompiledAnswerKey(BaseModel):
+    """Focus/cloze answer key normalized once when the challenge is stored."""
+    version: int
+    choice_count: int = 0 # Focus
+    correct_indices: list[int] = Field(default_factory=list, description="Focus: índices cuyas opciones coinciden con la respuesta correcta")
+    normalized_answers: list[str] = Field(default_factory=list, description="Cloze: respuestas normalizadas por espacio en blanco")
+
+
 class ClarifyAnswerPayload(BaseModel):
     """Payload for clarify mode answer submission."""
     questions: list[str] = Field(
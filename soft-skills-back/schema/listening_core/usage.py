@@ -0,0 +1,33 @@
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from enums.listening_game import UsageProvider, PlayMode
+
+
+class UsageBreakdownItem(BaseModel):
+    """Aggregated usage for one provider/operation/play mode within a session."""
+    provider: UsageProvider
+    operation: str
+    play_mode: Optional[PlayMode] = None
+    calls: int
+    failed_calls: int
+    input_tokens: int
+    output_tokens: int
+    characters: int
+    total_latency_ms: float
+    estimated_cost_usd: float
+
+
+class SessionCostResponse(BaseModel):
+    """Estimated LLM and TTS spend attributed to a game session."""
+    game_session_id: UUID
+    calls: int
+    input_tokens: int
+    output_tokens: int
+    tts_characters: int
+    llm_cost_usd: float
+    tts_cost_usd: float
+    total_cost_usd: float
+    breakdown: List[UsageBreakdownItem]
@@ -1,20 +1,60 @@
 import logging
-from typing import Optional
+import re
+import time
+from pathlib import PurePosixPath
+from typing import Any, Dict, Optional, Set
+from urllib.parse import urlparse
 from uuid import UUID
 
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from model.listening_core.challenge import Challenge
-from schema.listening_core.challenge import GenerateChallenge, ChallengeRead, ChallengeAudioResponse
-from llm.challenge_generator import generate_challenge_json
-from utils.errors import APIException, Missing
+from enums.listening_game import PlayMode
+from pydantic import BaseModel, ValidationError
+
+from schema.listening_core.challenge import (
+    GenerateChallenge,
+    GenerateChallengeBatch,
+    ChallengeRead,
+    ChallengeBatchRead,
+    ChallengeAudioResponse
+)
+from schema.listening_core.scoring import ClarifySpec, SummarizeSpec, ParaphraseSpec
+from llm.challenge_generator import generate_challenge_json, generate_challenge_batch_json
+from service.listening_core.scoring import ANSWER_KEY_VERSION, compile_answer_key
+from utils.errors import APIException, InternalError, Missing, handle_db_error
+from utils.scoring_errors import MisconfiguredChallenge
 from utils.eleven import get_elevenlabs_client
 from utils.storage import get_storage_client
+from utils.audio_stream import BoundedChunkBuffer
+from utils.audio_manifest import audio_manifest
+from utils.audio_render import effect_profile_hash, encode_pcm_wav, is_neutral_profile, render_variant
+from utils.listening_defaults import DEFAULT_AUDIO_EFFECTS
+from utils.listening_helpers import serialize_audio_effects
 from utils.config import get_settings
+from utils.metrics import metrics
+from utils.usage import usage_context
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+BLANK_PATTERN = re.compile(r"_{3,}")
+
+# Variants rendered for every challenge: the default effects of each difficulty that has any.
+# Sessions with custom intensities keep applying effects on the client.
+PRERENDERED_EFFECT_PROFILES: Dict[str, Dict[str, float]] = {
+    effect_profile_hash(profile): profile
+    for profile in (serialize_audio_effects(effects) for effects in DEFAULT_AUDIO_EFFECTS.values())
+    if not is_neutral_profile(profile)
+}
+
+# Open-ended modes have no answer key; their metadata is checked against the scoring specs
+OPEN_ENDED_SPECS: Dict[PlayMode, type[BaseModel]] = {
+    PlayMode.clarify: ClarifySpec,
+    PlayMode.summarize: SummarizeSpec,
+    PlayMode.paraphrase: ParaphraseSpec
+}
+
 
 class ChallengeService:
     def __init__(self):
@@ -34,15 +74,26 @@ class ChallengeService:
             raise api_error
     
     def _get_existing_audio(self, challenge: Challenge, challenge_id: UUID, format: str) -> Optional[ChallengeAudioResponse]:
-        """Check if audio exists in storage and return it."""
+        """
+        Check if audio exists in storage and return it.
+        
+        Keys recently confirmed (or uploaded) by this process are trusted from the
+        manifest; otherwise a single metadata request is made and its result remembered.
+        """
         try:
-            storage_client = get_storage_client()
             bucket_name = settings.SUPABASE_BUCKET
-            
             file_path = f"challenges-audio/{challenge_id}.{format}"
             
+            if audio_manifest.is_known(bucket_name, file_path):
+                return ChallengeAudioResponse(
+                    audio_url=challenge.audio_url
+                )
+            
+            storage_client = get_storage_client()
+            
             if storage_client.exists(bucket_name, file_path):
                 logger.info(f"Found existing audio for challenge {challenge_id}: {challenge.audio_url}")
+                audio_manifest.mark_present(bucket_name, file_path)
                 
                 return ChallengeAudioResponse(
                     audio_url=challenge.audio_url
@@ -61,27 +112,42 @@ class ChallengeService:
         voice_id: Optional[str],
         session: Session
     ) -> ChallengeAudioResponse:
-        """Synthesize audio, upload to storage, and update challenge."""
+        """
+        Stream synthesized audio into storage and update challenge.
+        
+        Chunks flow from the TTS generator through a bounded buffer into a resumable
+        upload, so the upload overlaps with synthesis and memory does not grow with audio length.
+        """
         eleven_client = get_elevenlabs_client()
         storage_client = get_storage_client()
         
-        audio_bytes = eleven_client.synthesize_text(
+        audio_chunks = eleven_client.stream_text(
             audio_text=challenge.audio_text,
             voice_id=voice_id,
             model_id=model_id
         )
+        buffer = BoundedChunkBuffer(audio_chunks, max_chunks=settings.AUDIO_STREAM_BUFFER_CHUNKS)
         
         file_path = f"challenges-audio/{challenge_id}.{format}"
         content_type = "audio/mpeg" if format == "mp3" else f"audio/{format}"
         
-        audio_url = storage_client.upload(
+        audio_url = storage_client.upload_stream(
             bucket_name=settings.SUPABASE_BUCKET,
             file_path=file_path,
-            data=audio_bytes,
+            parts=buffer.parts(storage_client.upload_part_size),
             content_type=content_type
         )
         
+        logger.info(
+            f"Streamed audio for challenge {challenge_id}: "
+            f"ttfb={buffer.stats.time_to_first_byte_ms}ms total_bytes={buffer.stats.total_bytes} "
+            f"elapsed={buffer.stats.elapsed_ms}ms"
+        )
+        
+        audio_manifest.mark_present(settings.SUPABASE_BUCKET, file_path)
         challenge.audio_url = audio_url
+        challenge.audio_storage = storage_client.storage_type
+        challenge.audio_voice_id = voice_id or settings.VOICE_DEFAULT_SINGLE
         
         session.add(challenge)
         session.commit()
@@ -91,6 +157,191 @@ class ChallengeService:
             audio_url=audio_url
         )
     
+    def render_audio_variants(
+        self,
+        challenge: Challenge,
+        session: Session,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None
+    ) -> int:
+        """
+        Synthesize the challenge's speech once as PCM and store, from that one
+        buffer, the original audio (as WAV) and every pre-rendered effect profile,
+        so players on every difficulty hear the same take. The voice stored on the
+        challenge is reused unless one is given. Returns the number of variants.
+        """
+        sample_rate = settings.AUDIO_VARIANT_SAMPLE_RATE
+        bucket_name = settings.SUPABASE_BUCKET
+        voice_id = voice_id or challenge.audio_voice_id or settings.VOICE_DEFAULT_SINGLE
+        storage_client = get_storage_client()
+        
+        previous_path = None
+        if challenge.audio_url and challenge.audio_storage == storage_client.storage_type:
+            previous_path = f"challenges-audio/{challenge.challenge_id}.{self._stored_audio_format(challenge)}"
+        
+        pcm = get_elevenlabs_client().synthesize_pcm(
+            challenge.audio_text,
+            sample_rate,
+            voice_id=voice_id,
+            model_id=model_id
+        )
+        
+        file_path = f"challenges-audio/{challenge.challenge_id}.wav"
+        audio_url = storage_client.upload(
+            bucket_name=bucket_name,
+            file_path=file_path,
+            data=encode_pcm_wav(pcm, sample_rate),
+            content_type="audio/wav"
+        )
+        audio_manifest.mark_present(bucket_name, file_path)
+        
+        variants = {}
+        for profile_hash, profile in PRERENDERED_EFFECT_PROFILES.items():
+            started = time.perf_counter()
+            wav = render_variant(pcm, sample_rate, profile)
+            metrics.observe("audio_variant_render_ms", (time.perf_counter() - started) * 1000)
+            
+            variant_path = f"challenges-audio/variants/{challenge.challenge_id}/{profile_hash}.wav"
+            variants[profile_hash] = storage_client.upload(
+                bucket_name=bucket_name,
+                file_path=variant_path,
+                data=wav,
+                content_type="audio/wav"
+            )
+            audio_manifest.mark_present(bucket_name, variant_path)
+        
+        challenge.audio_url = audio_url
+        challenge.audio_storage = storage_client.storage_type
+        challenge.audio_voice_id = voice_id
+        challenge.audio_variants = variants
+        session.add(challenge)
+        session.commit()
+        session.refresh(challenge)
+        
+        # The replaced take would no longer match the variants
+        if previous_path and previous_path != file_path:
+            storage_client.delete(bucket_name, previous_path)
+        
+        logger.info(f"Stored audio with {len(variants)} variant(s) for challenge {challenge.challenge_id}")
+        return len(variants)
+    
+    def _stored_audio_format(self, challenge: Challenge) -> str:
+        """Extension of the challenge's stored audio, which is WAV when it has variants."""
+        suffix = PurePosixPath(urlparse(challenge.audio_url or "").path).suffix
+        return suffix.lstrip(".") or settings.AUDIO_DEFAULT_FORMAT
+    
+    def _compile_answer_key(self, play_mode: PlayMode, challenge_metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Compile the key up front; a malformed challenge is still stored and fails at scoring as before."""
+        try:
+            return compile_answer_key(play_mode, challenge_metadata)
+        except MisconfiguredChallenge as err:
+            logger.warning(f"Could not compile answer key for {play_mode} challenge: {err}")
+            return None
+    
+    def _batch_item_rejection(
+        self,
+        play_mode: PlayMode,
+        challenge_data: Dict[str, Any],
+        seen_texts: Set[str]
+    ) -> Optional[str]:
+        """Why a generated batch item cannot be stored, or None when it is usable."""
+        audio_text = (challenge_data.get("audio_text") or "").strip()
+        
+        if not audio_text or BLANK_PATTERN.search(audio_text):
+            return "invalid_audio_text"
+        
+        if audio_text in seen_texts:
+            return "duplicate"
+        
+        if play_mode in OPEN_ENDED_SPECS:
+            try:
+                OPEN_ENDED_SPECS[play_mode].model_validate(challenge_data)
+            except ValidationError:
+                return "invalid_metadata"
+            return None
+        
+        try:
+            answer_key = compile_answer_key(play_mode, challenge_data)
+        except MisconfiguredChallenge:
+            return "invalid_metadata"
+        
+        if play_mode == PlayMode.focus and not answer_key["correct_indices"]:
+            return "answer_not_in_choices"
+        
+        if play_mode == PlayMode.cloze and len(BLANK_PATTERN.findall(challenge_data["text_with_blanks"])) != len(answer_key["normalized_answers"]):
+            return "blank_count_mismatch"
+        
+        return None
+    
+    def generate_challenge_batch(self, request: GenerateChallengeBatch, session: Session) -> ChallengeBatchRead:
+        """
+        Generate `count` challenges with a single LLM call, validate each one on
+        its own, and store the valid ones in one transaction.
+        """
+        try:
+            with usage_context(
+                play_mode=request.play_mode,
+                difficulty=request.difficulty,
+                prompt_type=request.prompt_type
+            ):
+                generated = generate_challenge_batch_json(
+                    play_mode=request.play_mode,
+                    prompt_type=request.prompt_type,
+                    difficulty=request.difficulty,
+                    audio_length=request.audio_length,
+                    locale=request.locale,
+                    count=request.count
+                )
+            
+            challenges = []
+            seen_texts: Set[str] = set()
+            
+            for challenge_data in generated[:request.count]:
+                rejection = self._batch_item_rejection(request.play_mode, challenge_data, seen_texts)
+                
+                if rejection:
+                    metrics.increment("generated_challenges_total", play_mode=request.play_mode.value, result=rejection)
+                    logger.warning(f"Dropped generated {request.play_mode} challenge: {rejection}")
+                    continue
+                
+                audio_text = challenge_data.pop("audio_text").strip()
+                seen_texts.add(audio_text)
+                metrics.increment("generated_challenges_total", play_mode=request.play_mode.value, result="stored")
+                
+                challenges.append(Challenge(
+                    play_mode=request.play_mode,
+                    prompt_type=request.prompt_type,
+                    difficulty=request.difficulty,
+                    audio_text=audio_text,
+                    language=request.locale,
+                    challenge_metadata=challenge_data,
+                    answer_key=self._compile_answer_key(request.play_mode, challenge_data)
+                ))
+            
+            if not challenges:
+                raise InternalError("El LLM no generó ningún desafío válido en el lote")
+            
+            # Identifiers and timestamps are assigned client-side, so the response needs no reload
+            created = [ChallengeRead.model_validate(challenge) for challenge in challenges]
+            
+            session.add_all(challenges)
+            session.commit()
+            
+            return ChallengeBatchRead(
+                requested=request.count,
+                rejected=request.count - len(created),
+                created=created
+            )
+            
+        except APIException:
+            session.rollback()
+            raise
+        except Exception as e:
+            session.rollback()
+            raise APIException(
+                f"Error al generar desafíos: {str(e)}"
+            )
+    
     def generate_challenge(self, request: GenerateChallenge, session: Session) -> ChallengeRead:
         """Generate a new challenge using LLM and save it to database."""
         try:
@@ -110,7 +361,8 @@ class ChallengeService:
                 difficulty=request.difficulty,
                 audio_text=audio_text,
                 language=request.locale,
-                challenge_metadata=challenge_data
+                challenge_metadata=challenge_data,
+                answer_key=self._compile_answer_key(request.play_mode, challenge_data)
             )
             
             session.add(challenge)
@@ -151,11 +403,15 @@ class ChallengeService:
         challenge = self.get_challenge(challenge_id, session)
         
         if challenge.audio_url:
-            existing_audio = self._get_existing_audio(challenge, challenge_id, format)
+            existing_audio = self._get_existing_audio(challenge, challenge_id, self._stored_audio_format(challenge))
             if existing_audio:
                 return existing_audio
         
         try:
+            if settings.AUDIO_VARIANTS_ENABLED:
+                self.render_audio_variants(challenge, session, voice_id=voice_id, model_id=model_id)
+                return ChallengeAudioResponse(audio_url=challenge.audio_url)
+            
             return self._synthesize_and_upload_audio(
                 challenge, challenge_id, format, model_id, voice_id, session
             )
@@ -164,3 +420,100 @@ class ChallengeService:
             logger.error(f"Error synthesizing/uploading audio: {str(e)}")
             raise APIException(f"Error al sintetizar audio: {str(e)}")
     
+    
+    def backfill_answer_keys(self, session: Session, batch_size: int = 500) -> Dict[str, int]:
+        """
+        Compile answer keys for focus/cloze challenges stored without one, or
+        with a key from an older ANSWER_KEY_VERSION. Commits once per batch.
+        """
+        counts = {"scanned": 0, "updated": 0, "failed": 0}
+        last_id: Optional[UUID] = None
+        
+        while True:
+            statement = (
+                select(Challenge)
+                .where(Challenge.play_mode.in_([PlayMode.focus, PlayMode.cloze]))
+                .order_by(Challenge.challenge_id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                statement = statement.where(Challenge.challenge_id > last_id)
+            
+            try:
+                challenges = session.exec(statement).all()
+            except Exception as err:
+                handle_db_error(err, "backfill_answer_keys", error_type="query")
+            
+            if not challenges:
+                return counts
+            
+            for challenge in challenges:
+                counts["scanned"] += 1
+                if (challenge.answer_key or {}).get("version") == ANSWER_KEY_VERSION:
+                    continue
+                
+                answer_key = self._compile_answer_key(challenge.play_mode, challenge.challenge_metadata or {})
+                if answer_key is None:
+                    counts["failed"] += 1
+                    continue
+                
+                challenge.answer_key = answer_key
+                session.add(challenge)
+                counts["updated"] += 1
+            
+            last_id = challenges[-1].challenge_id
+            
+            try:
+                session.commit()
+            except Exception as err:
+                session.rollback()
+                handle_db_error(err, "backfill_answer_keys", error_type="commit")
+            
+            logger.info(f"Answer key backfill progress: {counts}")
+    
+    def backfill_audio_variants(self, session: Session, batch_size: int = 100) -> Dict[str, int]:
+        """
+        Re-synthesize, with the voice stored on each challenge, the audio of
+        challenges missing any pre-rendered profile (uploaded before variants
+        existed, or before a profile was added), replacing the original so it
+        matches the variants. Each challenge commits on its own. Counts are per
+        challenge (scanned = skipped + rendered + failed), plus the variants uploaded.
+        """
+        counts = {"scanned": 0, "skipped": 0, "rendered": 0, "failed": 0, "variants": 0}
+        last_id: Optional[UUID] = None
+        
+        while True:
+            statement = (
+                select(Challenge)
+                .where(Challenge.audio_url.is_not(None))
+                .order_by(Challenge.challenge_id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                statement = statement.where(Challenge.challenge_id > last_id)
+            
+            try:
+                challenges = session.exec(statement).all()
+            except Exception as err:
+                handle_db_error(err, "backfill_audio_variants", error_type="query")
+            
+            if not challenges:
+                return counts
+            
+            last_id = challenges[-1].challenge_id
+            
+            for challenge in challenges:
+                counts["scanned"] += 1
+                if set(PRERENDERED_EFFECT_PROFILES) <= set(challenge.audio_variants or {}):
+                    counts["skipped"] += 1
+                    continue
+                
+                try:
+                    counts["variants"] += self.render_audio_variants(challenge, session)
+                    counts["rendered"] += 1
+                except Exception as err:
+                    session.rollback()
+                    counts["failed"] += 1
+                    logger.warning(f"Could not render audio variants for challenge {challenge.challenge_id}: {err}")
+            
+            logger.info(f"Audio variant backfill progress: {counts}")
@@ -2,10 +2,11 @@ from typing import Tuple, Sequence, Optional, Dict, Any, Type
 from uuid import UUID
 from datetime import datetime, timezone
 import random
+import logging
 from collections import Counter
 
 from pydantic import BaseModel, ValidationError
-from sqlmodel import Session, select, func
+from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from model.listening_core.game_session import GameSession
@@ -13,14 +14,17 @@ from model.listening_core.game_session_config import GameSessionConfig
 from model.listening_core.game_round import GameRound
 from model.listening_core.challenge import Challenge
 from model.listening_core.round_submission import RoundSubmission
-from enums.listening_game import GameRoundStatus, PlayMode, PromptType
+from enums.listening_game import GameRoundStatus, PlayMode, PromptType, GradingMode, EvaluationStatus
 from enums.common.language import Language
 from schema.listening_core.challenge import GenerateChallenge
 from schema.listening_core.round_submission import AttemptSubmissionResponse
 from utils.errors import APIException, Missing, InternalError, BadRequest, Conflict, handle_db_error
 from utils.listening_defaults import get_audio_length_for_difficulty
 from service.challenge import ChallengeService
-from service.listening_core.scoring import evaluate_submitted_answer
+from service.listening_core.scoring import evaluate_submitted_answer, is_open_ended
+from service.listening_core.session_totals import add_to_session_totals
+from service.listening_core.submission_idempotency import submission_idempotency, submission_request_hash
+from utils.usage import usage_context
 from schema.listening_core.scoring import (
     FocusAnswerPayload,
     ClozeAnswerPayload,
@@ -31,6 +35,10 @@ from schema.listening_core.scoring import (
 from pydantic import ValidationError
 from utils.scoring_errors import InvalidPayload
 
+logger = logging.getLogger(__name__)
+
+PENDING_EVALUATION_FEEDBACK = "Tu respuesta se está evaluando."
+
 
 class GameRoundService:
     def __init__(self):
@@ -52,30 +60,6 @@ class GameRoundService:
         """Get a round by session and round number with FOR UPDATE lock."""
         return self._get_existing_round(game_session, round_number, use_for_update=True, session=session)
     
-    def calculate_total_score(self, game_session_id: UUID, session: Session) -> float:
-        """Calculate total score by summing all round scores for a game session."""
-        total_score = session.scalar(
-            select(func.coalesce(func.sum(GameRound.score), 0.0))
-            .where(
-                GameRound.game_session_id == game_session_id,
-                GameRound.status == GameRoundStatus.attempted
-            )
-        ) or 0.0
-        
-        return total_score
-
-    def calculate_total_max_score(self, game_session_id: UUID, session: Session) -> float:
-        """Calculate total max score by summing all round max scores for a game session."""
-        total_max_score = session.scalar(
-            select(func.coalesce(func.sum(GameRound.max_score), 0.0))
-            .where(
-                GameRound.game_session_id == game_session_id,
-                GameRound.status == GameRoundStatus.attempted
-            )
-        ) or 0.0
-        
-        return total_max_score
-
     def _should_prepare_round(self, game_round: GameRound) -> bool:
         """Check if round needs preparation based on its current status."""
         return game_round.status == GameRoundStatus.queued
@@ -204,28 +188,29 @@ class GameRoundService:
         game_round.play_mode = play_mode
         game_round.prompt_type = prompt_type
         
-        challenge = self.select_or_generate_challenge(
-            config, 
-            play_mode, 
-            prompt_type, 
-            existing_rounds,
-            db_session
-        )
-        
-        if challenge.play_mode != play_mode:
-            raise InternalError(
-                f"Inconsistencia detectada: el challenge {challenge.challenge_id} tiene play_mode '{challenge.play_mode}' "
-                f"pero se solicitó '{play_mode}' para la ronda {game_round.round_number}"
+        with usage_context(play_mode=play_mode, prompt_type=prompt_type):
+            challenge = self.select_or_generate_challenge(
+                config, 
+                play_mode, 
+                prompt_type, 
+                existing_rounds,
+                db_session
             )
             
-        if challenge.prompt_type != prompt_type:
-            raise InternalError(
-                f"Inconsistencia detectada: el challenge {challenge.challenge_id} tiene prompt_type '{challenge.prompt_type}' "
-                f"pero se solicitó '{prompt_type}' para la ronda {game_round.round_number}"
-            )
-        
-        game_round.challenge_id = challenge.challenge_id
-        self._synthesize_audio_if_needed(challenge, db_session)
+            if challenge.play_mode != play_mode:
+                raise InternalError(
+                    f"Inconsistencia detectada: el challenge {challenge.challenge_id} tiene play_mode '{challenge.play_mode}' "
+                    f"pero se solicitó '{play_mode}' para la ronda {game_round.round_number}"
+                )
+                
+            if challenge.prompt_type != prompt_type:
+                raise InternalError(
+                    f"Inconsistencia detectada: el challenge {challenge.challenge_id} tiene prompt_type '{challenge.prompt_type}' "
+                    f"pero se solicitó '{prompt_type}' para la ronda {game_round.round_number}"
+                )
+            
+            game_round.challenge_id = challenge.challenge_id
+            self._synthesize_audio_if_needed(challenge, db_session)
         
         game_round.prepared_at = datetime.now(timezone.utc)
         game_round.status = GameRoundStatus.pending
@@ -276,7 +261,7 @@ class GameRoundService:
             try:
                 self.challenge_service.get_or_create_audio(challenge.challenge_id, db_session)
             except Exception as err:
-                pass
+                logger.warning(f"Audio synthesis failed for challenge {challenge.challenge_id}: {err}")
 
     def get_or_create_round_queued(
         self, 
@@ -336,12 +321,13 @@ class GameRoundService:
             if not self._should_prepare_round(game_round):
                 return game_round
             
-            self._assign_challenge_to_round(
-                game_session, 
-                config, 
-                game_round, 
-                db_session
-            )
+            with usage_context(game_session_id=game_session.game_session_id, difficulty=config.difficulty):
+                self._assign_challenge_to_round(
+                    game_session, 
+                    config, 
+                    game_round, 
+                    db_session
+                )
             
             db_session.commit()
             db_session.refresh(game_round)
@@ -590,12 +576,12 @@ class GameRoundService:
         game_session: GameSession,
         round_number: int,
         db_session: Session
-    ) -> Tuple[GameRound, Dict[str, Any]]:
+    ) -> Tuple[GameRound, Challenge]:
         """
-        Validate all preconditions for submitting an attempt and return the round and challenge metadata.
+        Validate all preconditions for submitting an attempt and return the round and its challenge.
         
         Returns:
-            Tuple of (GameRound, challenge_metadata)
+            Tuple of (GameRound, Challenge)
         """
         if round_number != game_session.current_round:
             raise BadRequest(
@@ -619,25 +605,28 @@ class GameRoundService:
             raise Missing("El desafío de la ronda no está asignado")
         
         challenge = self.challenge_service.get_challenge(game_round.challenge_id, db_session)
-        challenge_metadata = challenge.challenge_metadata or {}
         
-        return game_round, challenge_metadata
+        return game_round, challenge
 
     def _create_and_save_submission(
         self,
         game_session: GameSession,
         game_round: GameRound,
         answer_payload: Dict[str, Any],
-        score: float,
+        score: Optional[float],
         is_correct: bool,
         feedback_short: str,
         user_id: UUID,
         client_elapsed_ms: Optional[int],
         idempotency_key: str,
-        db_session: Session
+        response: AttemptSubmissionResponse,
+        db_session: Session,
+        evaluation_status: EvaluationStatus = EvaluationStatus.evaluated
     ) -> None:
         """
         Create and save a new submission, and update the game round status.
+        A submission pending evaluation leaves the round score empty until it is graded.
+        The response is stored under the idempotency key in the same transaction, for retries.
         """
         now = datetime.now(timezone.utc)
         
@@ -652,7 +641,9 @@ class GameRoundService:
             feedback_short=feedback_short,
             client_elapsed_ms=client_elapsed_ms,
             idempotency_key=idempotency_key,
-            submitted_at=now
+            submitted_at=now,
+            evaluation_status=evaluation_status,
+            evaluated_at=now if evaluation_status == EvaluationStatus.evaluated else None
         )
         
         db_session.add(submission)
@@ -661,15 +652,37 @@ class GameRoundService:
         game_round.score = score
         game_round.ended_at = now
         
+        add_to_session_totals(
+            game_session.game_session_id,
+            db_session,
+            score_delta=score or 0.0,
+            max_score_delta=game_round.max_score,
+            attempted_delta=1
+        )
+        
+        request_hash = submission_request_hash(game_session.game_session_id, game_round.round_number, answer_payload)
+        submission_idempotency.add_record(
+            db_session,
+            user_id=user_id,
+            idempotency_key=idempotency_key,
+            request_hash=request_hash,
+            game_session_id=game_session.game_session_id,
+            round_number=game_round.round_number,
+            response=response
+        )
+        
         db_session.commit()
+        
+        submission_idempotency.remember(user_id, idempotency_key, request_hash, response)
 
     def _build_submission_response(
         self,
         game_round: GameRound,
-        is_correct: bool,
-        score: float,
+        is_correct: Optional[bool],
+        score: Optional[float],
         feedback_short: str,
-        client_elapsed_ms: Optional[int]
+        client_elapsed_ms: Optional[int],
+        evaluation_status: EvaluationStatus = EvaluationStatus.evaluated
     ) -> AttemptSubmissionResponse:
         """
         Build the response for a submission attempt.
@@ -680,9 +693,18 @@ class GameRoundService:
             score=score,
             feedback_short=feedback_short,
             client_elapsed_ms=client_elapsed_ms,
-            can_advance=True
+            can_advance=True,
+            evaluation_status=evaluation_status
         )
 
+    def _should_defer_evaluation(self, game_session: GameSession, game_round: GameRound, db_session: Session) -> bool:
+        """Open-ended rounds are left to the background grader unless the session grades synchronously."""
+        if not is_open_ended(game_round.play_mode):
+            return False
+        
+        config = db_session.get(GameSessionConfig, game_session.game_session_id)
+        return config is not None and config.grading_mode != GradingMode.sync
+
     def submit_attempt(
         self,
         game_session: GameSession,
@@ -700,7 +722,7 @@ class GameRoundService:
             AttemptSubmissionResponse with evaluation results.
         """
         try:
-            game_round, challenge_metadata = self._validate_and_get_round_for_attempt(
+            game_round, challenge = self._validate_and_get_round_for_attempt(
                 game_session, round_number, db_session
             )
             
@@ -711,19 +733,63 @@ class GameRoundService:
             )
             
             if existing_submission:
+                is_evaluated = existing_submission.evaluation_status == EvaluationStatus.evaluated
                 return self._build_submission_response(
                     game_round=game_round,
-                    is_correct=existing_submission.is_correct,
-                    score=game_round.score or 0.0,
+                    is_correct=existing_submission.is_correct if is_evaluated else None,
+                    score=(game_round.score or 0.0) if is_evaluated else game_round.score,
                     feedback_short=existing_submission.feedback_short or "",
-                    client_elapsed_ms=existing_submission.client_elapsed_ms
+                    client_elapsed_ms=existing_submission.client_elapsed_ms,
+                    evaluation_status=existing_submission.evaluation_status
+                )
+            
+            if self._should_defer_evaluation(game_session, game_round, db_session):
+                response = self._build_submission_response(
+                    game_round=game_round,
+                    is_correct=None,
+                    score=None,
+                    feedback_short=PENDING_EVALUATION_FEEDBACK,
+                    client_elapsed_ms=client_elapsed_ms,
+                    evaluation_status=EvaluationStatus.pending_evaluation
+                )
+                
+                self._create_and_save_submission(
+                    game_session=game_session,
+                    game_round=game_round,
+                    answer_payload=answer_payload,
+                    score=None,
+                    is_correct=False,
+                    feedback_short=PENDING_EVALUATION_FEEDBACK,
+                    user_id=user_id,
+                    client_elapsed_ms=client_elapsed_ms,
+                    idempotency_key=idempotency_key,
+                    response=response,
+                    db_session=db_session,
+                    evaluation_status=EvaluationStatus.pending_evaluation
                 )
+                
+                return response
             
-            score, is_correct, feedback_short = evaluate_submitted_answer(
+            with usage_context(
+                game_session_id=game_session.game_session_id,
                 play_mode=game_round.play_mode,
-                answer_payload=answer_payload,
-                challenge_metadata=challenge_metadata,
-                max_score=game_round.max_score
+                prompt_type=game_round.prompt_type
+            ):
+                score, is_correct, feedback_short = evaluate_submitted_answer(
+                    play_mode=game_round.play_mode,
+                    answer_payload=answer_payload,
+                    challenge_metadata=challenge.challenge_metadata or {},
+                    max_score=game_round.max_score,
+                    answer_key=challenge.answer_key,
+                    audio_text=challenge.audio_text
+                )
+            
+            response = self._build_submission_response(
+                game_round=game_round,
+                is_correct=is_correct,
+                score=score,
+                feedback_short=feedback_short,
+                client_elapsed_ms=client_elapsed_ms
             )
             
             self._create_and_save_submission(
@@ -736,16 +802,11 @@ class GameRoundService:
                 user_id=user_id,
                 client_elapsed_ms=client_elapsed_ms,
                 idempotency_key=idempotency_key,
+                response=response,
                 db_session=db_session
             )
             
-            return self._build_submission_response(
-                game_round=game_round,
-                is_correct=is_correct,
-                score=score,
-                feedback_short=feedback_short,
-                client_elapsed_ms=client_elapsed_ms
-            )
+            return response
             
         except APIException as api_error:
             raise api_error
@@ -1,22 +1,73 @@
-from typing import Tuple, Sequence, Optional, Dict, Any, List
+from typing import Tuple, Sequence, Optional, Dict, Any, List, NamedTuple
 from uuid import UUID
 from datetime import datetime, timezone
+import base64
+import binascii
+import hashlib
+import json
 
-from sqlmodel import Session, select, func
+from sqlalchemy import and_, or_
+from sqlmodel import Session, select, func, update
 from model.listening_core.game_session import GameSession
 from model.listening_core.game_session_config import GameSessionConfig
 from model.listening_core.game_round import GameRound
 from model.listening_core.round_submission import RoundSubmission
-from schema.listening_core.game_session import GameSessionCreate, GameSessionSummary
+from model.listening_core.challenge import Challenge
+from model.listening_core.prefetch_job import PrefetchJob
+from model.listening_core.session_result_snapshot import SessionResultSnapshot
+from schema.listening_core.game_session import GameSessionCreate, GameSessionSummary, SessionResultResponse
 from schema.listening_core.game_round import RoundEvaluationResponse
-from enums.listening_game import GameStatus, GameRoundStatus, PlayMode
+from enums.listening_game import GameStatus, GameRoundStatus, PlayMode, EvaluationStatus
 from utils.errors import APIException, Missing, BadRequest, Forbidden, Conflict, Locked, handle_db_error
 from service.listening_core.game_round import GameRoundService
+from service.listening_core.prefetch_queue import PrefetchQueueService
+from service.listening_core.prefetch_scheduler import LookaheadScheduler
+from service.listening_core.grading import SubmissionGradingService
+from service.listening_core.submission_idempotency import submission_idempotency, submission_request_hash
+from utils.metrics import metrics
+
+# Bump when the recap layout changes so stored snapshots are rebuilt on next view
+RESULT_SNAPSHOT_VERSION = 1
+
+# Served from ix_listening_game_session_user_list alone; selecting GameSession would also selectin-load its children
+SESSION_SUMMARY_COLUMNS = (
+    GameSession.game_session_id,
+    GameSession.name,
+    GameSession.status,
+    GameSession.current_round,
+    GameSession.total_score,
+    GameSession.total_max_score,
+    GameSession.attempted_rounds,
+    GameSession.created_at
+)
+
+
+class SessionListCursor(NamedTuple):
+    """Position of the last session of a page, in the list order (status, created_at desc, id desc)."""
+    status: GameStatus
+    created_at: datetime
+    game_session_id: UUID
+
+    def encode(self) -> str:
+        payload = json.dumps([self.status.value, self.created_at.isoformat(), str(self.game_session_id)])
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "SessionListCursor":
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            status, created_at, game_session_id = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(GameStatus(status), datetime.fromisoformat(created_at), UUID(game_session_id))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+            raise BadRequest("Cursor de paginación inválido")
 
 
 class GameSessionService:
     def __init__(self):
         self.game_round_service = GameRoundService()
+        self.prefetch_queue = PrefetchQueueService()
+        self.prefetch_scheduler = LookaheadScheduler(self.prefetch_queue)
+        self.grading_service = SubmissionGradingService()
     
     def get_game_session(self, session_id: UUID, session: Session) -> GameSession:
         """Get a game session by ID."""
@@ -131,6 +182,24 @@ class GameSessionService:
         except Exception as err:
             handle_db_error(err, "get_game_session_detail", error_type="query")
     
+    def get_prefetch_jobs(
+        self,
+        session_id: UUID,
+        user_id: UUID,
+        session: Session
+    ) -> Sequence[PrefetchJob]:
+        """List the round prefetch jobs of a game session with their status and last error."""
+        try:
+            game_session = self.get_game_session(session_id, session)
+            self.verify_session_ownership(game_session, user_id)
+
+            return self.prefetch_queue.list_jobs(session_id, session)
+
+        except APIException:
+            raise
+        except Exception as err:
+            handle_db_error(err, "get_prefetch_jobs", error_type="query")
+
     def update_game_session(
         self, 
         session_id: UUID, 
@@ -243,7 +312,7 @@ class GameSessionService:
             handle_db_error(err, "delete_game_session", error_type="commit")
     
     def _count_game_sessions(self, user_id: UUID, session: Session) -> int:
-        """Count total game sessions for a user."""
+        """Count total game sessions for a user (an index-only count on the list index)."""
         return session.scalar(
             select(func.count(GameSession.game_session_id))
             .where(GameSession.user_id == user_id)
@@ -254,15 +323,38 @@ class GameSessionService:
         user_id: UUID, 
         offset: int, 
         limit: int, 
-        session: Session
-    ) -> Sequence[GameSession]:
-        """Get paginated game sessions for a user, grouped by status."""
-        return session.exec(
-            select(GameSession)
+        session: Session,
+        after: Optional[SessionListCursor] = None
+    ) -> Sequence[Any]:
+        """
+        Get a page of session summary rows for a user, grouped by status. With
+        `after` the page starts right after that cursor (keyset, so its cost does
+        not grow with the page number) and offset is ignored.
+        """
+        statement = (
+            select(*SESSION_SUMMARY_COLUMNS)
             .where(GameSession.user_id == user_id)
-            .order_by(GameSession.status, GameSession.created_at.desc())
-            .offset(offset)
+            .order_by(GameSession.status, GameSession.created_at.desc(), GameSession.game_session_id.desc())
             .limit(limit)
+        )
+        
+        if after is None:
+            return session.exec(statement.offset(offset)).all()
+        
+        return session.exec(
+            statement.where(or_(
+                GameSession.status > after.status,
+                and_(
+                    GameSession.status == after.status,
+                    or_(
+                        GameSession.created_at < after.created_at,
+                        and_(
+                            GameSession.created_at == after.created_at,
+                            GameSession.game_session_id < after.game_session_id
+                        )
+                    )
+                )
+            ))
         ).all()
     
     def _get_game_sessions_paginated(
@@ -270,24 +362,38 @@ class GameSessionService:
         user_id: UUID, 
         offset: int, 
         limit: int, 
-        session: Session
-    ) -> Tuple[Sequence[GameSession], int]:
-        """Get paginated game sessions with total count."""
-        total_count = self._count_game_sessions(user_id, session)
-        game_sessions = self._get_game_sessions(user_id, offset, limit, session)
-        return game_sessions, total_count
+        session: Session,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[Sequence[Any], Optional[int], Optional[str]]:
+        """Get a page of game sessions, the total count if asked for, and the cursor of the next page."""
+        after = SessionListCursor.decode(cursor) if cursor else None
+        total_count = self._count_game_sessions(user_id, session) if include_total else None
+        
+        # One extra row tells whether there is a next page
+        rows = self._get_game_sessions(user_id, offset, limit + 1, session, after=after)
+        game_sessions = rows[:limit]
+        
+        next_cursor = None
+        if len(rows) > limit and game_sessions:
+            last = game_sessions[-1]
+            next_cursor = SessionListCursor(last.status, last.created_at, last.game_session_id).encode()
+        
+        return game_sessions, total_count, next_cursor
     
     def list_game_sessions(
         self, 
         user_id: UUID, 
         offset: int, 
         limit: int, 
-        session: Session
-    ) -> Tuple[Sequence[GameSessionSummary], int]:
-        """List all game sessions for a user with pagination."""
+        session: Session,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[Sequence[GameSessionSummary], Optional[int], Optional[str]]:
+        """List a user's game sessions by offset or by cursor, with the next page's cursor."""
         try:
-            game_sessions, total_count = self._get_game_sessions_paginated(
-                user_id, offset, limit, session
+            game_sessions, total_count, next_cursor = self._get_game_sessions_paginated(
+                user_id, offset, limit, session, cursor=cursor, include_total=include_total
             )
             
             game_session_summaries = [
@@ -297,12 +403,14 @@ class GameSessionService:
                     status=gs.status,
                     current_round=gs.current_round,
                     total_score=gs.total_score,
+                    total_max_score=gs.total_max_score,
+                    attempted_rounds=gs.attempted_rounds,
                     created_at=gs.created_at
                 )
                 for gs in game_sessions
             ]
             
-            return game_session_summaries, total_count
+            return game_session_summaries, total_count, next_cursor
             
         except APIException:
             raise
@@ -502,42 +610,56 @@ class GameSessionService:
             db_session.rollback()
             handle_db_error(err, "finish_session", error_type="commit")
     
-    def _get_all_rounds_for_session(
+    def _load_recap_rows(
         self,
         session_id: UUID,
         db_session: Session
-    ) -> Sequence[GameRound]:
-        """Get all rounds for a session ordered by round_number."""
+    ) -> Sequence[Any]:
+        """
+        Load every round of a session with the challenge fields and submission
+        the recap needs, in one query ordered by round_number. A round has at
+        most one submission (uq_submission_per_round), so rows are not multiplied.
+        """
         return db_session.exec(
-            select(GameRound)
+            select(
+                GameRound,
+                Challenge.audio_url,
+                Challenge.challenge_metadata,
+                RoundSubmission.round_submission_id,
+                RoundSubmission.is_correct,
+                RoundSubmission.feedback_short,
+                RoundSubmission.evaluation_status,
+                RoundSubmission.answer_payload
+            )
+            .outerjoin(Challenge, Challenge.challenge_id == GameRound.challenge_id)
+            .outerjoin(RoundSubmission, RoundSubmission.game_round_id == GameRound.game_round_id)
             .where(GameRound.game_session_id == session_id)
             .order_by(GameRound.round_number)
         ).all()
     
     def _build_round_recap(
         self,
-        game_round: GameRound,
-        challenge: Optional[Any],
-        config: GameSessionConfig,
-        db_session: Session
+        recap_row: Any,
+        config: GameSessionConfig
     ) -> Dict[str, Any]:
         """Build round recap dictionary for completion result."""
-        audio_url = challenge.audio_url if challenge else None
+        game_round = recap_row.GameRound
+        challenge_metadata = recap_row.challenge_metadata or {}
+        has_challenge = game_round.challenge_id is not None
         
         filtered_metadata = None
-        if challenge and game_round.play_mode:
+        if has_challenge and game_round.play_mode:
             filtered_metadata = self._filter_challenge_metadata_by_play_mode(
-                challenge.challenge_metadata or {},
+                challenge_metadata,
                 game_round.play_mode
             )
         
         evaluation = None
-        if game_round.status == GameRoundStatus.attempted:
-            evaluation = self.get_round_evaluation(
-                game_round.game_round_id,
-                challenge.challenge_metadata or {} if challenge else {},
-                game_round.play_mode,
-                db_session
+        if game_round.status == GameRoundStatus.attempted and recap_row.round_submission_id is not None:
+            evaluation = self._build_round_evaluation(
+                recap_row,
+                challenge_metadata,
+                game_round.play_mode
             )
         
         replays_used = game_round.replays_used or 0
@@ -550,7 +672,7 @@ class GameSessionService:
             "status": game_round.status,
             "play_mode": game_round.play_mode,
             "prompt_type": game_round.prompt_type,
-            "audio_url": audio_url,
+            "audio_url": recap_row.audio_url,
             "score": game_round.score,
             "max_score": game_round.max_score,
             "mode_payload": filtered_metadata,
@@ -562,34 +684,69 @@ class GameSessionService:
     
     def _build_rounds_recap(
         self,
-        all_rounds: Sequence[GameRound],
+        session_id: UUID,
         config: GameSessionConfig,
         db_session: Session
     ) -> List[Dict[str, Any]]:
         """Build list of round recaps for all rounds."""
-        rounds_recap = []
-        for game_round in all_rounds:
-            challenge = None
-            if game_round.challenge_id:
-                challenge = self.game_round_service.challenge_service.get_challenge(
-                    game_round.challenge_id, db_session
-                )
-            
-            round_recap = self._build_round_recap(
-                game_round, challenge, config, db_session
-            )
-            rounds_recap.append(round_recap)
+        return [
+            self._build_round_recap(recap_row, config)
+            for recap_row in self._load_recap_rows(session_id, db_session)
+        ]
+    
+    def _build_completion_result(
+        self,
+        game_session: GameSession,
+        base_response: Dict[str, Any],
+        db_session: Session
+    ) -> Dict[str, Any]:
+        """Full recap: completion totals plus every round."""
+        config = self.get_config(game_session.game_session_id, db_session)
+        
+        return {
+            **base_response,
+            "total_rounds": config.total_rounds,
+            "name": game_session.name,
+            "rounds": self._build_rounds_recap(game_session.game_session_id, config, db_session)
+        }
+    
+    def _write_result_snapshot(
+        self,
+        game_session: GameSession,
+        result: Dict[str, Any],
+        db_session: Session
+    ) -> SessionResultSnapshot:
+        """Freeze the recap as JSON with a content ETag. The caller commits."""
+        data = SessionResultResponse.model_validate(result).model_dump(mode="json")
+        etag = hashlib.sha256(
+            json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()[:32]
+        
+        snapshot = db_session.get(SessionResultSnapshot, game_session.game_session_id) or SessionResultSnapshot(
+            game_session_id=game_session.game_session_id
+        )
+        snapshot.version = RESULT_SNAPSHOT_VERSION
+        snapshot.etag = etag
+        snapshot.result = data
+        snapshot.created_at = datetime.now(timezone.utc)
+        db_session.add(snapshot)
         
-        return rounds_recap
+        return snapshot
     
     def get_completion_result(
         self,
         session_id: UUID,
         user_id: UUID,
         db_session: Session
-    ) -> Dict[str, Any]:
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
         """
         Get completion result for a finished game session with full recap.
+        
+        Returns:
+            Tuple of (result, etag). The stored snapshot is served when there is
+            one; otherwise the recap is computed, and frozen if nothing is left
+            to grade. etag is None while evaluations are pending, since the
+            result can still change.
         """
         try:
             game_session = self.get_game_session(session_id, db_session)
@@ -598,22 +755,27 @@ class GameSessionService:
             if game_session.status != GameStatus.completed:
                 raise Conflict("La sesión aún no está completada")
             
-            config = self.get_config(session_id, db_session)
+            snapshot = db_session.get(SessionResultSnapshot, session_id)
+            if snapshot is not None and snapshot.version == RESULT_SNAPSHOT_VERSION:
+                metrics.increment("session_result_requests_total", source="snapshot")
+                return snapshot.result, snapshot.etag
+            
+            metrics.increment("session_result_requests_total", source="computed")
             base_response = self._build_completion_response(game_session, session_id, db_session)
+            result = self._build_completion_result(game_session, base_response, db_session)
             
-            all_rounds = self._get_all_rounds_for_session(session_id, db_session)
-            rounds_recap = self._build_rounds_recap(all_rounds, config, db_session)
+            if result["pending_evaluations"] > 0:
+                return result, None
             
-            return {
-                **base_response,
-                "total_rounds": config.total_rounds,
-                "name": game_session.name,
-                "rounds": rounds_recap
-            }
+            snapshot = self._write_result_snapshot(game_session, result, db_session)
+            db_session.commit()
+            
+            return snapshot.result, snapshot.etag
             
         except APIException:
             raise
         except Exception as err:
+            db_session.rollback()
             handle_db_error(err, "get_completion_result", error_type="query")
     
     def _build_replay_response(
@@ -635,18 +797,104 @@ class GameSessionService:
             "max_replays_per_round": max_replays_per_round
         }
     
-    def _increment_and_return_replay_response(
+    def _try_increment_replay(
         self,
-        game_round: GameRound,
-        max_replays_per_round: int,
+        session_id: UUID,
+        round_number: int,
+        user_id: UUID,
         db_session: Session
-    ) -> Dict[str, Any]:
-        """Increment replay counter, commit, and return response."""
-        game_round.replays_used = (game_round.replays_used or 0) + 1
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Increment the replay counter with a single conditional UPDATE ... RETURNING.
+
+        Ownership, session status, round status and the per-round limit are all
+        part of the WHERE clause, so concurrent replays cannot overshoot the limit
+        and no row lock is held across round-trips. Returns (replays_used,
+        max_replays_per_round), or None when any condition rejected the update.
+        """
+        replays_used = func.coalesce(GameRound.replays_used, 0)
+        max_replays = (
+            select(GameSessionConfig.max_replays_per_round)
+            .where(GameSessionConfig.game_session_id == GameRound.game_session_id)
+            .scalar_subquery()
+        )
+        session_accepts_replays = (
+            select(GameSession.game_session_id)
+            .where(
+                GameSession.game_session_id == GameRound.game_session_id,
+                GameSession.user_id == user_id,
+                GameSession.status != GameStatus.completed
+            )
+            .exists()
+        )
+
+        row = db_session.exec(
+            update(GameRound)
+            .where(
+                GameRound.game_session_id == session_id,
+                GameRound.round_number == round_number,
+                GameRound.status.in_((GameRoundStatus.served, GameRoundStatus.attempted)),
+                session_accepts_replays,
+                replays_used < max_replays
+            )
+            .values(replays_used=replays_used + 1)
+            .returning(GameRound.replays_used, max_replays)
+            .execution_options(synchronize_session=False)
+        ).first()
+
+        if row is None:
+            return None
+
         db_session.commit()
-        
-        return self._build_replay_response(game_round.replays_used, max_replays_per_round, request_accepted=True)
-    
+        return row[0], row[1]
+
+    def _rejected_replay_response(
+        self,
+        session_id: UUID,
+        round_number: int,
+        user_id: UUID,
+        db_session: Session
+    ) -> Dict[str, Any]:
+        """Work out why the conditional update matched nothing: raise the matching error, or report the limit."""
+        row = db_session.exec(
+            select(
+                GameSession.user_id,
+                GameSession.status,
+                GameRound.status,
+                GameRound.replays_used,
+                GameSessionConfig.max_replays_per_round
+            )
+            .outerjoin(
+                GameRound,
+                (GameRound.game_session_id == GameSession.game_session_id) &
+                (GameRound.round_number == round_number)
+            )
+            .outerjoin(GameSessionConfig, GameSessionConfig.game_session_id == GameSession.game_session_id)
+            .where(GameSession.game_session_id == session_id)
+        ).first()
+
+        if row is None:
+            raise Missing(f"Sesión de juego con ID {session_id} no encontrada")
+
+        owner_id, session_status, round_status, replays_used, max_replays = row
+
+        if owner_id != user_id:
+            raise Forbidden("No tiene permiso para realizar esta acción")
+
+        if session_status == GameStatus.completed:
+            raise Conflict("No se puede reproducir audio para una sesión completada")
+
+        if round_status is None:
+            raise Missing(f"Ronda {round_number} no encontrada para la sesión {session_id}")
+
+        if max_replays is None:
+            raise Missing(f"Configuración de sesión de juego para la sesión {session_id} no encontrada")
+
+        if round_status not in (GameRoundStatus.served, GameRoundStatus.attempted):
+            raise Conflict(f"Repetición no permitida para ronda con estado {round_status}")
+
+        return self._build_replay_response(replays_used or 0, max_replays, request_accepted=False)
+
     def increment_replay(
         self,
         session_id: UUID,
@@ -658,31 +906,15 @@ class GameSessionService:
         Increment replay counter if under limit.
         """
         try:
-            game_session = self.get_game_session(session_id, db_session)
-            self.verify_session_ownership(game_session, user_id)
-            
-            if game_session.status == GameStatus.completed:
-                raise Conflict("No se puede reproducir audio para una sesión completada")
-            
-            game_round = self.game_round_service.get_round_for_update(
-                game_session, round_number, db_session
-            )
-            
-            if not game_round:
-                raise Missing(f"Ronda {round_number} no encontrada para la sesión {session_id}")
-            
-            config = self.get_config(session_id, db_session)
-            
-            if game_round.status not in (GameRoundStatus.served, GameRoundStatus.attempted):
-                raise Conflict(f"Repetición no permitida para ronda con estado {game_round.status}")
-            
-            max_replays = config.max_replays_per_round
-            replays_used = game_round.replays_used or 0
-            
-            if replays_used >= max_replays:
-                return self._build_replay_response(replays_used, max_replays, request_accepted=False)
-            
-            return self._increment_and_return_replay_response(game_round, max_replays, db_session)
+            incremented = self._try_increment_replay(session_id, round_number, user_id, db_session)
+
+            if incremented is None:
+                metrics.increment("replay_requests_total", outcome="rejected")
+                return self._rejected_replay_response(session_id, round_number, user_id, db_session)
+
+            metrics.increment("replay_requests_total", outcome="accepted")
+            replays_used, max_replays = incremented
+            return self._build_replay_response(replays_used, max_replays, request_accepted=True)
             
         except APIException:
             raise
@@ -702,8 +934,19 @@ class GameSessionService:
     ):
         """
         Submit an attempt for a round with all validations.
+        Retries of an already answered idempotency key are served before any lookup or lock.
         """
         try:
+            stored_response = submission_idempotency.lookup(
+                session,
+                user_id,
+                idempotency_key,
+                submission_request_hash(session_id, round_number, answer_payload)
+            )
+            
+            if stored_response is not None:
+                return stored_response
+            
             game_session = self.get_game_session(session_id, session)
             self.verify_session_ownership(game_session, user_id)
             
@@ -770,15 +1013,15 @@ class GameSessionService:
         db_session: Session
     ) -> Dict[str, Any]:
         """Build completion response with scores and timestamps."""
-        total_score = self.game_round_service.calculate_total_score(session_id, db_session)
-        total_max_score = self.game_round_service.calculate_total_max_score(session_id, db_session)
+        pending_evaluations = self.grading_service.count_pending(session_id, db_session)
         
         return {
             "session_completed": True,
-            "final_score": total_score,
-            "final_max_score": total_max_score,
+            "final_score": game_session.total_score,
+            "final_max_score": game_session.total_max_score,
             "started_at": game_session.started_at,
-            "finished_at": game_session.finished_at
+            "finished_at": game_session.finished_at,
+            "pending_evaluations": pending_evaluations
         }
 
     def _complete_session(
@@ -788,15 +1031,19 @@ class GameSessionService:
         db_session: Session
     ) -> Dict[str, Any]:
         """Mark session as completed and return completion response."""
-        total_score = self.game_round_service.calculate_total_score(session_id, db_session)
-        
-        game_session.total_score = total_score
         game_session.status = GameStatus.completed
         game_session.finished_at = datetime.now(timezone.utc)
         
+        completion_response = self._build_completion_response(game_session, session_id, db_session)
+        
+        # Results only freeze once nothing is left for the background grader
+        if completion_response["pending_evaluations"] == 0:
+            result = self._build_completion_result(game_session, completion_response, db_session)
+            self._write_result_snapshot(game_session, result, db_session)
+        
         db_session.commit()
         
-        return self._build_completion_response(game_session, session_id, db_session)
+        return completion_response
 
     def _advance_round_pointer(
         self,
@@ -864,16 +1111,77 @@ class GameSessionService:
         if not submission:
             return None
         
+        return self._build_round_evaluation(submission, challenge_metadata, play_mode)
+
+    def _build_round_evaluation(
+        self,
+        submission: Any,
+        challenge_metadata: Dict[str, Any],
+        play_mode: Optional[PlayMode]
+    ) -> Optional[RoundEvaluationResponse]:
+        """
+        Build the evaluation from a RoundSubmission, or from any row carrying its
+        round_submission_id, is_correct, feedback_short, evaluation_status and answer_payload.
+        """
+        if not play_mode:
+            return None
+        
         correct_answer = self._extract_correct_answer(play_mode, challenge_metadata)
+        is_evaluated = submission.evaluation_status == EvaluationStatus.evaluated
         
         return RoundEvaluationResponse(
             round_submission_id=submission.round_submission_id,
-            is_correct=submission.is_correct,
+            is_correct=submission.is_correct if is_evaluated else None,
             feedback_short=submission.feedback_short,
+            evaluation_status=submission.evaluation_status,
             answer_payload=submission.answer_payload or {},
             correct_answer=correct_answer
         )
 
+    def get_round_grading(
+        self,
+        session_id: UUID,
+        round_number: int,
+        user_id: UUID,
+        session: Session
+    ) -> Dict[str, Any]:
+        """
+        Get the grading state of a round's submission, for clients polling a
+        round whose answer was left to the background grader.
+        """
+        try:
+            game_session = self.get_game_session(session_id, session)
+            self.verify_session_ownership(game_session, user_id)
+            
+            result = session.exec(
+                select(GameRound, RoundSubmission)
+                .join(RoundSubmission, RoundSubmission.game_round_id == GameRound.game_round_id)
+                .where(
+                    GameRound.game_session_id == session_id,
+                    GameRound.round_number == round_number
+                )
+            ).first()
+            
+            if not result:
+                raise Missing(f"La ronda {round_number} no tiene un intento registrado")
+            
+            game_round, submission = result
+            is_evaluated = submission.evaluation_status == EvaluationStatus.evaluated
+            
+            return {
+                "round_number": game_round.round_number,
+                "evaluation_status": submission.evaluation_status,
+                "is_correct": submission.is_correct if is_evaluated else None,
+                "score": game_round.score,
+                "max_score": game_round.max_score,
+                "feedback_short": submission.feedback_short
+            }
+            
+        except APIException:
+            raise
+        except Exception as err:
+            handle_db_error(err, "get_round_grading", error_type="query")
+
     def _filter_challenge_metadata_by_play_mode(
         self,
         challenge_metadata: Dict[str, Any],
@@ -0,0 +1,345 @@
+from typing import NamedTuple, Optional, Tuple
+from uuid import UUID
+from datetime import datetime, timezone, timedelta
+import logging
+
+from sqlmodel import Session, select, func
+from sqlalchemy import or_, and_, delete
+
+from model.listening_core.game_session import GameSession
+from model.listening_core.game_session_config import GameSessionConfig
+from model.listening_core.game_round import GameRound
+from model.listening_core.challenge import Challenge
+from model.listening_core.round_submission import RoundSubmission
+from model.listening_core.session_result_snapshot import SessionResultSnapshot
+from enums.listening_game import EvaluationStatus, GameStatus, GradingMode
+from service.listening_core.scoring import GradingInput, evaluate_submitted_answer, evaluate_submitted_answers_batch
+from service.listening_core.session_totals import add_to_session_totals
+from utils.config import settings
+from utils.errors import handle_db_error
+from utils.metrics import metrics
+from utils.scoring_errors import InvalidPayload, MisconfiguredChallenge, UnsupportedPlayMode
+from utils.usage import usage_context
+
+logger = logging.getLogger(__name__)
+
+FAILED_EVALUATION_FEEDBACK = "No se pudo evaluar la respuesta."
+
+PENDING_STATUSES = (EvaluationStatus.pending_evaluation, EvaluationStatus.evaluating)
+
+# Batches are graded once no more answers can arrive: the game completed or was cancelled
+FINISHED_SESSION_STATUSES = (GameStatus.completed, GameStatus.cancelled)
+
+# Errors that will not go away on retry
+PERMANENT_ERRORS = (InvalidPayload, MisconfiguredChallenge, UnsupportedPlayMode)
+
+
+class SessionBatch(NamedTuple):
+    """Submissions of one end_of_session game, claimed to be graded in a single LLM request."""
+    game_session_id: UUID
+    submission_ids: Tuple[UUID, ...]
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class SubmissionGradingService:
+    """
+    Scores submissions recorded as pending_evaluation.
+
+    The LLM call runs with no transaction open: the submission is claimed and
+    committed first, graded, and the result is written in a short transaction.
+    Sessions using GradingMode.end_of_session are graded as one batch per
+    session once they complete or are cancelled, instead of one request per submission.
+    """
+    def __init__(
+        self,
+        max_attempts: int = settings.GRADER_MAX_ATTEMPTS,
+        lease_seconds: int = settings.GRADER_LEASE_SECONDS,
+        batch_max_items: int = settings.GRADER_BATCH_MAX_ITEMS
+    ):
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.batch_max_items = max(1, batch_max_items)
+
+    def count_pending(self, game_session_id: UUID, db_session: Session) -> int:
+        return db_session.exec(
+            select(func.count())
+            .select_from(RoundSubmission)
+            .where(
+                RoundSubmission.game_session_id == game_session_id,
+                RoundSubmission.evaluation_status.in_(PENDING_STATUSES)
+            )
+        ).one()
+
+    def _claimable(self, now: datetime):
+        """Pending submissions, plus evaluating ones whose lease expired."""
+        lease_expired_before = now - timedelta(seconds=self.lease_seconds)
+        return or_(
+            RoundSubmission.evaluation_status == EvaluationStatus.pending_evaluation,
+            and_(
+                RoundSubmission.evaluation_status == EvaluationStatus.evaluating,
+                RoundSubmission.evaluation_started_at < lease_expired_before
+            )
+        )
+
+    def _mark_claimed(self, submissions: list[RoundSubmission], now: datetime, db_session: Session) -> None:
+        for submission in submissions:
+            submission.evaluation_status = EvaluationStatus.evaluating
+            submission.evaluation_started_at = now
+            submission.evaluation_attempts += 1
+            db_session.add(submission)
+
+    def claim_pending(self, limit: int, db_session: Session) -> list[UUID]:
+        """Claim submissions to grade one by one, oldest first. End-of-session games are left to claim_session_batches."""
+        now = datetime.now(timezone.utc)
+
+        statement = (
+            select(RoundSubmission)
+            .join(GameSessionConfig, GameSessionConfig.game_session_id == RoundSubmission.game_session_id)
+            .where(
+                self._claimable(now),
+                GameSessionConfig.grading_mode != GradingMode.end_of_session
+            )
+            .order_by(RoundSubmission.submitted_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=RoundSubmission)
+        )
+
+        try:
+            submissions = list(db_session.exec(statement).all())
+            self._mark_claimed(submissions, now, db_session)
+
+            db_session.commit()
+            return [submission.round_submission_id for submission in submissions]
+
+        except Exception as err:
+            db_session.rollback()
+            handle_db_error(err, "claim_pending", error_type="commit")
+
+    def claim_session_batches(self, limit: int, db_session: Session) -> list[SessionBatch]:
+        """
+        Claim the pending submissions of up to `limit` finished end_of_session games,
+        at most batch_max_items per game, oldest game first.
+        """
+        now = datetime.now(timezone.utc)
+
+        try:
+            session_ids = db_session.exec(
+                select(RoundSubmission.game_session_id)
+                .join(GameSessionConfig, GameSessionConfig.game_session_id == RoundSubmission.game_session_id)
+                .join(GameSession, GameSession.game_session_id == RoundSubmission.game_session_id)
+                .where(
+                    self._claimable(now),
+                    GameSessionConfig.grading_mode == GradingMode.end_of_session,
+                    GameSession.status.in_(FINISHED_SESSION_STATUSES)
+                )
+                .group_by(RoundSubmission.game_session_id)
+                .order_by(func.min(RoundSubmission.submitted_at))
+                .limit(limit)
+            ).all()
+
+            batches = []
+            for game_session_id in session_ids:
+                submissions = list(db_session.exec(
+                    select(RoundSubmission)
+                    .where(
+                        RoundSubmission.game_session_id == game_session_id,
+                        self._claimable(now)
+                    )
+                    .order_by(RoundSubmission.submitted_at)
+                    .limit(self.batch_max_items)
+                    .with_for_update(skip_locked=True)
+                ).all())
+
+                if submissions:
+                    self._mark_claimed(submissions, now, db_session)
+                    batches.append(SessionBatch(
+                        game_session_id,
+                        tuple(submission.round_submission_id for submission in submissions)
+                    ))
+
+            db_session.commit()
+            return batches
+
+        except Exception as err:
+            db_session.rollback()
+            handle_db_error(err, "claim_session_batches", error_type="commit")
+
+    def _load_grading_input(
+        self,
+        submission_id: UUID,
+        db_session: Session
+    ) -> Optional[GradingInput]:
+        submission = db_session.get(RoundSubmission, submission_id)
+        if not submission or submission.evaluation_status != EvaluationStatus.evaluating:
+            return None
+
+        game_round = db_session.get(GameRound, submission.game_round_id)
+        challenge = db_session.get(Challenge, game_round.challenge_id) if game_round.challenge_id else None
+
+        return GradingInput(
+            play_mode=game_round.play_mode,
+            answer_payload=submission.answer_payload or {},
+            challenge_metadata=(challenge.challenge_metadata or {}) if challenge else {},
+            max_score=game_round.max_score,
+            audio_text=challenge.audio_text if challenge else None
+        )
+
+    def _apply_score_change(self, game_session_id: UUID, score_delta: float, db_session: Session) -> None:
+        """
+        Move the session's running total by the change in a round score, and drop
+        any results snapshot so the next view rebuilds it.
+        """
+        add_to_session_totals(game_session_id, db_session, score_delta=score_delta)
+        db_session.exec(
+            delete(SessionResultSnapshot).where(SessionResultSnapshot.game_session_id == game_session_id)
+        )
+
+    def apply_result(
+        self,
+        submission: RoundSubmission,
+        score: float,
+        is_correct: bool,
+        feedback_short: str,
+        db_session: Session
+    ) -> None:
+        """Write a grade onto the submission and its round. The caller commits."""
+        now = datetime.now(timezone.utc)
+        game_round = db_session.get(GameRound, submission.game_round_id)
+
+        submission.is_correct = is_correct
+        submission.feedback_short = feedback_short
+        submission.evaluation_status = EvaluationStatus.evaluated
+        submission.evaluation_error = None
+        submission.evaluated_at = now
+        score_delta = score - (game_round.score or 0.0)
+        game_round.score = score
+
+        db_session.add(submission)
+        db_session.add(game_round)
+        db_session.flush()
+
+        self._apply_score_change(submission.game_session_id, score_delta, db_session)
+
+        metrics.observe("grading_latency_ms", (now - _as_utc(submission.submitted_at)).total_seconds() * 1000)
+        metrics.increment("submissions_graded_total", status=EvaluationStatus.evaluated.value)
+
+    def record_failure(self, submission: RoundSubmission, error: str, permanent: bool, db_session: Session) -> None:
+        """Put the submission back in the queue, or mark it failed once retries are exhausted. The caller commits."""
+        submission.evaluation_error = error
+
+        if not permanent and submission.evaluation_attempts < self.max_attempts:
+            submission.evaluation_status = EvaluationStatus.pending_evaluation
+            db_session.add(submission)
+            metrics.increment("submissions_grading_retried_total")
+            return
+
+        submission.evaluation_status = EvaluationStatus.failed
+        submission.feedback_short = FAILED_EVALUATION_FEEDBACK
+        submission.evaluated_at = datetime.now(timezone.utc)
+        db_session.add(submission)
+        metrics.increment("submissions_graded_total", status=EvaluationStatus.failed.value)
+
+    def _locked_submission(self, submission_id: UUID, db_session: Session) -> Optional[RoundSubmission]:
+        submission = db_session.exec(
+            select(RoundSubmission)
+            .where(RoundSubmission.round_submission_id == submission_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).first()
+
+        if not submission or submission.evaluation_status != EvaluationStatus.evaluating:
+            return None
+        return submission
+
+    def grade_submission(self, submission_id: UUID, db_session: Session) -> None:
+        """Grade one claimed submission."""
+        grading_input = self._load_grading_input(submission_id, db_session)
+        loaded = db_session.get(RoundSubmission, submission_id) if grading_input else None
+        game_session_id = loaded.game_session_id if loaded else None
+        # Release the connection before the (slow) LLM call
+        db_session.rollback()
+
+        if grading_input is None:
+            return
+
+        play_mode, answer_payload, challenge_metadata, max_score, audio_text = grading_input
+
+        try:
+            with usage_context(game_session_id=game_session_id, play_mode=play_mode):
+                score, is_correct, feedback_short = evaluate_submitted_answer(
+                    play_mode=play_mode,
+                    answer_payload=answer_payload,
+                    challenge_metadata=challenge_metadata,
+                    max_score=max_score,
+                    audio_text=audio_text
+                )
+            outcome = None
+        except Exception as err:
+            outcome = err
+
+        submission = self._locked_submission(submission_id, db_session)
+        if submission is None:
+            db_session.rollback()
+            return
+
+        if outcome is None:
+            self.apply_result(submission, score, is_correct, feedback_short, db_session)
+        else:
+            logger.warning(
+                f"Grading submission {submission_id} failed (attempt {submission.evaluation_attempts}): {outcome}"
+            )
+            self.record_failure(
+                submission,
+                str(outcome) or type(outcome).__name__,
+                permanent=isinstance(outcome, PERMANENT_ERRORS),
+                db_session=db_session
+            )
+
+        db_session.commit()
+
+    def grade_session_batch(self, batch: SessionBatch, db_session: Session) -> None:
+        """
+        Grade a claimed session batch with one LLM request and write every
+        result in a single transaction.
+        """
+        answers = {}
+        for submission_id in batch.submission_ids:
+            grading_input = self._load_grading_input(submission_id, db_session)
+            if grading_input is not None:
+                answers[str(submission_id)] = grading_input
+        # Release the connection before the (slow) LLM call
+        db_session.rollback()
+
+        if not answers:
+            return
+
+        with usage_context(game_session_id=batch.game_session_id):
+            outcomes = evaluate_submitted_answers_batch(answers)
+        metrics.observe("grading_batch_size", len(answers), buckets=(1, 2, 5, 10, 20, 50))
+
+        for item_id, outcome in outcomes.items():
+            submission = self._locked_submission(UUID(item_id), db_session)
+            if submission is None:
+                continue
+
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    f"Batch grading of submission {item_id} in session {batch.game_session_id} failed "
+                    f"(attempt {submission.evaluation_attempts}): {outcome}"
+                )
+                self.record_failure(
+                    submission,
+                    str(outcome) or type(outcome).__name__,
+                    permanent=isinstance(outcome, PERMANENT_ERRORS),
+                    db_session=db_session
+                )
+            else:
+                score, is_correct, feedback_short = outcome
+                self.apply_result(submission, score, is_correct, feedback_short, db_session)
+
+        db_session.commit()
@@ -0,0 +1,42 @@
+from typing import Sequence, Union
+from uuid import UUID
+
+from service.listening_core.grading import SessionBatch, SubmissionGradingService
+from service.listening_core.polling_worker import PollingWorker
+from utils.config import settings
+from utils.db import Session, engine
+
+
+class SubmissionGrader(PollingWorker):
+    """
+    Background grader: claims submissions pending evaluation and scores them in
+    parallel, one DB session per thread. Completed end_of_session games are
+    claimed as whole batches and graded with a single request each.
+
+    Runs either as a daemon thread inside the API process or in its own process
+    through `python -m jobs.submission_grader`.
+    """
+    name = "submission-grader"
+
+    def __init__(
+        self,
+        concurrency: int = settings.GRADER_CONCURRENCY,
+        poll_interval_seconds: float = settings.GRADER_POLL_INTERVAL_SECONDS,
+        grading_service: SubmissionGradingService | None = None
+    ):
+        super().__init__(concurrency, poll_interval_seconds)
+        self.grading_service = grading_service or SubmissionGradingService()
+
+    def claim(self, limit: int) -> Sequence[Union[SessionBatch, UUID]]:
+        with Session(engine) as db_session:
+            batches = self.grading_service.claim_session_batches(limit, db_session)
+            if len(batches) >= limit:
+                return batches
+            return [*batches, *self.grading_service.claim_pending(limit - len(batches), db_session)]
+
+    def process(self, item: Union[SessionBatch, UUID]) -> None:
+        with Session(engine) as db_session:
+            if isinstance(item, SessionBatch):
+                self.grading_service.grade_session_batch(item, db_session)
+            else:
+                self.grading_service.grade_submission(item, db_session)
@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
+import logging
+import os
+import socket
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class PollingWorker(ABC):
+    """
+    Base loop for DB-polling background workers.
+
+    Subclasses implement `claim` (take up to `limit` items, committing the claim)
+    and `process` (handle one item with its own DB session). Claimed items are
+    processed in parallel on a thread pool. The loop runs either on a daemon
+    thread inside the API process (`start`/`stop`) or in the foreground of a
+    dedicated process (`run_forever`).
+    """
+    name = "worker"
+
+    def __init__(self, concurrency: int, poll_interval_seconds: float):
+        self.concurrency = max(1, concurrency)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=self.name)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @abstractmethod
+    def claim(self, limit: int) -> Sequence[Any]:
+        ...
+
+    @abstractmethod
+    def process(self, item: Any) -> None:
+        ...
+
+    def _process_safely(self, item: Any) -> None:
+        try:
+            self.process(item)
+        except Exception:
+            # Bookkeeping itself failed; the claim lease hands the item to a worker again
+            logger.exception(f"{self.name}: processing {item} crashed")
+
+    def run_once(self) -> int:
+        """Claim one batch and process it in parallel. Returns the batch size."""
+        items = list(self.claim(self.concurrency))
+
+        if items:
+            list(self._executor.map(self._process_safely, items))
+
+        return len(items)
+
+    def run_forever(self) -> None:
+        logger.info(f"{self.name} {self.worker_id} started (concurrency={self.concurrency})")
+
+        while not self._stop_event.is_set():
+            try:
+                processed = self.run_once()
+            except Exception:
+                logger.exception(f"{self.name} loop failed; retrying after poll interval")
+                processed = 0
+
+            if processed == 0:
+                self._stop_event.wait(self.poll_interval_seconds)
+
+        logger.info(f"{self.name} {self.worker_id} stopped")
+
+    def start(self) -> None:
+        """Run the worker loop on a daemon thread (inline mode)."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run_forever, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
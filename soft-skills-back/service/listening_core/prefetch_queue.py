@@ -0,0 +1,263 @@
+from typing import Sequence, Dict, Any
+from uuid import UUID
+from datetime import datetime, timezone, timedelta
+import logging
+
+from sqlmodel import Session, select, func, update
+from sqlalchemy import or_, and_
+from sqlalchemy.exc import IntegrityError
+
+from model.listening_core.prefetch_job import PrefetchJob
+from enums.listening_game import PrefetchJobStatus
+from utils.config import settings
+from utils.errors import handle_db_error
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = (PrefetchJobStatus.queued, PrefetchJobStatus.running)
+
+# Finished without preparing the round; planning the round again re-queues the job.
+# Skipped jobs qualify too: a paused session skips its lookahead, and rounds below
+# current_round are never planned again
+REQUEUEABLE_STATUSES = (PrefetchJobStatus.failed, PrefetchJobStatus.skipped)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite hands back naive datetimes; treat them as UTC so they compare with aware ones."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _elapsed_ms(start: datetime, end: datetime) -> float:
+    return max(0.0, (_as_utc(end) - _as_utc(start)).total_seconds() * 1000)
+
+
+class PrefetchQueueService:
+    """
+    DB-backed queue of round preparation jobs.
+
+    One row per (session, round): enqueueing an existing job is a no-op unless it
+    previously failed or was skipped, in which case it is re-queued. Workers claim rows with
+    FOR UPDATE SKIP LOCKED so several workers never pick the same job.
+    """
+    def __init__(
+        self,
+        max_attempts: int = settings.PREFETCH_MAX_ATTEMPTS,
+        retry_backoff_seconds: float = settings.PREFETCH_RETRY_BACKOFF_SECONDS,
+        lease_seconds: int = settings.PREFETCH_JOB_LEASE_SECONDS
+    ):
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.lease_seconds = lease_seconds
+
+    def _get_jobs_for_rounds(
+        self,
+        game_session_id: UUID,
+        round_numbers: Sequence[int],
+        db_session: Session
+    ) -> Dict[int, PrefetchJob]:
+        statement = select(PrefetchJob).where(
+            PrefetchJob.game_session_id == game_session_id,
+            PrefetchJob.round_number.in_(round_numbers)
+        )
+        return {job.round_number: job for job in db_session.exec(statement).all()}
+
+    def _requeue(self, job: PrefetchJob, now: datetime) -> None:
+        job.status = PrefetchJobStatus.queued
+        job.attempts = 0
+        job.enqueued_at = now
+        job.available_at = now
+        job.started_at = None
+        job.finished_at = None
+        job.worker_id = None
+
+    def enqueue_rounds(
+        self,
+        game_session_id: UUID,
+        user_id: UUID,
+        round_numbers: Sequence[int],
+        db_session: Session
+    ) -> list[PrefetchJob]:
+        """Enqueue preparation of the given rounds, deduplicated per (session, round)."""
+        if not round_numbers:
+            return []
+
+        try:
+            now = datetime.now(timezone.utc)
+            existing_jobs = self._get_jobs_for_rounds(game_session_id, round_numbers, db_session)
+            jobs = []
+
+            for round_number in round_numbers:
+                job = existing_jobs.get(round_number)
+
+                if job is None:
+                    job = PrefetchJob(
+                        game_session_id=game_session_id,
+                        user_id=user_id,
+                        round_number=round_number,
+                        enqueued_at=now,
+                        available_at=now
+                    )
+                    try:
+                        with db_session.begin_nested():
+                            db_session.add(job)
+                        metrics.increment("prefetch_jobs_enqueued_total")
+                    except IntegrityError:
+                        # A concurrent request enqueued the same round first
+                        job = self._get_jobs_for_rounds(game_session_id, [round_number], db_session)[round_number]
+                        metrics.increment("prefetch_jobs_deduplicated_total")
+
+                elif job.status in REQUEUEABLE_STATUSES:
+                    self._requeue(job, now)
+                    db_session.add(job)
+                    metrics.increment("prefetch_jobs_enqueued_total")
+
+                else:
+                    metrics.increment("prefetch_jobs_deduplicated_total")
+
+                jobs.append(job)
+
+            db_session.commit()
+            return jobs
+
+        except Exception as err:
+            db_session.rollback()
+            handle_db_error(err, "enqueue_rounds", error_type="commit")
+
+    def claim_jobs(self, limit: int, worker_id: str, db_session: Session) -> list[PrefetchJob]:
+        """
+        Claim up to `limit` runnable jobs: queued jobs whose retry delay has elapsed,
+        plus running jobs whose lease expired (their worker died mid-job). Expired
+        jobs that have used all their attempts are marked failed instead, so a job
+        that keeps killing its worker is not leased forever.
+        """
+        now = datetime.now(timezone.utc)
+        lease_expired_before = now - timedelta(seconds=self.lease_seconds)
+
+        exhausted_statement = (
+            update(PrefetchJob)
+            .where(
+                PrefetchJob.status == PrefetchJobStatus.running,
+                PrefetchJob.started_at < lease_expired_before,
+                PrefetchJob.attempts >= self.max_attempts
+            )
+            .values(
+                status=PrefetchJobStatus.failed,
+                finished_at=now,
+                worker_id=None,
+                last_error="Lease expired on the last attempt"
+            )
+        )
+
+        statement = (
+            select(PrefetchJob)
+            .where(
+                or_(
+                    and_(
+                        PrefetchJob.status == PrefetchJobStatus.queued,
+                        PrefetchJob.available_at <= now
+                    ),
+                    and_(
+                        PrefetchJob.status == PrefetchJobStatus.running,
+                        PrefetchJob.started_at < lease_expired_before,
+                        PrefetchJob.attempts < self.max_attempts
+                    )
+                )
+            )
+            .order_by(PrefetchJob.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        try:
+            exhausted = db_session.exec(exhausted_statement).rowcount
+            if exhausted:
+                metrics.increment("prefetch_jobs_finished_total", exhausted, status=PrefetchJobStatus.failed.value)
+
+            jobs = list(db_session.exec(statement).all())
+
+            for job in jobs:
+                metrics.observe("prefetch_queue_lag_ms", _elapsed_ms(job.available_at, now))
+                job.status = PrefetchJobStatus.running
+                job.attempts += 1
+                job.started_at = now
+                job.finished_at = None
+                job.worker_id = worker_id
+                db_session.add(job)
+
+            db_session.commit()
+            return jobs
+
+        except Exception as err:
+            db_session.rollback()
+            handle_db_error(err, "claim_jobs", error_type="commit")
+
+    def _finish(self, job: PrefetchJob, status: PrefetchJobStatus, db_session: Session) -> None:
+        now = datetime.now(timezone.utc)
+        job.status = status
+        job.finished_at = now
+        db_session.add(job)
+        db_session.commit()
+
+        if job.started_at:
+            metrics.observe("prefetch_preparation_ms", _elapsed_ms(job.started_at, now), status=status.value)
+        metrics.increment("prefetch_jobs_finished_total", status=status.value)
+
+    def mark_succeeded(self, job: PrefetchJob, db_session: Session) -> None:
+        job.last_error = None
+        self._finish(job, PrefetchJobStatus.succeeded, db_session)
+
+    def mark_skipped(self, job: PrefetchJob, reason: str, db_session: Session) -> None:
+        job.last_error = reason
+        self._finish(job, PrefetchJobStatus.skipped, db_session)
+
+    def mark_failed(self, job: PrefetchJob, error: str, db_session: Session) -> None:
+        """Record the failure and schedule a retry with linear backoff until attempts run out."""
+        job.last_error = error
+
+        if job.attempts < self.max_attempts:
+            now = datetime.now(timezone.utc)
+            job.status = PrefetchJobStatus.queued
+            job.available_at = now + timedelta(seconds=self.retry_backoff_seconds * job.attempts)
+            job.worker_id = None
+            db_session.add(job)
+            db_session.commit()
+
+            if job.started_at:
+                metrics.observe("prefetch_preparation_ms", _elapsed_ms(job.started_at, now), status="retry")
+            metrics.increment("prefetch_jobs_retried_total")
+            return
+
+        self._finish(job, PrefetchJobStatus.failed, db_session)
+
+    def list_jobs(self, game_session_id: UUID, db_session: Session) -> Sequence[PrefetchJob]:
+        statement = (
+            select(PrefetchJob)
+            .where(PrefetchJob.game_session_id == game_session_id)
+            .order_by(PrefetchJob.round_number)
+        )
+        return db_session.exec(statement).all()
+
+    def get_queue_stats(self, db_session: Session) -> Dict[str, Any]:
+        """Job counts per status and the age of the oldest runnable job, read from the table."""
+        status_rows = db_session.exec(
+            select(PrefetchJob.status, func.count()).group_by(PrefetchJob.status)
+        ).all()
+        counts = {status.value: 0 for status in PrefetchJobStatus}
+        for status, count in status_rows:
+            counts[PrefetchJobStatus(status).value] = count
+
+        oldest_available_at = db_session.exec(
+            select(func.min(PrefetchJob.available_at)).where(PrefetchJob.status == PrefetchJobStatus.queued)
+        ).one()
+
+        oldest_queued_ms = None
+        if oldest_available_at is not None:
+            oldest_queued_ms = _elapsed_ms(oldest_available_at, datetime.now(timezone.utc))
+
+        return {
+            "counts": counts,
+            "oldest_queued_ms": round(oldest_queued_ms, 1) if oldest_queued_ms is not None else None
+        }
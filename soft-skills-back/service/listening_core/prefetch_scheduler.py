@@ -0,0 +1,195 @@
+from typing import Sequence
+from uuid import UUID
+import logging
+import math
+import threading
+import time
+
+from sqlmodel import Session, select, func
+
+from model.listening_core.game_session import GameSession
+from model.listening_core.game_session_config import GameSessionConfig
+from model.listening_core.prefetch_job import PrefetchJob
+from model.listening_core.round_submission import RoundSubmission
+from enums.listening_game import GameStatus, PlayMode, PrefetchJobStatus
+from service.listening_core.prefetch_queue import PrefetchQueueService, ACTIVE_STATUSES, REQUEUEABLE_STATUSES
+from utils.config import settings
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+LOOKAHEAD_BUCKETS = (0, 1, 2, 3, 4, 5, 6, 8)
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(round(fraction * (len(ordered) - 1)))]
+
+
+class LookaheadScheduler:
+    """
+    Decides how many rounds ahead of the player to prepare.
+
+    The lookahead is the number of rounds the player gets through while one round
+    is being prepared: preparation latency (p75 of recent jobs, with a safety
+    factor) divided by the expected time per round. Time per round comes from the
+    player's recent `client_elapsed_ms`, capped by the session's response time
+    limits, which are also the fallback before the first submission. New jobs are
+    subject to per-user and global caps on outstanding (queued or running) jobs.
+    """
+    def __init__(self, queue_service: PrefetchQueueService | None = None):
+        self.queue_service = queue_service or PrefetchQueueService()
+        self._latency_lock = threading.Lock()
+        self._cached_preparation_ms: float | None = None
+        self._latency_expires_at = 0.0
+
+    def _time_limit_round_ms(self, config: GameSessionConfig) -> float | None:
+        """Average response time limit (seconds in the config) over the selected modes."""
+        limits = config.response_time_limits or {}
+        mode_keys = [PlayMode(mode).value for mode in config.selected_modes or []]
+        mode_limits = [limits[mode_key] for mode_key in mode_keys if mode_key in limits]
+        if not mode_limits:
+            return None
+        return sum(mode_limits) / len(mode_limits) * 1000
+
+    def _observed_round_ms(self, game_session_id: UUID, db_session: Session) -> float | None:
+        statement = (
+            select(RoundSubmission.client_elapsed_ms)
+            .where(
+                RoundSubmission.game_session_id == game_session_id,
+                RoundSubmission.client_elapsed_ms.is_not(None)
+            )
+            .order_by(RoundSubmission.submitted_at.desc())
+            .limit(settings.PREFETCH_PACE_SAMPLE_SIZE)
+        )
+        samples = [elapsed_ms for elapsed_ms in db_session.exec(statement).all() if elapsed_ms > 0]
+        if not samples:
+            return None
+        return _percentile(samples, 0.5)
+
+    def estimate_round_ms(self, game_session_id: UUID, config: GameSessionConfig, db_session: Session) -> float:
+        """Expected time the player spends on one round."""
+        limit_ms = self._time_limit_round_ms(config)
+        observed_ms = self._observed_round_ms(game_session_id, db_session)
+
+        if observed_ms is not None and limit_ms is not None:
+            return min(observed_ms, limit_ms)
+        if observed_ms is not None:
+            return observed_ms
+        if limit_ms is not None:
+            return limit_ms
+        return settings.PREFETCH_DEFAULT_ROUND_MS
+
+    def _load_preparation_ms(self, db_session: Session) -> float:
+        statement = (
+            select(PrefetchJob.started_at, PrefetchJob.finished_at)
+            .where(
+                PrefetchJob.status == PrefetchJobStatus.succeeded,
+                PrefetchJob.started_at.is_not(None),
+                PrefetchJob.finished_at.is_not(None)
+            )
+            .order_by(PrefetchJob.finished_at.desc())
+            .limit(settings.PREFETCH_LATENCY_SAMPLE_SIZE)
+        )
+        durations = [
+            (finished_at - started_at).total_seconds() * 1000
+            for started_at, finished_at in db_session.exec(statement).all()
+        ]
+        if not durations:
+            return settings.PREFETCH_DEFAULT_PREPARATION_MS
+        return _percentile(durations, 0.75)
+
+    def estimate_preparation_ms(self, db_session: Session) -> float:
+        """Recent round preparation latency, refreshed from the job table at most every 30s."""
+        with self._latency_lock:
+            if self._cached_preparation_ms is not None and time.monotonic() < self._latency_expires_at:
+                return self._cached_preparation_ms
+
+        preparation_ms = self._load_preparation_ms(db_session)
+
+        with self._latency_lock:
+            self._cached_preparation_ms = preparation_ms
+            self._latency_expires_at = time.monotonic() + 30
+        return preparation_ms
+
+    def compute_lookahead(self, round_ms: float, preparation_ms: float) -> int:
+        rounds = math.ceil(preparation_ms * settings.PREFETCH_LATENCY_SAFETY_FACTOR / max(round_ms, 1.0))
+        return max(1, min(settings.PREFETCH_MAX_LOOKAHEAD, rounds))
+
+    def _count_outstanding(self, db_session: Session, user_id: UUID | None = None) -> int:
+        statement = select(func.count()).select_from(PrefetchJob).where(PrefetchJob.status.in_(ACTIVE_STATUSES))
+        if user_id is not None:
+            statement = statement.where(PrefetchJob.user_id == user_id)
+        return db_session.exec(statement).one()
+
+    def _apply_caps(self, rounds: list[int], user_id: UUID, game_session_id: UUID, db_session: Session) -> list[int]:
+        """Drop rounds whose job is live or done, then trim the rest to the remaining capacity."""
+        if not rounds:
+            return []
+
+        existing = db_session.exec(
+            select(PrefetchJob.round_number, PrefetchJob.status).where(
+                PrefetchJob.game_session_id == game_session_id,
+                PrefetchJob.round_number.in_(rounds)
+            )
+        ).all()
+        already_handled = {
+            round_number for round_number, status in existing
+            if PrefetchJobStatus(status) not in REQUEUEABLE_STATUSES
+        }
+        new_rounds = [round_number for round_number in rounds if round_number not in already_handled]
+        if not new_rounds:
+            return []
+
+        capacity = min(
+            settings.PREFETCH_MAX_OUTSTANDING_PER_USER - self._count_outstanding(db_session, user_id),
+            settings.PREFETCH_MAX_OUTSTANDING_GLOBAL - self._count_outstanding(db_session)
+        )
+        capacity = max(0, capacity)
+
+        if capacity < len(new_rounds):
+            metrics.increment("prefetch_rounds_capped_total", len(new_rounds) - capacity)
+        return new_rounds[:capacity]
+
+    def plan_rounds(
+        self,
+        game_session: GameSession,
+        config: GameSessionConfig,
+        db_session: Session,
+        include_current: bool = False
+    ) -> list[int]:
+        """Rounds to prepare now, nearest first, before caps are applied."""
+        round_ms = self.estimate_round_ms(game_session.game_session_id, config, db_session)
+        preparation_ms = self.estimate_preparation_ms(db_session)
+        lookahead = self.compute_lookahead(round_ms, preparation_ms)
+        metrics.observe("prefetch_lookahead_rounds", lookahead, buckets=LOOKAHEAD_BUCKETS)
+
+        current_round = game_session.current_round
+        first_round = current_round if include_current else current_round + 1
+        last_round = min(config.total_rounds, current_round + lookahead)
+
+        return list(range(first_round, last_round + 1))
+
+    def schedule(
+        self,
+        game_session_id: UUID,
+        user_id: UUID,
+        db_session: Session,
+        include_current: bool = False
+    ) -> list[int]:
+        """Best-effort: enqueue the planned rounds that fit under the caps. Never fails the request."""
+        try:
+            game_session = db_session.get(GameSession, game_session_id)
+            config = db_session.get(GameSessionConfig, game_session_id)
+            if not game_session or not config or game_session.status != GameStatus.in_progress:
+                return []
+
+            planned_rounds = self.plan_rounds(game_session, config, db_session, include_current)
+            rounds = self._apply_caps(planned_rounds, user_id, game_session_id, db_session)
+            self.queue_service.enqueue_rounds(game_session_id, user_id, rounds, db_session)
+            return rounds
+
+        except Exception as err:
+            db_session.rollback()
+            logger.warning(f"Could not schedule prefetch for session {game_session_id}: {err}")
+            return []
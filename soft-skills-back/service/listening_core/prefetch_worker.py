@@ -0,0 +1,92 @@
+from typing import Sequence
+from uuid import UUID
+import logging
+
+from model.listening_core.game_session import GameSession
+from model.listening_core.game_session_config import GameSessionConfig
+from model.listening_core.prefetch_job import PrefetchJob
+from enums.listening_game import GameStatus
+from service.listening_core.game_round import GameRoundService
+from service.listening_core.polling_worker import PollingWorker
+from service.listening_core.prefetch_queue import PrefetchQueueService
+from utils.config import settings
+from utils.db import Session, engine
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchWorker(PollingWorker):
+    """
+    Drains the prefetch queue: claims a batch of jobs and prepares their rounds
+    in parallel, one DB session per thread.
+
+    Runs either as a daemon thread inside the API process or in its own process
+    through `python -m jobs.prefetch_worker`.
+    """
+    name = "prefetch-worker"
+
+    def __init__(
+        self,
+        concurrency: int = settings.PREFETCH_WORKER_CONCURRENCY,
+        poll_interval_seconds: float = settings.PREFETCH_POLL_INTERVAL_SECONDS,
+        queue_service: PrefetchQueueService | None = None,
+        round_service: GameRoundService | None = None
+    ):
+        super().__init__(concurrency, poll_interval_seconds)
+        self.queue_service = queue_service or PrefetchQueueService()
+        self.round_service = round_service or GameRoundService()
+
+    def _skip_reason(
+        self,
+        job: PrefetchJob,
+        game_session: GameSession | None,
+        config: GameSessionConfig | None
+    ) -> str | None:
+        if not game_session or game_session.status != GameStatus.in_progress:
+            return "Session is not in progress"
+        if not config:
+            return "Session has no config"
+        if job.round_number < game_session.current_round:
+            return "Round already played"
+        if job.round_number > config.total_rounds:
+            return "Round is beyond the configured total"
+        return None
+
+    def claim(self, limit: int) -> Sequence[UUID]:
+        with Session(engine) as db_session:
+            jobs = self.queue_service.claim_jobs(limit, self.worker_id, db_session)
+            return [job.prefetch_job_id for job in jobs]
+
+    def process(self, job_id: UUID) -> None:
+        with Session(engine) as db_session:
+            job = db_session.get(PrefetchJob, job_id)
+            if not job:
+                return
+
+            game_session = db_session.get(GameSession, job.game_session_id)
+            config = db_session.get(GameSessionConfig, job.game_session_id)
+
+            skip_reason = self._skip_reason(job, game_session, config)
+            if skip_reason:
+                self.queue_service.mark_skipped(job, skip_reason, db_session)
+                return
+
+            try:
+                self.round_service.prepare_or_get_round(
+                    job.round_number,
+                    game_session,
+                    config,
+                    db_session=db_session
+                )
+            except Exception as err:
+                db_session.rollback()
+                logger.warning(
+                    f"Prefetch of round {job.round_number} for session {job.game_session_id} failed "
+                    f"(attempt {job.attempts}): {err}"
+                )
+                job = db_session.get(PrefetchJob, job_id)
+                self.queue_service.mark_failed(job, str(err) or type(err).__name__, db_session)
+                return
+
+            job = db_session.get(PrefetchJob, job_id)
+            self.queue_service.mark_succeeded(job, db_session)
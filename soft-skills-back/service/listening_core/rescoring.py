@@ -0,0 +1,307 @@
+"""
+Bulk re-scoring of past submissions after an answer key or a scoring rule changes.
+
+Submissions are read in batches with a keyset query, ordered by challenge, so
+each challenge's key is compiled once from its current metadata and no read
+transaction stays open between batches. Focus and cloze answers are re-scored
+in the job; clarify, summarize and paraphrase answers are put back in the
+grading queue in small chunks spaced to the requeue rate and re-graded by the
+grader worker, which keeps LLM traffic within its usual concurrency.
+
+Each batch is written with executemany UPDATEs in one transaction: changed
+submissions and round scores, stale stored answer keys, the sessions' running
+totals and their results snapshots. Requeue chunks commit on their own, and
+the job sleeps between them with no transaction open. The last written
+position is reported after every batch so an interrupted run can resume.
+
+Rounds are assumed not to be graded concurrently with the run; if one is,
+jobs.check_session_totals repairs the totals afterwards.
+"""
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, tuple_
+from sqlmodel import Session, select, update
+
+from model.listening_core.challenge import Challenge
+from model.listening_core.game_round import GameRound
+from model.listening_core.round_submission import RoundSubmission
+from model.listening_core.session_result_snapshot import SessionResultSnapshot
+from enums.listening_game import EvaluationStatus, PlayMode
+from service.listening_core.scoring import OPEN_ENDED_PLAY_MODES, compile_answer_key, evaluate_submitted_answer
+from service.listening_core.session_totals import add_score_deltas_to_sessions
+from utils.db import engine
+from utils.errors import handle_db_error
+from utils.metrics import metrics
+from utils.scoring_errors import InvalidPayload, MisconfiguredChallenge, UnsupportedPlayMode
+
+logger = logging.getLogger(__name__)
+
+DETERMINISTIC_PLAY_MODES = (PlayMode.focus, PlayMode.cloze)
+
+# Pending submissions are left to the grader; their score is not final yet
+RESCORABLE_STATUSES = (EvaluationStatus.evaluated, EvaluationStatus.failed)
+
+SCORING_ERRORS = (InvalidPayload, MisconfiguredChallenge, UnsupportedPlayMode)
+
+
+class RescoreCheckpoint(NamedTuple):
+    """Position of the last submission written; submissions are read in this order."""
+    challenge_id: UUID
+    round_submission_id: UUID
+
+
+class RateLimiter:
+    """Spaces out requeued submissions so they reach the grader at most `per_minute` per minute."""
+
+    def __init__(self, per_minute: float):
+        self.seconds_per_item = 60.0 / per_minute
+        # About one second's worth of items per chunk, so the grader sees a steady rate
+        self.chunk_size = max(1, int(per_minute // 60))
+        self._next_allowed = time.monotonic()
+
+    def wait(self, count: int) -> None:
+        now = time.monotonic()
+        if self._next_allowed > now:
+            time.sleep(self._next_allowed - now)
+        self._next_allowed = max(now, self._next_allowed) + count * self.seconds_per_item
+
+
+def _batch_statement(
+    play_modes: Sequence[PlayMode],
+    challenge_ids: Optional[Sequence[UUID]],
+    resume_after: Optional[RescoreCheckpoint],
+    batch_size: int
+):
+    statement = (
+        select(
+            RoundSubmission.round_submission_id,
+            RoundSubmission.game_session_id,
+            RoundSubmission.game_round_id,
+            RoundSubmission.play_mode,
+            RoundSubmission.answer_payload,
+            RoundSubmission.evaluation_status,
+            RoundSubmission.is_correct,
+            RoundSubmission.feedback_short,
+            GameRound.challenge_id,
+            GameRound.score,
+            GameRound.max_score
+        )
+        .join(GameRound, GameRound.game_round_id == RoundSubmission.game_round_id)
+        .where(
+            RoundSubmission.play_mode.in_(play_modes),
+            RoundSubmission.evaluation_status.in_(RESCORABLE_STATUSES),
+            GameRound.challenge_id.is_not(None)
+        )
+        .order_by(GameRound.challenge_id, RoundSubmission.round_submission_id)
+        .limit(batch_size)
+    )
+
+    if challenge_ids:
+        statement = statement.where(GameRound.challenge_id.in_(challenge_ids))
+    if resume_after is not None:
+        statement = statement.where(
+            tuple_(GameRound.challenge_id, RoundSubmission.round_submission_id) > tuple_(*resume_after)
+        )
+
+    return statement
+
+
+def _load_challenges(challenge_ids: List[UUID], db_session: Session) -> Dict[UUID, Any]:
+    rows = db_session.exec(
+        select(Challenge.challenge_id, Challenge.play_mode, Challenge.challenge_metadata, Challenge.answer_key)
+        .where(Challenge.challenge_id.in_(challenge_ids))
+    ).all()
+    return {row.challenge_id: row for row in rows}
+
+
+def _compile_key(challenge: Any) -> Optional[Dict[str, Any]]:
+    try:
+        return compile_answer_key(challenge.play_mode, challenge.challenge_metadata or {})
+    except MisconfiguredChallenge as err:
+        logger.warning(f"Cannot re-score challenge {challenge.challenge_id}: {err}")
+        return None
+
+
+def _write_batch(
+    submission_updates: List[Dict[str, Any]],
+    round_updates: List[Dict[str, Any]],
+    key_updates: List[Dict[str, Any]],
+    score_deltas: Dict[UUID, float],
+    db_session: Session
+) -> None:
+    """Write one batch with executemany UPDATEs by primary key, in one transaction."""
+    try:
+        if submission_updates:
+            db_session.exec(update(RoundSubmission), params=submission_updates)
+            db_session.exec(update(GameRound), params=round_updates)
+
+        if key_updates:
+            db_session.exec(update(Challenge), params=key_updates)
+
+        add_score_deltas_to_sessions(
+            {game_session_id: delta for game_session_id, delta in score_deltas.items() if delta},
+            db_session
+        )
+        # Feedback can change without the score, so every touched session is snapshotted again
+        if score_deltas:
+            db_session.exec(
+                delete(SessionResultSnapshot)
+                .where(SessionResultSnapshot.game_session_id.in_(list(score_deltas)))
+            )
+
+        db_session.commit()
+
+    except Exception as err:
+        db_session.rollback()
+        handle_db_error(err, "rescore_submissions", error_type="commit")
+
+
+def _requeue(requeue_ids: List[UUID], rate_limiter: RateLimiter, db_session: Session) -> None:
+    """Put submissions back in the grading queue one rate-sized chunk at a time, each in its own transaction."""
+    for start in range(0, len(requeue_ids), rate_limiter.chunk_size):
+        chunk = requeue_ids[start:start + rate_limiter.chunk_size]
+        rate_limiter.wait(len(chunk))
+
+        try:
+            db_session.exec(
+                update(RoundSubmission)
+                .where(
+                    RoundSubmission.round_submission_id.in_(chunk),
+                    RoundSubmission.evaluation_status.in_(RESCORABLE_STATUSES)
+                )
+                .values(
+                    evaluation_status=EvaluationStatus.pending_evaluation,
+                    evaluation_attempts=0,
+                    evaluation_error=None,
+                    evaluation_started_at=None
+                )
+            )
+            db_session.commit()
+
+        except Exception as err:
+            db_session.rollback()
+            handle_db_error(err, "rescore_submissions", error_type="commit")
+
+
+def rescore_submissions(
+    play_modes: Sequence[PlayMode] = DETERMINISTIC_PLAY_MODES,
+    challenge_ids: Optional[Sequence[UUID]] = None,
+    batch_size: int = 1000,
+    requeue_per_minute: float = 60.0,
+    dry_run: bool = False,
+    resume_after: Optional[RescoreCheckpoint] = None,
+    on_checkpoint: Optional[Callable[[RescoreCheckpoint, Dict[str, int]], None]] = None
+) -> Dict[str, int]:
+    """
+    Re-score evaluated (and failed) submissions of the given play modes. With
+    dry_run=True nothing is written and the counts say what would change.
+    on_checkpoint is called after each batch commits.
+    """
+    counts = {"scanned": 0, "changed": 0, "unchanged": 0, "failed": 0, "requeued": 0, "keys_updated": 0}
+    rate_limiter = RateLimiter(requeue_per_minute)
+    compiled_keys: Dict[UUID, Optional[Dict[str, Any]]] = {}
+
+    with Session(engine) as db_session:
+        while True:
+            try:
+                rows = db_session.exec(_batch_statement(play_modes, challenge_ids, resume_after, batch_size)).all()
+            except Exception as err:
+                handle_db_error(err, "rescore_submissions", error_type="query")
+
+            if not rows:
+                break
+
+            now = datetime.now(timezone.utc)
+            submission_updates = []
+            round_updates = []
+            key_updates = []
+            requeue_ids = []
+            score_deltas: Dict[UUID, float] = {}
+
+            # A challenge's submissions can span batches, so its key is kept until they end
+            batch_challenge_ids = {row.challenge_id for row in rows}
+            compiled_keys = {
+                challenge_id: answer_key
+                for challenge_id, answer_key in compiled_keys.items()
+                if challenge_id in batch_challenge_ids
+            }
+            missing_ids = [challenge_id for challenge_id in batch_challenge_ids if challenge_id not in compiled_keys]
+
+            for challenge_id, challenge in (_load_challenges(missing_ids, db_session) if missing_ids else {}).items():
+                answer_key = None if challenge.play_mode in OPEN_ENDED_PLAY_MODES else _compile_key(challenge)
+                compiled_keys[challenge_id] = answer_key
+
+                if answer_key is not None and answer_key != challenge.answer_key:
+                    key_updates.append({"challenge_id": challenge_id, "answer_key": answer_key})
+
+            for row in rows:
+                counts["scanned"] += 1
+
+                if row.play_mode in OPEN_ENDED_PLAY_MODES:
+                    requeue_ids.append(row.round_submission_id)
+                    continue
+
+                answer_key = compiled_keys.get(row.challenge_id)
+                if answer_key is None:
+                    counts["failed"] += 1
+                    continue
+
+                try:
+                    score, is_correct, feedback_short = evaluate_submitted_answer(
+                        play_mode=row.play_mode,
+                        answer_payload=row.answer_payload or {},
+                        challenge_metadata={},
+                        max_score=row.max_score,
+                        answer_key=answer_key
+                    )
+                except SCORING_ERRORS as err:
+                    counts["failed"] += 1
+                    logger.warning(f"Cannot re-score submission {row.round_submission_id}: {err}")
+                    continue
+
+                previous_score = row.score or 0.0
+                if (
+                    score == previous_score and is_correct == row.is_correct and
+                    feedback_short == row.feedback_short and row.evaluation_status == EvaluationStatus.evaluated
+                ):
+                    counts["unchanged"] += 1
+                    continue
+
+                counts["changed"] += 1
+                submission_updates.append({
+                    "round_submission_id": row.round_submission_id,
+                    "is_correct": is_correct,
+                    "feedback_short": feedback_short,
+                    "evaluation_status": EvaluationStatus.evaluated,
+                    "evaluation_error": None,
+                    "evaluated_at": now
+                })
+                round_updates.append({"game_round_id": row.game_round_id, "score": score})
+                score_deltas[row.game_session_id] = score_deltas.get(row.game_session_id, 0.0) + score - previous_score
+
+            counts["keys_updated"] += len(key_updates)
+            counts["requeued"] += len(requeue_ids)
+
+            labels = {"dry_run": str(dry_run).lower()}
+            metrics.increment("rescored_submissions_total", len(submission_updates), outcome="changed", **labels)
+            metrics.increment("rescored_submissions_total", len(requeue_ids), outcome="requeued", **labels)
+
+            resume_after = RescoreCheckpoint(rows[-1].challenge_id, rows[-1].round_submission_id)
+
+            if dry_run:
+                # End the read transaction; nothing is written
+                db_session.rollback()
+            else:
+                _write_batch(submission_updates, round_updates, key_updates, score_deltas, db_session)
+                _requeue(requeue_ids, rate_limiter, db_session)
+
+                if on_checkpoint is not None:
+                    on_checkpoint(resume_after, dict(counts))
+
+            logger.info(f"Re-scoring progress: {counts}")
+
+    return counts
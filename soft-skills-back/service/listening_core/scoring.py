@@ -1,7 +1,8 @@
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List, NamedTuple, Optional, Union
 import unicodedata
 import re
 
+import numpy as np
 from pydantic import ValidationError
 
 from enums.listening_game import PlayMode
@@ -10,6 +11,7 @@ from schema.listening_core.scoring import (
     FocusMultipleChoice,
     ClozeAnswerPayload,
     ClozeSpec,
+    CompiledAnswerKey,
     ClarifyAnswerPayload,
     ClarifySpec,
     SummarizeAnswerPayload,
@@ -17,10 +19,39 @@ from schema.listening_core.scoring import (
     ParaphraseAnswerPayload,
     ParaphraseSpec
 )
-from llm.challenge_evaluation import evaluate_clarify_questions, evaluate_summarize_answer, evaluate_paraphrase_answer
-from llm.schemas import ClarifyEvaluationResponse, SummarizeEvaluationResponse, ParaphraseEvaluationResponse
+from llm.challenge_evaluation import (
+    evaluate_clarify_questions,
+    evaluate_summarize_answer,
+    evaluate_paraphrase_answer,
+    evaluate_batch
+)
+from llm.schemas import (
+    ClarifyEvaluationResponse,
+    SummarizeEvaluationResponse,
+    ParaphraseEvaluationResponse,
+    BatchEvaluationItem
+)
 from utils.scoring_errors import InvalidPayload, MisconfiguredChallenge, UnsupportedPlayMode
 from utils.errors import APIException
+from utils.config import settings
+from utils.metrics import metrics
+
+# Modes graded by the LLM; these can be deferred to the background grader
+OPEN_ENDED_PLAY_MODES = frozenset({PlayMode.clarify, PlayMode.summarize, PlayMode.paraphrase})
+
+# Bump when normalize_text or the key layout changes; the backfill job recompiles older keys
+ANSWER_KEY_VERSION = 1
+
+LEXICAL_NGRAM_SIZES = (3, 4, 5)
+LEXICAL_SIMILARITY_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95)
+SENTENCE_BOUNDARY = re.compile(r'[.!?;:\n]+')
+NON_WORD = re.compile(r'[^\w\s]')
+# Verdicts the rubric scores 0; in enforce mode these answers are not sent to the LLM
+LEXICAL_ZERO_VERDICTS = ("too_short", "copied", "off_topic")
+
+
+def is_open_ended(play_mode: PlayMode) -> bool:
+    return play_mode in OPEN_ENDED_PLAY_MODES
 
 
 def normalize_text(text: str) -> str:
@@ -43,37 +74,274 @@ def normalize_text(text: str) -> str:
     return text.strip()
 
 
+def compile_answer_key(play_mode: PlayMode, challenge_metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Validate and normalize the answer key of a focus or cloze challenge once,
+    so scoring a submission is a direct comparison. Returns None for other modes.
+    """
+    if play_mode == PlayMode.focus:
+        try:
+            spec = FocusMultipleChoice.model_validate(challenge_metadata)
+        except ValidationError as e:
+            raise MisconfiguredChallenge(f"Metadatos de desafío inválidos: {e}")
+        
+        correct_answer = normalize_text(spec.correct_answer)
+        answer_key = CompiledAnswerKey(
+            version=ANSWER_KEY_VERSION,
+            choice_count=len(spec.answer_choices),
+            correct_indices=[
+                index for index, choice in enumerate(spec.answer_choices)
+                if normalize_text(choice) == correct_answer
+            ]
+        )
+    
+    elif play_mode == PlayMode.cloze:
+        try:
+            spec = ClozeSpec.model_validate(challenge_metadata)
+        except ValidationError as e:
+            raise MisconfiguredChallenge(f"Metadatos de desafío inválidos: {e}")
+        
+        answer_key = CompiledAnswerKey(
+            version=ANSWER_KEY_VERSION,
+            normalized_answers=[normalize_text(answer) for answer in spec.answers]
+        )
+    
+    else:
+        return None
+    
+    return answer_key.model_dump()
+
+
+def _resolve_answer_key(
+    play_mode: PlayMode,
+    answer_key: Optional[Dict[str, Any]],
+    challenge_metadata: Dict[str, Any]
+) -> CompiledAnswerKey:
+    """Use the stored key when it is current; otherwise compile it from the metadata."""
+    if answer_key and answer_key.get("version") == ANSWER_KEY_VERSION:
+        metrics.increment("answer_key_lookups_total", play_mode=play_mode.value, source="stored")
+        return CompiledAnswerKey.model_construct(**answer_key)
+    
+    metrics.increment("answer_key_lookups_total", play_mode=play_mode.value, source="compiled")
+    return CompiledAnswerKey.model_construct(**compile_answer_key(play_mode, challenge_metadata))
+
+
+class LexicalSignals(NamedTuple):
+    """Cheap comparison of an open-ended answer with its reference text and the audio transcript."""
+    similarity: float # Character n-gram TF-IDF cosine with the reference, 0-1
+    source_similarity: float # Same, with the audio transcript the player heard
+    word_count: int
+    length_ratio: float # Answer words / reference words
+
+
+class GradingInput(NamedTuple):
+    """What grading one open-ended answer needs, loaded before the LLM call."""
+    play_mode: PlayMode
+    answer_payload: Dict[str, Any]
+    challenge_metadata: Dict[str, Any]
+    max_score: float
+    audio_text: Optional[str]
+
+
+def _sentences(text: str) -> List[str]:
+    sentences = [normalize_text(NON_WORD.sub(' ', sentence)) for sentence in SENTENCE_BOUNDARY.split(text)]
+    return [sentence for sentence in sentences if sentence]
+
+
+def _char_ngrams(text: str) -> List[str]:
+    """Character n-grams of each space-padded word, so no gram spans two words."""
+    grams = []
+    for word in text.split():
+        padded = f" {word} "
+        for size in LEXICAL_NGRAM_SIZES:
+            grams.extend(padded[start:start + size] for start in range(len(padded) - size + 1))
+    return grams
+
+
+def tfidf_cosine(reference: str, answer: str) -> float:
+    """
+    Cosine similarity of the character n-gram TF-IDF vectors of two texts.
+    
+    Every sentence of both texts is a document for the IDF, so grams found
+    everywhere (articles, common endings) weigh less than the content-bearing
+    grams the texts share.
+    """
+    documents = [(0, sentence) for sentence in _sentences(reference)]
+    documents += [(1, sentence) for sentence in _sentences(answer)]
+    
+    vocabulary: Dict[str, int] = {}
+    rows: List[int] = []
+    columns: List[int] = []
+    for document_index, (_, sentence) in enumerate(documents):
+        for gram in _char_ngrams(sentence):
+            rows.append(document_index)
+            columns.append(vocabulary.setdefault(gram, len(vocabulary)))
+    
+    if not vocabulary:
+        return 0.0
+    
+    counts = np.zeros((len(documents), len(vocabulary)))
+    np.add.at(counts, (np.array(rows), np.array(columns)), 1.0)
+    
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1.0
+    
+    owners = np.array([owner for owner, _ in documents])
+    term_frequency = np.vstack([counts[owners == owner].sum(axis=0) for owner in (0, 1)])
+    weighted = np.log1p(term_frequency) * idf
+    
+    norms = np.linalg.norm(weighted, axis=1)
+    if not np.all(norms):
+        return 0.0
+    return float(weighted[0] @ weighted[1] / (norms[0] * norms[1]))
+
+
+def lexical_signals(reference: str, answer: str, audio_text: Optional[str] = None) -> LexicalSignals:
+    reference_words = len(normalize_text(NON_WORD.sub(' ', reference)).split())
+    answer_words = len(normalize_text(NON_WORD.sub(' ', answer)).split())
+    
+    return LexicalSignals(
+        similarity=tfidf_cosine(reference, answer),
+        source_similarity=tfidf_cosine(audio_text, answer) if audio_text else 0.0,
+        word_count=answer_words,
+        length_ratio=answer_words / reference_words if reference_words else 0.0
+    )
+
+
+def _lexical_verdict(signals: LexicalSignals) -> Optional[str]:
+    """
+    Name of the case the answer falls in, or None for the ambiguous band.
+    
+    Copying is checked against the transcript the player heard; the reference
+    is model-written and never shown, so being close to it is a sign of a
+    strong answer ("close_to_reference"), which is left to the LLM.
+    """
+    if signals.word_count < settings.LEXICAL_MIN_WORDS or signals.length_ratio < settings.LEXICAL_MIN_LENGTH_RATIO:
+        return "too_short"
+    
+    if signals.source_similarity >= settings.LEXICAL_COPY_SIMILARITY:
+        return "copied"
+    
+    if signals.similarity >= settings.LEXICAL_COPY_SIMILARITY:
+        return "close_to_reference"
+    
+    if max(signals.similarity, signals.source_similarity) < settings.LEXICAL_OFF_TOPIC_SIMILARITY:
+        return "off_topic"
+    
+    return None
+
+
+def _lexical_prescore(
+    play_mode: PlayMode,
+    reference: str,
+    answer: str,
+    audio_text: Optional[str]
+) -> Optional[str]:
+    """
+    Run the lexical tier for a summarize/paraphrase answer and record what it decided.
+    
+    Returns the verdict (too_short, copied, off_topic, close_to_reference) or None
+    for the ambiguous band. The caller only acts on the zero-score verdicts, and only
+    when LEXICAL_PRESCORING_MODE is "enforce"; in "shadow" mode every verdict is
+    measured against the LLM score instead.
+    """
+    if settings.LEXICAL_PRESCORING_MODE == "off":
+        return None
+    
+    signals = lexical_signals(reference, answer, audio_text)
+    verdict = _lexical_verdict(signals)
+    
+    metrics.observe(
+        "lexical_similarity",
+        signals.similarity,
+        buckets=LEXICAL_SIMILARITY_BUCKETS,
+        play_mode=play_mode.value
+    )
+    metrics.increment(
+        "lexical_prescore_total",
+        play_mode=play_mode.value,
+        verdict=verdict or "ambiguous",
+        mode=settings.LEXICAL_PRESCORING_MODE
+    )
+    return verdict
+
+
+def _short_circuits(verdict: Optional[str]) -> bool:
+    return verdict in LEXICAL_ZERO_VERDICTS and settings.LEXICAL_PRESCORING_MODE == "enforce"
+
+
+def _record_llm_score_for_verdict(play_mode: PlayMode, verdict: Optional[str], score_0_2: Optional[int]) -> None:
+    """Track the LLM score each lexical verdict received, to tune the thresholds."""
+    if settings.LEXICAL_PRESCORING_MODE == "off":
+        return
+    
+    metrics.increment(
+        "lexical_prescore_llm_scores_total",
+        play_mode=play_mode.value,
+        verdict=verdict or "ambiguous",
+        llm_score=str(score_0_2)
+    )
+
+
+def _lexical_zero_score(play_mode: PlayMode, verdict: str, max_score: float) -> Tuple[float, bool, str]:
+    """Score a clear-cut answer as the LLM rubric would (0), without calling the LLM."""
+    reason = "Resuelto por pre-evaluación léxica"
+    
+    if play_mode == PlayMode.summarize:
+        return _calculate_summarize_score(
+            evaluation=SummarizeEvaluationResponse(score_0_2=0, reason=reason, flags=[verdict]),
+            max_score=max_score
+        )
+    
+    return _calculate_paraphrase_score(
+        evaluation=ParaphraseEvaluationResponse(
+            criterion_1_0_2=0,
+            criterion_2_0_2=0,
+            criterion_3_0_2=0,
+            score_0_2=0,
+            reason=reason,
+            flags=[verdict]
+        ),
+        max_score=max_score
+    )
+
+
 def evaluate_submitted_answer(
     play_mode: PlayMode,
     answer_payload: Dict[str, Any],
     challenge_metadata: Dict[str, Any],
-    max_score: float
+    max_score: float,
+    answer_key: Optional[Dict[str, Any]] = None,
+    audio_text: Optional[str] = None
 ) -> Tuple[float, bool, str]:
     """
     Evaluate a submitted answer for a game round. 
     Returns the score, whether the answer is correct, and a short feedback message.
+    answer_key is the challenge's precompiled focus/cloze key, when it has one;
+    audio_text is its transcript, used to catch summaries and paraphrases copied from it.
     """
     if play_mode == PlayMode.focus:
-        return _evaluate_focus_answer(answer_payload, challenge_metadata, max_score)
+        return _evaluate_focus_answer(answer_payload, challenge_metadata, max_score, answer_key)
     
     elif play_mode == PlayMode.cloze:
-        return _evaluate_cloze_answer(answer_payload, challenge_metadata, max_score)
+        return _evaluate_cloze_answer(answer_payload, challenge_metadata, max_score, answer_key)
     
     elif play_mode == PlayMode.clarify:
         return _evaluate_clarify_answer(answer_payload, challenge_metadata, max_score)
     
     elif play_mode == PlayMode.summarize:
-        return _evaluate_summarize_answer(answer_payload, challenge_metadata, max_score)
+        return _evaluate_summarize_answer(answer_payload, challenge_metadata, max_score, audio_text)
     
     elif play_mode == PlayMode.paraphrase:
-        return _evaluate_paraphrase_answer(answer_payload, challenge_metadata, max_score)
+        return _evaluate_paraphrase_answer(answer_payload, challenge_metadata, max_score, audio_text)
     
 
 
 def _evaluate_focus_answer(
     answer_payload: Dict[str, Any],
     challenge_metadata: Dict[str, Any],
-    max_score: float
+    max_score: float,
+    answer_key: Optional[Dict[str, Any]] = None
 ) -> Tuple[float, bool, str]:
     """Evaluate answer for focus (multiple choice) mode."""
     try:
@@ -81,20 +349,14 @@ def _evaluate_focus_answer(
     except ValidationError as e:
         raise InvalidPayload(f"Payload de respuesta inválido: {e}")
     
-    try:
-        spec = FocusMultipleChoice.model_validate(challenge_metadata)
-    except ValidationError as e:
-        raise MisconfiguredChallenge(f"Metadatos de desafío inválidos: {e}")
+    key = _resolve_answer_key(PlayMode.focus, answer_key, challenge_metadata)
     
-    if not (0 <= user_answer.selected_index < len(spec.answer_choices)):
+    if not (0 <= user_answer.selected_index < key.choice_count):
         raise InvalidPayload(
-            f"El índice seleccionado {user_answer.selected_index} está fuera del rango [0, {len(spec.answer_choices)})"
+            f"El índice seleccionado {user_answer.selected_index} está fuera del rango [0, {key.choice_count})"
         )
     
-    player_answer = normalize_text(spec.answer_choices[user_answer.selected_index])
-    correct_answer = normalize_text(spec.correct_answer)
-    
-    is_correct = player_answer == correct_answer
+    is_correct = user_answer.selected_index in key.correct_indices
     score_final = max_score if is_correct else 0.0
     feedback_short = "¡Correcto!" if is_correct else "¡Incorrecto!"
     
@@ -108,7 +370,8 @@ def _evaluate_focus_answer(
 def _evaluate_cloze_answer(
     answer_payload: Dict[str, Any],
     challenge_metadata: Dict[str, Any],
-    max_score: float
+    max_score: float,
+    answer_key: Optional[Dict[str, Any]] = None
 ) -> Tuple[float, bool, str]:
     """Evaluate answer for cloze (fill in the blanks) mode."""
     try:
@@ -116,18 +379,14 @@ def _evaluate_cloze_answer(
     except ValidationError as e:
         raise InvalidPayload(f"Payload de respuesta inválido: {e}")
     
-    try:
-        spec = ClozeSpec.model_validate(challenge_metadata)
-    except ValidationError as e:
-        raise MisconfiguredChallenge(f"Metadatos de desafío inválidos: {e}")
+    key_normalized = _resolve_answer_key(PlayMode.cloze, answer_key, challenge_metadata).normalized_answers
     
-    if len(user_answer.blanks) != len(spec.answers):
+    if len(user_answer.blanks) != len(key_normalized):
         raise InvalidPayload(
-            f"Se esperaban {len(spec.answers)} espacios en blanco, se recibieron {len(user_answer.blanks)}"
+            f"Se esperaban {len(key_normalized)} espacios en blanco, se recibieron {len(user_answer.blanks)}"
         )
     
     user_normalized = [normalize_text(blank) for blank in user_answer.blanks]
-    key_normalized = [normalize_text(answer) for answer in spec.answers]
     
     matched = sum(user_normalized[i] == key_normalized[i] for i in range(len(key_normalized)))
     total = len(key_normalized)
@@ -258,7 +517,8 @@ def _calculate_summarize_score(
 def _evaluate_summarize_answer(
     answer_payload: Dict[str, Any],
     challenge_metadata: Dict[str, Any],
-    max_score: float
+    max_score: float,
+    audio_text: Optional[str] = None
 ) -> Tuple[float, bool, str]:
     """Evaluate answer for summarize mode using LLM."""
     try:
@@ -271,11 +531,16 @@ def _evaluate_summarize_answer(
     except ValidationError as e:
         raise MisconfiguredChallenge(f"Metadatos de desafío inválidos: {e}")
     
+    verdict = _lexical_prescore(PlayMode.summarize, spec.reference_summary, user_answer.summary, audio_text)
+    if _short_circuits(verdict):
+        return _lexical_zero_score(PlayMode.summarize, verdict, max_score)
+    
     try:
         evaluation = evaluate_summarize_answer(
             reference_summary=spec.reference_summary,
             player_summary=user_answer.summary
         )
+        _record_llm_score_for_verdict(PlayMode.summarize, verdict, evaluation.score_0_2)
         
         return _calculate_summarize_score(
             evaluation=evaluation,
@@ -323,7 +588,8 @@ def _calculate_paraphrase_score(
 def _evaluate_paraphrase_answer(
     answer_payload: Dict[str, Any],
     challenge_metadata: Dict[str, Any],
-    max_score: float
+    max_score: float,
+    audio_text: Optional[str] = None
 ) -> Tuple[float, bool, str]:
     """Evaluate answer for paraphrase mode using LLM."""
     try:
@@ -336,12 +602,17 @@ def _evaluate_paraphrase_answer(
     except ValidationError as e:
         raise MisconfiguredChallenge(f"Metadatos de desafío inválidos: {e}")
     
+    verdict = _lexical_prescore(PlayMode.paraphrase, spec.reference_text, user_answer.paraphrase, audio_text)
+    if _short_circuits(verdict):
+        return _lexical_zero_score(PlayMode.paraphrase, verdict, max_score)
+    
     try:
         evaluation = evaluate_paraphrase_answer(
             reference_text=spec.reference_text,
             player_paraphrase=user_answer.paraphrase,
             rubric=spec.rubric
         )
+        _record_llm_score_for_verdict(PlayMode.paraphrase, verdict, evaluation.score_0_2)
         
         return _calculate_paraphrase_score(
             evaluation=evaluation,
@@ -353,3 +624,177 @@ def _evaluate_paraphrase_answer(
     except Exception as e:
         raise APIException(f"Error al evaluar respuesta de paráfrasis: {str(e)}")
 
+
+def _build_batch_item(
+    item_id: str,
+    play_mode: PlayMode,
+    answer_payload: Dict[str, Any],
+    challenge_metadata: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Validate one open-ended answer and shape it as an input item for the batch grader."""
+    payload_models = {
+        PlayMode.clarify: (ClarifyAnswerPayload, ClarifySpec),
+        PlayMode.summarize: (SummarizeAnswerPayload, SummarizeSpec),
+        PlayMode.paraphrase: (ParaphraseAnswerPayload, ParaphraseSpec),
+    }
+    if play_mode not in payload_models:
+        raise UnsupportedPlayMode(f"El modo de juego {play_mode} no se puede evaluar en lote")
+    
+    payload_model, spec_model = payload_models[play_mode]
+    
+    try:
+        user_answer = payload_model.model_validate(answer_payload)
+    except ValidationError as e:
+        raise InvalidPayload(f"Payload de respuesta inválido: {e}")
+    
+    try:
+        spec = spec_model.model_validate(challenge_metadata)
+    except ValidationError as e:
+        raise MisconfiguredChallenge(f"Metadatos de desafío inválidos: {e}")
+    
+    if play_mode == PlayMode.clarify:
+        reference = {"reference_questions": spec.possible_questions}
+        answer = {"questions": user_answer.questions}
+    elif play_mode == PlayMode.summarize:
+        reference = {"reference_summary": spec.reference_summary}
+        answer = {"summary": user_answer.summary}
+    else:
+        reference = {"reference_text": spec.reference_text, "rubric": spec.rubric}
+        answer = {"paraphrase": user_answer.paraphrase}
+    
+    return {
+        "item_id": item_id,
+        "mode": play_mode.value,
+        "reference": reference,
+        "answer": answer
+    }
+
+
+def _prescore_batch_item(item: Dict[str, Any], audio_text: Optional[str]) -> Optional[str]:
+    play_mode = PlayMode(item["mode"])
+    
+    if play_mode == PlayMode.summarize:
+        return _lexical_prescore(play_mode, item["reference"]["reference_summary"], item["answer"]["summary"], audio_text)
+    
+    if play_mode == PlayMode.paraphrase:
+        return _lexical_prescore(play_mode, item["reference"]["reference_text"], item["answer"]["paraphrase"], audio_text)
+    
+    return None
+
+
+def _score_batch_item(
+    play_mode: PlayMode,
+    evaluation: BatchEvaluationItem,
+    answer_payload: Dict[str, Any],
+    max_score: float
+) -> Tuple[float, bool, str]:
+    """Turn one batch evaluation into the per-mode response and score it like a single request would."""
+    try:
+        if play_mode == PlayMode.clarify:
+            total_questions = len(answer_payload.get("questions", []))
+            if len(evaluation.per_question) != total_questions:
+                raise APIException(
+                    f"El LLM devolvió {len(evaluation.per_question)} evaluaciones para {total_questions} preguntas"
+                )
+            return _calculate_clarify_score(
+                evaluation=ClarifyEvaluationResponse(per_question=evaluation.per_question),
+                total_questions=total_questions,
+                max_score=max_score
+            )
+        
+        if evaluation.score_0_2 is None:
+            raise APIException("El LLM no devolvió una puntuación para la respuesta")
+        
+        if play_mode == PlayMode.summarize:
+            return _calculate_summarize_score(
+                evaluation=SummarizeEvaluationResponse(
+                    score_0_2=evaluation.score_0_2,
+                    reason=evaluation.reason,
+                    flags=evaluation.flags
+                ),
+                max_score=max_score
+            )
+        
+        if len(evaluation.criterion_scores) != 3:
+            raise APIException(
+                f"El LLM devolvió {len(evaluation.criterion_scores)} criterios de paráfrasis en lugar de 3"
+            )
+        criterion_1, criterion_2, criterion_3 = evaluation.criterion_scores
+        return _calculate_paraphrase_score(
+            evaluation=ParaphraseEvaluationResponse(
+                criterion_1_0_2=criterion_1,
+                criterion_2_0_2=criterion_2,
+                criterion_3_0_2=criterion_3,
+                score_0_2=evaluation.score_0_2,
+                reason=evaluation.reason,
+                flags=evaluation.flags
+            ),
+            max_score=max_score
+        )
+    
+    except APIException:
+        raise
+    except Exception as e:
+        raise APIException(f"Evaluación en lote inválida: {str(e)}")
+
+
+def evaluate_submitted_answers_batch(
+    answers: Dict[str, GradingInput]
+) -> Dict[str, Union[Tuple[float, bool, str], Exception]]:
+    """
+    Evaluate several open-ended answers with a single LLM request.
+    
+    Args:
+        answers: Mapping of item id to the answer's grading input.
+        
+    Returns:
+        Mapping of item id to either (score, is_correct, feedback_short) or the error
+        that prevented grading that item. One bad item never fails the others.
+    """
+    results: Dict[str, Union[Tuple[float, bool, str], Exception]] = {}
+    batch_items: List[Dict[str, Any]] = []
+    verdicts: Dict[str, Optional[str]] = {}
+    
+    for item_id, (play_mode, answer_payload, challenge_metadata, max_score, audio_text) in answers.items():
+        try:
+            item = _build_batch_item(item_id, play_mode, answer_payload, challenge_metadata)
+        except APIException as e:
+            results[item_id] = e
+            continue
+        
+        verdict = _prescore_batch_item(item, audio_text)
+        if _short_circuits(verdict):
+            results[item_id] = _lexical_zero_score(play_mode, verdict, max_score)
+            continue
+        
+        verdicts[item_id] = verdict
+        batch_items.append(item)
+    
+    if not batch_items:
+        return results
+    
+    try:
+        evaluations = {item.item_id: item for item in evaluate_batch(batch_items).items}
+    except Exception as e:
+        for item in batch_items:
+            results[item["item_id"]] = e
+        return results
+    
+    for item in batch_items:
+        item_id = item["item_id"]
+        play_mode, answer_payload, _, max_score, _ = answers[item_id]
+        evaluation = evaluations.get(item_id)
+        
+        if evaluation is None:
+            results[item_id] = APIException("El LLM no devolvió una evaluación para la respuesta")
+            continue
+        
+        if play_mode != PlayMode.clarify:
+            _record_llm_score_for_verdict(play_mode, verdicts.get(item_id), evaluation.score_0_2)
+        
+        try:
+            results[item_id] = _score_batch_item(play_mode, evaluation, answer_payload, max_score)
+        except APIException as e:
+            results[item_id] = e
+    
+    return results
@@ -0,0 +1,254 @@
+"""
+Live state of a game session for the server-sent events stream.
+
+The database stays the source of truth: a stream reads a small column snapshot
+of the session (its status, each round's status, each submission's grading
+state) and emits only what changed since its previous read. Every commit in
+this process that touches a GameSession, GameRound or RoundSubmission wakes
+the streams of that session at once (see the session hooks at the bottom), so
+inline prefetch and grading workers are pushed immediately; changes committed
+by workers in other processes are picked up by the periodic re-read.
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Tuple
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
+
+from model.listening_core.game_session import GameSession
+from model.listening_core.game_round import GameRound
+from model.listening_core.round_submission import RoundSubmission
+from enums.listening_game import GameStatus, GameRoundStatus, EvaluationStatus
+from utils.config import settings
+from utils.db import engine
+from utils.errors import Missing, Forbidden
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Rounds in these states have their challenge and audio ready to be served
+READY_ROUND_STATUSES = (GameRoundStatus.pending, GameRoundStatus.served, GameRoundStatus.attempted)
+FINISHED_SESSION_STATUSES = (GameStatus.completed, GameStatus.cancelled)
+UNGRADED_STATUSES = (EvaluationStatus.pending_evaluation, EvaluationStatus.evaluating)
+
+SSEEvent = Tuple[str, Dict[str, Any]]
+
+
+class SessionState(NamedTuple):
+    session: Dict[str, Any]
+    rounds: Dict[int, Dict[str, Any]]
+    gradings: Dict[int, Dict[str, Any]]
+
+    @property
+    def is_final(self) -> bool:
+        """Nothing will change any more: the session ended and every answer is graded."""
+        return (
+            self.session.get("status") in FINISHED_SESSION_STATUSES and
+            not any(grading["evaluation_status"] in UNGRADED_STATUSES for grading in self.gradings.values())
+        )
+
+
+EMPTY_STATE = SessionState(session={}, rounds={}, gradings={})
+
+
+class SessionEventBus:
+    """
+    Wakes streams waiting on a game session. Safe to notify from any thread;
+    each subscriber is an asyncio.Event set on the loop it was created in.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[UUID, Dict[asyncio.Event, asyncio.AbstractEventLoop]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, game_session_id: UUID) -> asyncio.Event:
+        wake = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            self._subscribers.setdefault(game_session_id, {})[wake] = loop
+
+        return wake
+
+    def unsubscribe(self, game_session_id: UUID, wake: asyncio.Event) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(game_session_id)
+            if subscribers is None:
+                return
+
+            subscribers.pop(wake, None)
+            if not subscribers:
+                del self._subscribers[game_session_id]
+
+    def notify(self, game_session_id: UUID) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(game_session_id, {}).items())
+
+        for wake, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass  # The stream's loop already closed
+
+
+session_event_bus = SessionEventBus()
+
+
+def load_session_state(game_session_id: UUID, user_id: UUID) -> SessionState:
+    """Read the session's live state with two column queries. Raises Missing or Forbidden."""
+    with Session(engine) as db_session:
+        session_row = db_session.exec(
+            select(GameSession.user_id, GameSession.status, GameSession.current_round)
+            .where(GameSession.game_session_id == game_session_id)
+        ).first()
+
+        if session_row is None:
+            raise Missing(f"Sesión de juego con ID {game_session_id} no encontrada")
+
+        owner_id, session_status, current_round = session_row
+
+        if owner_id != user_id:
+            raise Forbidden("No tiene permiso para realizar esta acción")
+
+        round_rows = db_session.exec(
+            select(
+                GameRound.round_number,
+                GameRound.status,
+                GameRound.score,
+                RoundSubmission.evaluation_status,
+                RoundSubmission.is_correct
+            )
+            .outerjoin(RoundSubmission, RoundSubmission.game_round_id == GameRound.game_round_id)
+            .where(GameRound.game_session_id == game_session_id)
+        ).all()
+
+    rounds = {}
+    gradings = {}
+
+    for round_number, round_status, score, evaluation_status, is_correct in round_rows:
+        rounds[round_number] = {
+            "round_number": round_number,
+            "status": round_status.value,
+            "ready": round_status in READY_ROUND_STATUSES
+        }
+
+        if evaluation_status is not None:
+            is_evaluated = evaluation_status == EvaluationStatus.evaluated
+            gradings[round_number] = {
+                "round_number": round_number,
+                "evaluation_status": evaluation_status.value,
+                "score": score if is_evaluated else None,
+                "is_correct": is_correct if is_evaluated else None
+            }
+
+    return SessionState(
+        session={"status": session_status.value, "current_round": current_round},
+        rounds=rounds,
+        gradings=gradings
+    )
+
+
+def diff_session_state(previous: SessionState, current: SessionState) -> List[SSEEvent]:
+    events: List[SSEEvent] = []
+
+    if current.session != previous.session:
+        events.append(("session_status", current.session))
+
+    for round_number in sorted(current.rounds):
+        if current.rounds[round_number] != previous.rounds.get(round_number):
+            events.append(("round_status", current.rounds[round_number]))
+
+    for round_number in sorted(current.gradings):
+        if current.gradings[round_number] != previous.gradings.get(round_number):
+            events.append(("grading", current.gradings[round_number]))
+
+    return events
+
+
+def format_sse(event_name: str, data: Dict[str, Any]) -> str:
+    return f"event: {event_name}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def stream_session_events(
+    game_session_id: UUID,
+    user_id: UUID,
+    initial_state: SessionState,
+    poll_interval_seconds: float = settings.SESSION_EVENTS_POLL_SECONDS,
+    heartbeat_seconds: float = settings.SESSION_EVENTS_HEARTBEAT_SECONDS
+) -> AsyncIterator[str]:
+    """
+    Yield SSE frames for a session: its full state first, then one event per
+    change. Ends with an `end` event once the session is final.
+    """
+    wake = session_event_bus.subscribe(game_session_id)
+    metrics.increment("session_event_streams_total", event="opened")
+    previous = EMPTY_STATE
+    current = initial_state
+    last_sent = time.monotonic()
+
+    try:
+        while True:
+            events = diff_session_state(previous, current)
+            for event_name, data in events:
+                yield format_sse(event_name, data)
+
+            if events:
+                metrics.increment("session_events_sent_total", len(events))
+                last_sent = time.monotonic()
+
+            if current.is_final:
+                yield format_sse("end", current.session)
+                return
+
+            previous = current
+            wait_seconds = min(poll_interval_seconds, max(0.0, heartbeat_seconds - (time.monotonic() - last_sent)))
+
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=wait_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+            if time.monotonic() - last_sent >= heartbeat_seconds:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+
+            # Cleared before reading so a commit landing during the read wakes the next wait
+            wake.clear()
+            current = await run_in_threadpool(load_session_state, game_session_id, user_id)
+
+    finally:
+        session_event_bus.unsubscribe(game_session_id, wake)
+        metrics.increment("session_event_streams_total", event="closed")
+
+
+# Session hooks: collect the game sessions touched by each flush, notify after commit
+
+CHANGED_SESSIONS_KEY = "listening_changed_game_sessions"
+WATCHED_MODELS = (GameSession, GameRound, RoundSubmission)
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _collect_changed_sessions(db_session: OrmSession, flush_context: Any) -> None:
+    changed = db_session.info.setdefault(CHANGED_SESSIONS_KEY, set())
+
+    for instance in (*db_session.new, *db_session.dirty, *db_session.deleted):
+        if isinstance(instance, WATCHED_MODELS) and instance.game_session_id is not None:
+            changed.add(instance.game_session_id)
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _notify_changed_sessions(db_session: OrmSession) -> None:
+    for game_session_id in db_session.info.pop(CHANGED_SESSIONS_KEY, ()):
+        session_event_bus.notify(game_session_id)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _discard_changed_sessions(db_session: OrmSession) -> None:
+    db_session.info.pop(CHANGED_SESSIONS_KEY, None)
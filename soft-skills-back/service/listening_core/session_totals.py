@@ -0,0 +1,173 @@
+"""
+Running score totals on GameSession.
+
+total_score, total_max_score and attempted_rounds mirror the SUM/COUNT over a
+session's attempted rounds (a round still pending evaluation counts 0 points).
+They are changed with atomic `x = x + delta` updates when a round is attempted
+or graded, so reads never aggregate; `check_session_totals` compares them with
+the aggregate and can repair drift.
+"""
+from typing import Dict, List, NamedTuple, Optional
+from uuid import UUID
+import logging
+
+from sqlalchemy import bindparam
+from sqlmodel import Session, select, func, update
+
+from model.listening_core.game_session import GameSession
+from model.listening_core.game_round import GameRound
+from enums.listening_game import GameRoundStatus
+from utils.errors import handle_db_error
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Float sums may differ in the last bits depending on summation order
+TOTALS_TOLERANCE = 1e-6
+
+
+class SessionTotals(NamedTuple):
+    total_score: float
+    total_max_score: float
+    attempted_rounds: int
+
+
+class TotalsMismatch(NamedTuple):
+    game_session_id: UUID
+    stored: SessionTotals
+    expected: SessionTotals
+
+
+def add_to_session_totals(
+    game_session_id: UUID,
+    db_session: Session,
+    score_delta: float = 0.0,
+    max_score_delta: float = 0.0,
+    attempted_delta: int = 0
+) -> None:
+    """Apply a change to the running totals with one atomic UPDATE. The caller commits."""
+    db_session.exec(
+        update(GameSession)
+        .where(GameSession.game_session_id == game_session_id)
+        .values(
+            total_score=GameSession.total_score + score_delta,
+            total_max_score=GameSession.total_max_score + max_score_delta,
+            attempted_rounds=GameSession.attempted_rounds + attempted_delta
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def add_score_deltas_to_sessions(score_deltas: Dict[UUID, float], db_session: Session) -> None:
+    """Move several sessions' total_score with one executemany UPDATE. The caller commits."""
+    if not score_deltas:
+        return
+
+    sessions = GameSession.__table__
+    db_session.exec(
+        update(sessions)
+        .where(sessions.c.game_session_id == bindparam("b_game_session_id"))
+        .values(total_score=sessions.c.total_score + bindparam("b_score_delta")),
+        params=[
+            {"b_game_session_id": game_session_id, "b_score_delta": score_delta}
+            for game_session_id, score_delta in score_deltas.items()
+        ]
+    )
+
+
+def _expected_totals_by_session(game_session_ids: List[UUID], db_session: Session) -> Dict[UUID, SessionTotals]:
+    rows = db_session.exec(
+        select(
+            GameRound.game_session_id,
+            func.coalesce(func.sum(GameRound.score), 0.0),
+            func.coalesce(func.sum(GameRound.max_score), 0.0),
+            func.count()
+        )
+        .where(
+            GameRound.game_session_id.in_(game_session_ids),
+            GameRound.status == GameRoundStatus.attempted
+        )
+        .group_by(GameRound.game_session_id)
+    ).all()
+
+    return {
+        game_session_id: SessionTotals(float(total_score), float(total_max_score), attempted_rounds)
+        for game_session_id, total_score, total_max_score, attempted_rounds in rows
+    }
+
+
+def _matches(stored: SessionTotals, expected: SessionTotals) -> bool:
+    return (
+        stored.attempted_rounds == expected.attempted_rounds
+        and abs(stored.total_score - expected.total_score) <= TOTALS_TOLERANCE
+        and abs(stored.total_max_score - expected.total_max_score) <= TOTALS_TOLERANCE
+    )
+
+
+def check_session_totals(
+    db_session: Session,
+    fix: bool = False,
+    batch_size: int = 500,
+    game_session_id: Optional[UUID] = None
+) -> List[TotalsMismatch]:
+    """
+    Compare stored running totals with the aggregate over rounds, one batch of
+    sessions at a time. With fix=True mismatches are overwritten with the
+    aggregate (each batch commits), which also backfills sessions created
+    before the totals were maintained.
+    """
+    mismatches: List[TotalsMismatch] = []
+    last_id: Optional[UUID] = None
+
+    while True:
+        # Plain columns: loading GameSession would also selectin-load its rounds and submissions
+        statement = (
+            select(
+                GameSession.game_session_id,
+                GameSession.total_score,
+                GameSession.total_max_score,
+                GameSession.attempted_rounds
+            )
+            .order_by(GameSession.game_session_id)
+            .limit(batch_size)
+        )
+        if game_session_id is not None:
+            statement = statement.where(GameSession.game_session_id == game_session_id)
+        if last_id is not None:
+            statement = statement.where(GameSession.game_session_id > last_id)
+
+        try:
+            rows = db_session.exec(statement).all()
+            if not rows:
+                break
+
+            expected_by_session = _expected_totals_by_session([row[0] for row in rows], db_session)
+
+            for session_id, total_score, total_max_score, attempted_rounds in rows:
+                stored = SessionTotals(total_score, total_max_score, attempted_rounds)
+                expected = expected_by_session.get(session_id, SessionTotals(0.0, 0.0, 0))
+
+                if _matches(stored, expected):
+                    continue
+
+                mismatches.append(TotalsMismatch(session_id, stored, expected))
+                logger.warning(f"Session {session_id} totals drifted: stored {stored}, expected {expected}")
+
+                if fix:
+                    db_session.exec(
+                        update(GameSession)
+                        .where(GameSession.game_session_id == session_id)
+                        .values(**expected._asdict())
+                    )
+
+            last_id = rows[-1][0]
+
+            if fix:
+                db_session.commit()
+
+        except Exception as err:
+            db_session.rollback()
+            handle_db_error(err, "check_session_totals", error_type="query")
+
+    metrics.increment("session_totals_mismatches_total", len(mismatches), fixed=str(fix).lower())
+    return mismatches
@@ -0,0 +1,145 @@
+"""
+Idempotency layer for round submissions.
+
+Every submission stores a SubmissionIdempotencyRecord keyed by
+(user_id, idempotency_key) with a hash of what was submitted (session, round
+and answer payload) and the serialized AttemptSubmissionResponse. Retries are
+answered from an in-process LRU or that row before the round is locked; a
+retry whose hash differs is rejected.
+
+A retry gets the original response back, so a submission that was pending
+evaluation stays pending in its replay; the final score is read from the
+round grading endpoint as usual.
+"""
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlmodel import Session
+
+from model.listening_core.submission_idempotency import SubmissionIdempotencyRecord
+from schema.listening_core.round_submission import AttemptSubmissionResponse
+from utils.config import settings
+from utils.errors import Conflict, handle_db_error
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[UUID, str]
+
+
+def submission_request_hash(game_session_id: UUID, round_number: int, answer_payload: Dict[str, Any]) -> str:
+    payload = json.dumps(
+        [str(game_session_id), round_number, answer_payload],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SubmissionIdempotencyCache:
+    """Memory LRU of (request hash, response) in front of listening_submission_idempotency."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, tuple[str, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, cache_key: CacheKey, request_hash: str, response: dict) -> None:
+        with self._lock:
+            self._entries[cache_key] = (request_hash, response)
+            self._entries.move_to_end(cache_key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load(self, db_session: Session, cache_key: CacheKey) -> Optional[tuple[str, dict]]:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                return entry
+
+        # A failed lookup fails the request: treating it as a miss would skip the duplicate check
+        try:
+            record = db_session.get(SubmissionIdempotencyRecord, cache_key)
+            entry = (record.request_hash, record.response) if record else None
+        except Exception as err:
+            db_session.rollback()
+            handle_db_error(err, "submission_idempotency_lookup")
+
+        if entry is not None:
+            self._remember(cache_key, *entry)
+        return entry
+
+    def lookup(
+        self,
+        db_session: Session,
+        user_id: UUID,
+        idempotency_key: str,
+        request_hash: str
+    ) -> Optional[AttemptSubmissionResponse]:
+        """
+        Return the stored response for a retried submission, or None when the key
+        is new. Raises Conflict when the key was used for a different submission.
+        The row is read on the request's own session.
+        """
+        entry = self._load(db_session, (user_id, idempotency_key))
+
+        if entry is None:
+            metrics.increment("submission_idempotency_requests_total", result="miss")
+            return None
+
+        stored_hash, response = entry
+
+        if stored_hash != request_hash:
+            metrics.increment("submission_idempotency_requests_total", result="conflict")
+            raise Conflict(
+                "Ya existe un intento con este idempotency_key pero con un answer_payload diferente"
+            )
+
+        metrics.increment("submission_idempotency_requests_total", result="hit")
+        return AttemptSubmissionResponse.model_validate(response)
+
+    def add_record(
+        self,
+        db_session: Session,
+        user_id: UUID,
+        idempotency_key: str,
+        request_hash: str,
+        game_session_id: UUID,
+        round_number: int,
+        response: AttemptSubmissionResponse
+    ) -> None:
+        """Add the record to the caller's transaction; call `remember` once it commits."""
+        db_session.add(SubmissionIdempotencyRecord(
+            user_id=user_id,
+            idempotency_key=idempotency_key,
+            game_session_id=game_session_id,
+            round_number=round_number,
+            request_hash=request_hash,
+            response=response.model_dump(mode="json")
+        ))
+
+    def remember(
+        self,
+        user_id: UUID,
+        idempotency_key: str,
+        request_hash: str,
+        response: AttemptSubmissionResponse
+    ) -> None:
+        self._remember((user_id, idempotency_key), request_hash, response.model_dump(mode="json"))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+submission_idempotency = SubmissionIdempotencyCache(
+    max_entries=settings.SUBMISSION_IDEMPOTENCY_CACHE_MAX_ENTRIES
+)
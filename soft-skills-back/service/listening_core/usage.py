@@ -0,0 +1,67 @@
+from uuid import UUID
+
+from sqlmodel import Session, select, func
+from sqlalchemy import case
+
+from model.listening_core.usage_record import UsageRecord
+from enums.listening_game import UsageProvider
+from schema.listening_core.usage import SessionCostResponse, UsageBreakdownItem
+from utils.errors import handle_db_error
+
+
+class UsageService:
+    """Read side of the per-call usage records written by utils.usage."""
+
+    def get_session_cost(self, game_session_id: UUID, db_session: Session) -> SessionCostResponse:
+        """Sum recorded calls for a session, grouped by provider, operation and play mode."""
+        try:
+            rows = db_session.exec(
+                select(
+                    UsageRecord.provider,
+                    UsageRecord.operation,
+                    UsageRecord.play_mode,
+                    func.count(),
+                    func.sum(case((UsageRecord.succeeded.is_(False), 1), else_=0)),
+                    func.sum(UsageRecord.input_tokens),
+                    func.sum(UsageRecord.output_tokens),
+                    func.sum(UsageRecord.characters),
+                    func.sum(UsageRecord.latency_ms),
+                    func.sum(UsageRecord.estimated_cost_usd)
+                )
+                .where(UsageRecord.game_session_id == game_session_id)
+                .group_by(UsageRecord.provider, UsageRecord.operation, UsageRecord.play_mode)
+                .order_by(func.sum(UsageRecord.estimated_cost_usd).desc())
+            ).all()
+        except Exception as err:
+            handle_db_error(err, "get_session_cost", error_type="query")
+
+        breakdown = [
+            UsageBreakdownItem(
+                provider=provider,
+                operation=operation,
+                play_mode=play_mode,
+                calls=calls,
+                failed_calls=failed_calls or 0,
+                input_tokens=input_tokens or 0,
+                output_tokens=output_tokens or 0,
+                characters=characters or 0,
+                total_latency_ms=round(latency_ms or 0.0, 1),
+                estimated_cost_usd=round(cost or 0.0, 6)
+            )
+            for provider, operation, play_mode, calls, failed_calls, input_tokens, output_tokens, characters, latency_ms, cost in rows
+        ]
+
+        llm_cost = sum(item.estimated_cost_usd for item in breakdown if item.provider == UsageProvider.llm)
+        tts_cost = sum(item.estimated_cost_usd for item in breakdown if item.provider == UsageProvider.tts)
+
+        return SessionCostResponse(
+            game_session_id=game_session_id,
+            calls=sum(item.calls for item in breakdown),
+            input_tokens=sum(item.input_tokens for item in breakdown),
+            output_tokens=sum(item.output_tokens for item in breakdown),
+            tts_characters=sum(item.characters for item in breakdown),
+            llm_cost_usd=round(llm_cost, 6),
+            tts_cost_usd=round(tts_cost, 6),
+            total_cost_usd=round(llm_cost + tts_cost, 6),
+            breakdown=breakdown
+        )
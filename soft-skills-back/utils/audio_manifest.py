@@ -0,0 +1,64 @@
+"""In-process manifest of storage keys known to exist, with a TTL."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from utils.config import get_settings
+
+settings = get_settings()
+
+
+class AudioManifest:
+    """
+    Remember (bucket, path) keys that were recently confirmed to exist in storage.
+
+    Entries expire after `ttl_seconds` so objects removed outside this process are
+    eventually re-checked; the oldest entries are evicted beyond `max_entries`.
+    """
+    def __init__(self, ttl_seconds: float = 3600, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple[str, str], float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_known(self, bucket_name: str, file_path: str) -> bool:
+        key = (bucket_name, file_path)
+        now = time.monotonic()
+
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                return False
+
+            if expires_at <= now:
+                del self._entries[key]
+                return False
+
+            self._entries.move_to_end(key)
+            return True
+
+    def mark_present(self, bucket_name: str, file_path: str, ttl_seconds: Optional[float] = None) -> None:
+        key = (bucket_name, file_path)
+        expires_at = time.monotonic() + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+
+        with self._lock:
+            self._entries[key] = expires_at
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, bucket_name: str, file_path: str) -> None:
+        with self._lock:
+            self._entries.pop((bucket_name, file_path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+audio_manifest = AudioManifest(
+    ttl_seconds=settings.AUDIO_MANIFEST_TTL_SECONDS,
+    max_entries=settings.AUDIO_MANIFEST_MAX_ENTRIES,
+)
@@ -0,0 +1,187 @@
+"""
+Offline rendering of the listening difficulty effects (reverb, echo, background
+noise, speed variation) onto synthesized speech.
+
+Effects are applied to 16-bit mono PCM with NumPy only; each one is a
+whole-array operation (FFT convolution, shifted adds, interpolation) with no
+per-sample Python loop, so a minute of audio renders in well under a second.
+There is no MP3 encoder in the stack, so rendered variants are stored as WAV.
+
+A variant is addressed by the hash of its effect profile: sessions that use the
+same intensities share one file per challenge, and a change to the renderer
+(RENDERER_VERSION) moves every variant to a new address.
+"""
+import hashlib
+import io
+import json
+import wave
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+
+from enums.listening_game import AudioEffects
+
+RENDERER_VERSION = 1
+
+PEAK_LIMIT = 0.98
+SPEED_MAX_DEPTH = 0.12  # Playback rate swings by up to ±12% at full intensity
+SPEED_DRIFT_HZ = 0.15
+ECHO_DELAY_SECONDS = 0.18
+ECHO_TAPS = 3
+ECHO_TAP_DECAY = 0.55
+REVERB_MIN_SECONDS = 0.25
+REVERB_MAX_EXTRA_SECONDS = 1.25
+NOISE_MAX_SNR_DB = 30.0  # Speech-to-noise ratio at the lowest non-zero intensity; 0 dB at full intensity
+
+
+def effect_profile(effects: Optional[Mapping[str, Optional[float]]]) -> Dict[str, float]:
+    """Canonical profile: every known effect, intensity clamped to [0, 1] and rounded."""
+    effects = effects or {}
+    return {
+        effect.value: round(min(1.0, max(0.0, float(effects.get(effect.value) or 0.0))), 3)
+        for effect in AudioEffects
+    }
+
+
+def is_neutral_profile(effects: Optional[Mapping[str, Optional[float]]]) -> bool:
+    return not any(effect_profile(effects).values())
+
+
+def effect_profile_hash(effects: Optional[Mapping[str, Optional[float]]]) -> str:
+    payload = json.dumps([RENDERER_VERSION, effect_profile(effects)], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def prerendered_variant_url(
+    audio_variants: Optional[Mapping[str, str]],
+    effects: Optional[Mapping[str, Optional[float]]]
+) -> Optional[str]:
+    """URL of the variant rendered for these effects, or None if the client must apply them."""
+    if not audio_variants or is_neutral_profile(effects):
+        return None
+    return audio_variants.get(effect_profile_hash(effects))
+
+
+def pcm16_to_float(pcm: bytes) -> np.ndarray:
+    usable = len(pcm) - len(pcm) % 2
+    return np.frombuffer(pcm[:usable], dtype="<i2").astype(np.float64) / 32768.0
+
+
+def encode_pcm_wav(pcm: bytes, sample_rate: int) -> bytes:
+    """Wrap 16-bit mono PCM in a WAV container, unchanged."""
+    buffer = io.BytesIO()
+
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm[:len(pcm) - len(pcm) % 2])
+
+    return buffer.getvalue()
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2")
+    return encode_pcm_wav(pcm.tobytes(), sample_rate)
+
+
+def _fft_convolve(signal: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    length = len(signal) + len(kernel) - 1
+    size = 1 << (length - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(signal, size) * np.fft.rfft(kernel, size), size)[:length]
+
+
+def _vary_speed(samples: np.ndarray, intensity: float, sample_rate: int, rng: np.random.Generator) -> np.ndarray:
+    """Tape-style drift: the playback rate follows a slow sine around 1.0."""
+    depth = SPEED_MAX_DEPTH * intensity
+    max_length = int(len(samples) / (1.0 - depth)) + 1
+    t = np.arange(max_length) / sample_rate
+    rate = 1.0 + depth * np.sin(2 * np.pi * SPEED_DRIFT_HZ * t + rng.uniform(0, 2 * np.pi))
+
+    positions = np.cumsum(rate) - rate[0]
+    positions = positions[positions <= len(samples) - 1]
+
+    return np.interp(positions, np.arange(len(samples)), samples)
+
+
+def _add_reverb(samples: np.ndarray, intensity: float, sample_rate: int, rng: np.random.Generator) -> np.ndarray:
+    """Convolve with a synthetic room: exponentially decaying noise reaching -60 dB at its end."""
+    length = int(sample_rate * (REVERB_MIN_SECONDS + REVERB_MAX_EXTRA_SECONDS * intensity))
+    t = np.arange(length) / length
+    impulse = rng.standard_normal(length) * np.exp(-6.9 * t)
+    impulse /= np.sqrt(np.sum(impulse ** 2))
+
+    mix = 0.5 * intensity
+    wet = _fft_convolve(samples, impulse)
+    wet[:len(samples)] = (1.0 - mix) * samples + mix * wet[:len(samples)]
+    wet[len(samples):] *= mix
+
+    return wet
+
+
+def _add_echo(samples: np.ndarray, intensity: float, sample_rate: int) -> np.ndarray:
+    delay = int(sample_rate * ECHO_DELAY_SECONDS)
+    output = np.zeros(len(samples) + delay * ECHO_TAPS)
+    output[:len(samples)] = samples
+
+    gain = 0.5 * intensity
+    for tap in range(1, ECHO_TAPS + 1):
+        output[tap * delay:tap * delay + len(samples)] += gain * samples
+        gain *= ECHO_TAP_DECAY
+
+    return output
+
+
+def _add_background_noise(samples: np.ndarray, intensity: float, rng: np.random.Generator) -> np.ndarray:
+    """Mix pink noise (white noise shaped to 1/f power) at a signal-to-noise ratio set by intensity."""
+    # Shaped at a power-of-two length: FFTs of arbitrary lengths can be many times slower
+    size = 1 << (len(samples) - 1).bit_length()
+    spectrum = np.fft.rfft(rng.standard_normal(size))
+    frequencies = np.fft.rfftfreq(size)
+    spectrum[0] = 0.0
+    spectrum[1:] /= np.sqrt(frequencies[1:])
+    noise = np.fft.irfft(spectrum, size)[:len(samples)]
+
+    noise_rms = np.sqrt(np.mean(noise ** 2))
+    voiced = samples[np.abs(samples) > 1e-3]
+    speech_rms = np.sqrt(np.mean(voiced ** 2)) if len(voiced) else 0.05
+    snr_db = NOISE_MAX_SNR_DB * (1.0 - intensity)
+
+    return samples + noise * (speech_rms / 10 ** (snr_db / 20) / noise_rms if noise_rms else 0.0)
+
+
+def render_effects(
+    samples: np.ndarray,
+    sample_rate: int,
+    effects: Optional[Mapping[str, Optional[float]]]
+) -> np.ndarray:
+    """
+    Apply the profile's effects in playback order (speed, room, echo, then noise)
+    and scale the result down if it would clip. Rendering is deterministic per profile.
+    """
+    profile = effect_profile(effects)
+    rng = np.random.default_rng(int(effect_profile_hash(profile), 16))
+    output = samples.astype(np.float64, copy=True)
+
+    if not len(output):
+        return output
+
+    if profile[AudioEffects.speed_variation.value]:
+        output = _vary_speed(output, profile[AudioEffects.speed_variation.value], sample_rate, rng)
+    if profile[AudioEffects.reverb.value]:
+        output = _add_reverb(output, profile[AudioEffects.reverb.value], sample_rate, rng)
+    if profile[AudioEffects.echo.value]:
+        output = _add_echo(output, profile[AudioEffects.echo.value], sample_rate)
+    if profile[AudioEffects.background_noise.value]:
+        output = _add_background_noise(output, profile[AudioEffects.background_noise.value], rng)
+
+    peak = np.max(np.abs(output))
+    if peak > PEAK_LIMIT:
+        output *= PEAK_LIMIT / peak
+
+    return output
+
+
+def render_variant(pcm: bytes, sample_rate: int, effects: Optional[Mapping[str, Optional[float]]]) -> bytes:
+    """Render 16-bit mono PCM with the given effects into a WAV file."""
+    return encode_wav(render_effects(pcm16_to_float(pcm), sample_rate, effects), sample_rate)
@@ -0,0 +1,147 @@
+"""Bounded streaming buffer between the TTS generator and storage uploads."""
+import contextvars
+import logging
+import queue
+import threading
+import time
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_END_OF_STREAM = object()
+
+
+class AudioStreamStats:
+    """Timing and size counters for a single streamed audio file."""
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.first_byte_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.total_bytes = 0
+        self.chunk_count = 0
+
+    def record_chunk(self, chunk: bytes) -> None:
+        if self.first_byte_at is None:
+            self.first_byte_at = time.perf_counter()
+        self.total_bytes += len(chunk)
+        self.chunk_count += 1
+
+    def finish(self) -> None:
+        self.finished_at = time.perf_counter()
+
+    @property
+    def time_to_first_byte_ms(self) -> Optional[float]:
+        if self.first_byte_at is None:
+            return None
+        return round((self.first_byte_at - self.started_at) * 1000, 2)
+
+    @property
+    def elapsed_ms(self) -> float:
+        end = self.finished_at or time.perf_counter()
+        return round((end - self.started_at) * 1000, 2)
+
+    def __repr__(self):
+        return (
+            f"AudioStreamStats(ttfb_ms={self.time_to_first_byte_ms}, "
+            f"total_bytes={self.total_bytes}, chunks={self.chunk_count}, elapsed_ms={self.elapsed_ms})"
+        )
+
+
+class BoundedChunkBuffer:
+    """
+    Pull chunks from a producer iterator on a background thread into a bounded queue.
+
+    The producer blocks once `max_chunks` are waiting, so memory stays bounded no matter
+    how long the audio is, while the consumer (the upload) runs concurrently with synthesis.
+    Errors raised by the producer are re-raised in the consumer. The producer runs in a
+    copy of the creating thread's context, so context variables (such as the usage labels
+    that attribute TTS cost to a game session) are seen while the stream is consumed.
+    """
+    def __init__(
+        self,
+        producer: Iterable[bytes],
+        max_chunks: int = 64,
+        stats: Optional[AudioStreamStats] = None,
+    ):
+        self._producer = producer
+        self._queue: queue.Queue = queue.Queue(maxsize=max_chunks)
+        self._error: Optional[BaseException] = None
+        self._cancelled = threading.Event()
+        self.stats = stats or AudioStreamStats()
+        self._context = contextvars.copy_context()
+        self._thread = threading.Thread(
+            target=self._context.run,
+            args=(self._run,),
+            name="audio-stream-producer",
+            daemon=True
+        )
+        self._started = False
+
+    def _put(self, item) -> bool:
+        """Put an item, giving up if the consumer cancelled the stream."""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        try:
+            for chunk in self._producer:
+                if not chunk:
+                    continue
+                self.stats.record_chunk(chunk)
+                if not self._put(chunk):
+                    return
+        except BaseException as err:
+            self._error = err
+        finally:
+            self.stats.finish()
+            self._put(_END_OF_STREAM)
+
+    def start(self) -> "BoundedChunkBuffer":
+        if not self._started:
+            self._started = True
+            self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Stop the producer thread; pending chunks are discarded."""
+        self._cancelled.set()
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.start()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _END_OF_STREAM:
+                    break
+                yield item
+            if self._error is not None:
+                raise self._error
+        finally:
+            self.cancel()
+
+    def parts(self, part_size: int) -> Iterator[bytes]:
+        """
+        Regroup the stream into parts of exactly `part_size` bytes (the last may be shorter).
+        Only one part is held in memory at a time.
+        """
+        if part_size <= 0:
+            raise ValueError("part_size must be positive")
+
+        part = bytearray()
+        for chunk in self:
+            view = memoryview(chunk)
+            while view:
+                take = min(part_size - len(part), len(view))
+                part += view[:take]
+                view = view[take:]
+                if len(part) == part_size:
+                    yield bytes(part)
+                    part = bytearray()
+
+        if part:
+            yield bytes(part)
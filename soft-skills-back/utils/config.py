@@ -14,6 +14,7 @@ top_dir = Path(__file__).resolve().parents[0]
 db_dir = top_dir / "db"
 sqlite_db_name = "tesis.db"
 sqlite_db_path = str(db_dir / sqlite_db_name)
+audio_dir = top_dir / "audio"
 
 # Only create db directory if not in serverless environment (Vercel)
 # In serverless, filesystem is read-only except /tmp, and we should use PostgreSQL
@@ -54,6 +55,68 @@ class Settings(BaseSettings):
   ELEVENLABS_DEFAULT_MODEL: str = os.getenv('ELEVENLABS_DEFAULT_MODEL', 'eleven_multilingual_v2')
   AUDIO_DEFAULT_FORMAT: str = os.getenv('AUDIO_DEFAULT_FORMAT', 'mp3')
   AUDIO_STORAGE_TYPE: str = os.getenv('AUDIO_STORAGE_TYPE', 'supabase')
+  DIALOGUE_TURN_SILENCE_MS: int = int(os.getenv('DIALOGUE_TURN_SILENCE_MS', '300'))
+  AUDIO_LOCAL_ROOT: str = os.getenv('AUDIO_LOCAL_ROOT', str(audio_dir))
+  AUDIO_LOCAL_BASE_URL: str | None = os.getenv('AUDIO_LOCAL_BASE_URL') # Origin prepended to local audio URLs
+  AUDIO_STREAM_BUFFER_CHUNKS: int = int(os.getenv('AUDIO_STREAM_BUFFER_CHUNKS', '64'))
+  AUDIO_MANIFEST_TTL_SECONDS: int = int(os.getenv('AUDIO_MANIFEST_TTL_SECONDS', '3600'))
+  AUDIO_MANIFEST_MAX_ENTRIES: int = int(os.getenv('AUDIO_MANIFEST_MAX_ENTRIES', '10000'))
+  AUDIO_VARIANTS_ENABLED: bool = os.getenv('AUDIO_VARIANTS_ENABLED', 'false').lower() == 'true' # Synthesize audio as PCM and store it as WAV with pre-rendered difficulty variants
+  AUDIO_VARIANT_SAMPLE_RATE: int = int(os.getenv('AUDIO_VARIANT_SAMPLE_RATE', '22050')) # 16000 | 22050 | 24000 | 44100
+
+  PREFETCH_WORKER_MODE: str = os.getenv('PREFETCH_WORKER_MODE', 'inline') # inline (thread in the API process) | external
+  PREFETCH_WORKER_CONCURRENCY: int = int(os.getenv('PREFETCH_WORKER_CONCURRENCY', '4'))
+  PREFETCH_POLL_INTERVAL_SECONDS: float = float(os.getenv('PREFETCH_POLL_INTERVAL_SECONDS', '1.0'))
+  PREFETCH_MAX_ATTEMPTS: int = int(os.getenv('PREFETCH_MAX_ATTEMPTS', '3'))
+  PREFETCH_RETRY_BACKOFF_SECONDS: float = float(os.getenv('PREFETCH_RETRY_BACKOFF_SECONDS', '2.0'))
+  PREFETCH_JOB_LEASE_SECONDS: int = int(os.getenv('PREFETCH_JOB_LEASE_SECONDS', '300'))
+  PREFETCH_MAX_LOOKAHEAD: int = int(os.getenv('PREFETCH_MAX_LOOKAHEAD', '4'))
+  PREFETCH_LATENCY_SAFETY_FACTOR: float = float(os.getenv('PREFETCH_LATENCY_SAFETY_FACTOR', '1.5'))
+  PREFETCH_DEFAULT_PREPARATION_MS: float = float(os.getenv('PREFETCH_DEFAULT_PREPARATION_MS', '20000'))
+  PREFETCH_DEFAULT_ROUND_MS: float = float(os.getenv('PREFETCH_DEFAULT_ROUND_MS', '60000'))
+  PREFETCH_PACE_SAMPLE_SIZE: int = int(os.getenv('PREFETCH_PACE_SAMPLE_SIZE', '5'))
+  PREFETCH_LATENCY_SAMPLE_SIZE: int = int(os.getenv('PREFETCH_LATENCY_SAMPLE_SIZE', '50'))
+  PREFETCH_MAX_OUTSTANDING_PER_USER: int = int(os.getenv('PREFETCH_MAX_OUTSTANDING_PER_USER', '6'))
+  PREFETCH_MAX_OUTSTANDING_GLOBAL: int = int(os.getenv('PREFETCH_MAX_OUTSTANDING_GLOBAL', '200'))
+
+  GRADER_WORKER_MODE: str = os.getenv('GRADER_WORKER_MODE', 'inline') # inline (thread in the API process) | external
+  GRADER_CONCURRENCY: int = int(os.getenv('GRADER_CONCURRENCY', '4'))
+  GRADER_POLL_INTERVAL_SECONDS: float = float(os.getenv('GRADER_POLL_INTERVAL_SECONDS', '1.0'))
+  GRADER_MAX_ATTEMPTS: int = int(os.getenv('GRADER_MAX_ATTEMPTS', '3'))
+  GRADER_LEASE_SECONDS: int = int(os.getenv('GRADER_LEASE_SECONDS', '120'))
+  GRADER_BATCH_MAX_ITEMS: int = int(os.getenv('GRADER_BATCH_MAX_ITEMS', '20'))
+
+  LLM_BACKEND: str = os.getenv('LLM_BACKEND', 'openai') # openai | fake (replay recordings offline) | record
+  LLM_MAX_CONNECTIONS: int = int(os.getenv('LLM_MAX_CONNECTIONS', '20'))
+  LLM_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv('LLM_MAX_KEEPALIVE_CONNECTIONS', '10'))
+  LLM_REQUEST_TIMEOUT_SECONDS: float = float(os.getenv('LLM_REQUEST_TIMEOUT_SECONDS', '60'))
+
+  TTS_BACKEND: str = os.getenv('TTS_BACKEND', 'elevenlabs') # elevenlabs | fake (replay recordings offline) | record
+  FAKE_RECORDINGS_DIR: str = os.getenv('FAKE_RECORDINGS_DIR', 'recordings')
+  FAKE_LLM_LATENCY: str = os.getenv('FAKE_LLM_LATENCY', 'lognormal:1500:0.4') # fixed:ms | uniform:low:high | normal:mean:std | lognormal:median:sigma
+  FAKE_LLM_FAILURE_RATE: float = float(os.getenv('FAKE_LLM_FAILURE_RATE', '0'))
+  FAKE_TTS_LATENCY: str = os.getenv('FAKE_TTS_LATENCY', 'lognormal:800:0.4')
+  FAKE_TTS_FAILURE_RATE: float = float(os.getenv('FAKE_TTS_FAILURE_RATE', '0'))
+  FAKE_BACKEND_SEED: int | None = int(os.getenv('FAKE_BACKEND_SEED')) if os.getenv('FAKE_BACKEND_SEED') else None
+
+  USAGE_RECORDING_ENABLED: bool = os.getenv('USAGE_RECORDING_ENABLED', 'true').lower() == 'true'
+  TTS_COST_PER_1K_CHARACTERS: float = float(os.getenv('TTS_COST_PER_1K_CHARACTERS', '0.30'))
+
+  LEXICAL_PRESCORING_MODE: str = os.getenv('LEXICAL_PRESCORING_MODE', 'shadow') # off | shadow (measure only, always call the LLM) | enforce
+  LEXICAL_MIN_WORDS: int = int(os.getenv('LEXICAL_MIN_WORDS', '3'))
+  LEXICAL_MIN_LENGTH_RATIO: float = float(os.getenv('LEXICAL_MIN_LENGTH_RATIO', '0.15')) # answer words / reference words
+  LEXICAL_OFF_TOPIC_SIMILARITY: float = float(os.getenv('LEXICAL_OFF_TOPIC_SIMILARITY', '0.06'))
+  LEXICAL_COPY_SIMILARITY: float = float(os.getenv('LEXICAL_COPY_SIMILARITY', '0.85')) # with the audio transcript; as close to the reference counts as a strong answer
+
+  CHALLENGE_BATCH_MAX_SIZE: int = int(os.getenv('CHALLENGE_BATCH_MAX_SIZE', '10')) # Challenges requested per LLM call when filling the pool
+
+  EVALUATION_CACHE_ENABLED: bool = os.getenv('EVALUATION_CACHE_ENABLED', 'true').lower() == 'true'
+  EVALUATION_CACHE_MAX_ENTRIES: int = int(os.getenv('EVALUATION_CACHE_MAX_ENTRIES', '5000'))
+
+  SUBMISSION_IDEMPOTENCY_CACHE_MAX_ENTRIES: int = int(os.getenv('SUBMISSION_IDEMPOTENCY_CACHE_MAX_ENTRIES', '10000'))
+
+  SESSION_EVENTS_POLL_SECONDS: float = float(os.getenv('SESSION_EVENTS_POLL_SECONDS', '5')) # Re-read interval; catches changes made by external workers
+  SESSION_EVENTS_HEARTBEAT_SECONDS: float = float(os.getenv('SESSION_EVENTS_HEARTBEAT_SECONDS', '15'))
   
   CORS_ORIGINS: str = os.getenv('CORS_ORIGINS', 'http://localhost:3000,http://localhost:5173')
 
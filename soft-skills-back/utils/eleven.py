@@ -1,11 +1,14 @@
 """ElevenLabs client for text-to-speech synthesis."""
 import logging
-from typing import Optional
+import time
+from typing import Iterator, Optional
 
 from elevenlabs import ElevenLabs
 
 from utils.config import get_settings
 from utils.dialogue import parse_speaker_turns, is_dialogue, SpeakerTurn, get_default_voice_for_speaker
+from utils.mp3 import concatenate_mp3, stitch_mp3_stream
+from utils.usage import record_tts_call
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -23,10 +26,100 @@ class ElevenLabsClient:
         """
         Collect audio bytes from the generator returned by elevenlabs.generate().
         """
-        audio_bytes = b""
+        buffer = bytearray()
         for chunk in audio_generator:
-            audio_bytes += chunk
-        return audio_bytes
+            buffer += chunk
+        return bytes(buffer)
+    
+    def _report_usage(self, operation: str, text: str, model_id: Optional[str], started: float, succeeded: bool) -> None:
+        record_tts_call(
+            model_name=model_id,
+            operation=operation,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            characters=len(text),
+            succeeded=succeeded
+        )
+    
+    def _instrumented_stream(self, chunks: Iterator[bytes], text: str, model_id: Optional[str]) -> Iterator[bytes]:
+        """Pass chunks through, reporting usage once the stream is drained, fails or is abandoned."""
+        started = time.perf_counter()
+        succeeded = False
+        try:
+            yield from chunks
+            succeeded = True
+        finally:
+            self._report_usage("stream_single", text, model_id, started, succeeded)
+    
+    def _resolve_turn_voice(self, turn: SpeakerTurn) -> Optional[str]:
+        voice_id = get_default_voice_for_speaker(turn.speaker, settings)
+        
+        if not voice_id:
+            logger.warning(f"No voice configured for {turn.speaker}, using default")
+            voice_id = settings.VOICE_DEFAULT_SINGLE
+        
+        return voice_id
+    
+    def stream_single(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """
+        Yield audio chunks as ElevenLabs produces them, without buffering the whole file.
+        """
+        voice_id = voice_id or settings.VOICE_DEFAULT_SINGLE
+        model_id = model_id or settings.ELEVENLABS_DEFAULT_MODEL
+        
+        if not voice_id:
+            raise ValueError("No voice ID configured")
+        
+        yield from self._instrumented_stream(self._generate_stream(text, voice_id, model_id), text, model_id)
+    
+    def _generate_stream(self, text: str, voice_id: str, model_id: str) -> Iterator[bytes]:
+        try:
+            audio_generator = self.client.generate(
+                text=text,
+                voice=voice_id,
+                model=model_id,
+                stream=True
+            )
+            
+            for chunk in audio_generator:
+                if chunk:
+                    yield chunk
+                    
+        except Exception as e:
+            logger.error(f"Error streaming audio: {str(e)}")
+            raise
+    
+    def stream_text(
+        self,
+        audio_text: str,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """
+        Streaming counterpart of synthesize_text. Single-voice audio is passed through as it
+        arrives; dialogue turns are stitched behind one Xing/Info header, which is only
+        known once the last turn ends, so dialogue audio is yielded after that.
+        """
+        model_id = model_id or settings.ELEVENLABS_DEFAULT_MODEL
+        
+        if not is_dialogue(audio_text):
+            yield from self.stream_single(audio_text, voice_id, model_id)
+            return
+        
+        turn_streams = (
+            self.stream_single(
+                text=turn.text,
+                voice_id=self._resolve_turn_voice(turn),
+                model_id=model_id
+            )
+            for turn in parse_speaker_turns(audio_text)
+        )
+        
+        yield from stitch_mp3_stream(turn_streams, silence_ms=settings.DIALOGUE_TURN_SILENCE_MS)
     
     def synthesize_single(
         self,
@@ -40,6 +133,8 @@ class ElevenLabsClient:
         if not voice_id:
             raise ValueError("No voice ID configured")
            
+        started = time.perf_counter()
+        succeeded = False
         try:
             audio_generator = self.client.generate(
                 text=text,
@@ -48,6 +143,7 @@ class ElevenLabsClient:
             )
             
             audio_bytes = self._save_audio_to_bytes(audio_generator)
+            succeeded = True
             
             logger.info(f"Generated {len(audio_bytes)} bytes of audio")
             return audio_bytes
@@ -55,6 +151,56 @@ class ElevenLabsClient:
         except Exception as e:
             logger.error(f"Error synthesizing audio: {str(e)}")
             raise
+        
+        finally:
+            self._report_usage("synthesize_single", text, model_id, started, succeeded)
+    
+    def _generate_pcm(self, text: str, voice_id: Optional[str], model_id: str, sample_rate: int) -> bytes:
+        if not voice_id:
+            raise ValueError("No voice ID configured")
+        
+        audio_generator = self.client.generate(
+            text=text,
+            voice=voice_id,
+            model=model_id,
+            output_format=f"pcm_{sample_rate}"
+        )
+        return self._save_audio_to_bytes(audio_generator)
+    
+    def synthesize_pcm(
+        self,
+        audio_text: str,
+        sample_rate: int,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+    ) -> bytes:
+        """
+        Synthesize raw 16-bit mono PCM, the input of the offline effects renderer.
+        Dialogue turns are joined with the same silence as the MP3 stitching.
+        """
+        model_id = model_id or settings.ELEVENLABS_DEFAULT_MODEL
+        
+        if is_dialogue(audio_text):
+            turns = [(turn.text, self._resolve_turn_voice(turn)) for turn in parse_speaker_turns(audio_text)]
+        else:
+            turns = [(audio_text, voice_id or settings.VOICE_DEFAULT_SINGLE)]
+        
+        silence = bytes(2 * sample_rate * settings.DIALOGUE_TURN_SILENCE_MS // 1000)
+        pcm_turns = []
+        
+        for text, turn_voice_id in turns:
+            started = time.perf_counter()
+            succeeded = False
+            try:
+                pcm_turns.append(self._generate_pcm(text, turn_voice_id, model_id, sample_rate))
+                succeeded = True
+            except Exception as e:
+                logger.error(f"Error synthesizing PCM audio: {str(e)}")
+                raise
+            finally:
+                self._report_usage("synthesize_pcm", text, model_id, started, succeeded)
+        
+        return silence.join(pcm_turns)
     
     def synthesize_dialogue(
         self,
@@ -63,29 +209,29 @@ class ElevenLabsClient:
     ) -> bytes:
         """
         Synthesize dialogue with multiple speakers by generating each turn separately
-        and concatenating the audio bytes.
+        and stitching the turns frame by frame into a single MP3.
         """
         model_id = model_id or settings.ELEVENLABS_DEFAULT_MODEL
         
         turn_audio_list = []
         
         for turn in turns:
-            voice_id = get_default_voice_for_speaker(turn.speaker, settings)
-            
-            if not voice_id:
-                logger.warning(f"No voice configured for {turn.speaker}, using default")
-                voice_id = settings.VOICE_DEFAULT_SINGLE
-            
             turn_audio = self.synthesize_single(
                 text=turn.text,
-                voice_id=voice_id,
+                voice_id=self._resolve_turn_voice(turn),
                 model_id=model_id
             )
             
             turn_audio_list.append(turn_audio)
         
-        # Simple concatenation of MP3 bytes
-        combined_audio = b"".join(turn_audio_list)
+        try:
+            combined_audio = concatenate_mp3(
+                turn_audio_list,
+                silence_ms=settings.DIALOGUE_TURN_SILENCE_MS
+            )
+        except ValueError as e:
+            logger.warning(f"Frame-aware MP3 stitching failed ({str(e)}), falling back to raw concatenation")
+            combined_audio = b"".join(turn_audio_list)
         
         logger.info(f"Generated dialogue audio: {len(combined_audio)} bytes")
         return combined_audio
@@ -111,7 +257,21 @@ class ElevenLabsClient:
 
 def get_elevenlabs_client() -> ElevenLabsClient:
     """
-    Get a configured ElevenLabs client instance.
+    Get a configured text-to-speech client (TTS_BACKEND: "elevenlabs", "fake" or "record").
     """
-    return ElevenLabsClient()
+    backend = (settings.TTS_BACKEND or "elevenlabs").lower()
+    
+    if backend == "elevenlabs":
+        return ElevenLabsClient()
+    
+    from utils.fake_backends import default_recordings_store
+    from utils.fake_tts import FakeTTSClient, RecordingTTSClient, fake_tts_conditions
+    
+    if backend == "fake":
+        return FakeTTSClient(default_recordings_store(), fake_tts_conditions())
+    
+    if backend == "record":
+        return RecordingTTSClient(default_recordings_store())
+    
+    raise ValueError(f"Unsupported TTS backend: {settings.TTS_BACKEND}")
 
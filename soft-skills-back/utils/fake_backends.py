@@ -0,0 +1,141 @@
+"""
+Shared pieces of the offline LLM/TTS stand-ins used for load testing.
+
+Latency is described with a small spec string (see `LatencyDistribution.parse`),
+failures are injected at a fixed rate, and recorded responses live on disk
+under `<recordings dir>/<kind>/<group>/<key>.<ext>`.
+"""
+import hashlib
+import math
+import random
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from utils.config import settings
+from utils.metrics import metrics
+
+
+class SimulatedBackendError(RuntimeError):
+    """Raised by a fake backend when failure injection fires."""
+
+
+def recording_key(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()[:32]
+
+
+class LatencyDistribution:
+    """
+    Latency in milliseconds drawn from one of:
+
+    - "fixed:800"
+    - "uniform:200:1200"      (low, high)
+    - "normal:800:200"        (mean, stddev; clipped at 0)
+    - "lognormal:800:0.5"     (median, sigma) — long right tail like real APIs
+    """
+    KINDS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, kind: str, params: List[float]):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unsupported latency distribution: {kind}")
+        expected = 1 if kind == "fixed" else 2
+        if len(params) != expected:
+            raise ValueError(f"Latency distribution '{kind}' takes {expected} parameter(s)")
+        self.kind = kind
+        self.params = params
+
+    @classmethod
+    def parse(cls, spec: Optional[str]) -> "LatencyDistribution":
+        if not spec:
+            return cls("fixed", [0.0])
+        kind, *raw_params = spec.strip().split(":")
+        return cls(kind.strip().lower(), [float(param) for param in raw_params])
+
+    def sample_ms(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(self.params[0], self.params[1])
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(self.params[0], self.params[1]))
+        return self.params[0] * math.exp(rng.gauss(0.0, self.params[1]))
+
+    def __repr__(self) -> str:
+        return f"{self.kind}:{':'.join(str(param) for param in self.params)}"
+
+
+class SimulatedConditions:
+    """Latency and failure injection for one fake backend."""
+
+    def __init__(
+        self,
+        backend: str,
+        latency: LatencyDistribution,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.backend = backend
+        self.latency = latency
+        self.failure_rate = min(max(failure_rate, 0.0), 1.0)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def choice(self, options: list):
+        with self._lock:
+            return self._rng.choice(options)
+
+    def apply(self, operation: str) -> None:
+        """Sleep for a sampled latency, then fail at the configured rate."""
+        with self._lock:
+            delay_ms = self.latency.sample_ms(self._rng)
+            fail = self._rng.random() < self.failure_rate
+
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        metrics.observe("fake_backend_latency_ms", delay_ms, backend=self.backend, operation=operation)
+
+        if fail:
+            metrics.increment("fake_backend_failures_total", backend=self.backend, operation=operation)
+            raise SimulatedBackendError(f"Simulated {self.backend} failure during {operation}")
+
+
+class RecordingStore:
+    """Recorded responses on disk, grouped by kind (llm, tts) and group (schema, voice...)."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _group_dir(self, kind: str, group: str) -> Path:
+        return self.root / kind / group
+
+    def path_for(self, kind: str, group: str, key: str, extension: str) -> Path:
+        return self._group_dir(kind, group) / f"{key}.{extension}"
+
+    def find(self, kind: str, group: str, key: str, extension: str) -> Optional[Path]:
+        path = self.path_for(kind, group, key, extension)
+        return path if path.exists() else None
+
+    def list(self, kind: str, group: str, extension: str) -> List[Path]:
+        group_dir = self._group_dir(kind, group)
+        if not group_dir.exists():
+            return []
+        return sorted(group_dir.glob(f"*.{extension}"))
+
+    def save(self, kind: str, group: str, key: str, extension: str, data: bytes) -> Path:
+        path = self.path_for(kind, group, key, extension)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        return path
+
+
+def default_recordings_store() -> RecordingStore:
+    """Store rooted at FAKE_RECORDINGS_DIR, shared by the LLM and TTS stand-ins."""
+    return RecordingStore(Path(settings.FAKE_RECORDINGS_DIR))
@@ -0,0 +1,165 @@
+"""
+Offline stand-ins for ElevenLabsClient, selected with TTS_BACKEND.
+
+- "fake": replays recorded MP3s per voice, with simulated latency and failures,
+  falling back to digital silence roughly as long as the text would take to read.
+- "record": synthesizes with ElevenLabs as usual and saves every clip for replay.
+
+Dialogue handling and MP3 stitching are inherited from ElevenLabsClient, so
+the CPU work of a real synthesis is still exercised.
+"""
+import logging
+import time
+from typing import Iterator, Optional
+
+from utils.config import get_settings
+from utils.eleven import ElevenLabsClient
+from utils.fake_backends import LatencyDistribution, RecordingStore, SimulatedConditions, recording_key
+from utils.metrics import metrics
+from utils.mp3 import Mp3FrameHeader, build_silence_frames
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, mono
+SILENCE_FRAME_HEADER = Mp3FrameHeader(b"\xff\xfb\x90\xc0")
+SPOKEN_MS_PER_CHARACTER = 65
+MIN_SILENCE_MS = 500
+STREAM_CHUNK_SIZE = 4096
+
+
+def _voice_group(voice_id: Optional[str]) -> str:
+    return voice_id or "default"
+
+
+def _clip_key(text: str, voice_id: Optional[str], model_id: Optional[str]) -> str:
+    return recording_key(_voice_group(voice_id), model_id or "", text)
+
+
+class FakeTTSClient(ElevenLabsClient):
+    """Drop-in replacement for ElevenLabsClient that never calls ElevenLabs."""
+
+    def __init__(self, store: RecordingStore, conditions: SimulatedConditions):
+        self.store = store
+        self.conditions = conditions
+
+    def _clip_for(self, text: str, voice_id: Optional[str], model_id: Optional[str]) -> bytes:
+        group = _voice_group(voice_id)
+        recording = self.store.find("tts", group, _clip_key(text, voice_id, model_id), "mp3")
+        source = "exact"
+
+        if recording is None:
+            recordings = self.store.list("tts", group, "mp3")
+            recording = self.conditions.choice(recordings) if recordings else None
+            source = "replayed"
+
+        if recording is None:
+            metrics.increment("fake_tts_clips_total", source="silence")
+            duration_ms = max(MIN_SILENCE_MS, len(text) * SPOKEN_MS_PER_CHARACTER)
+            return build_silence_frames(SILENCE_FRAME_HEADER, duration_ms)
+
+        metrics.increment("fake_tts_clips_total", source=source)
+        return recording.read_bytes()
+
+    def _generate_pcm(self, text: str, voice_id: Optional[str], model_id: str, sample_rate: int) -> bytes:
+        # Recordings are MP3 and cannot be decoded here, so PCM is always silence of reading length
+        self.conditions.apply("synthesize_pcm")
+        metrics.increment("fake_tts_clips_total", source="silence")
+        duration_ms = max(MIN_SILENCE_MS, len(text) * SPOKEN_MS_PER_CHARACTER)
+        return bytes(2 * sample_rate * duration_ms // 1000)
+
+    def stream_single(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        voice_id = voice_id or settings.VOICE_DEFAULT_SINGLE
+        model_id = model_id or settings.ELEVENLABS_DEFAULT_MODEL
+
+        yield from self._instrumented_stream(self._fake_stream(text, voice_id, model_id), text, model_id)
+
+    def _fake_stream(self, text: str, voice_id: Optional[str], model_id: Optional[str]) -> Iterator[bytes]:
+        self.conditions.apply("stream_single")
+        audio = self._clip_for(text, voice_id, model_id)
+
+        for offset in range(0, len(audio), STREAM_CHUNK_SIZE):
+            yield audio[offset:offset + STREAM_CHUNK_SIZE]
+
+    def synthesize_single(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+    ) -> bytes:
+        voice_id = voice_id or settings.VOICE_DEFAULT_SINGLE
+        model_id = model_id or settings.ELEVENLABS_DEFAULT_MODEL
+
+        started = time.perf_counter()
+        succeeded = False
+        try:
+            self.conditions.apply("synthesize_single")
+            audio = self._clip_for(text, voice_id, model_id)
+            succeeded = True
+            return audio
+        finally:
+            self._report_usage("synthesize_single", text, model_id, started, succeeded)
+
+
+class RecordingTTSClient(ElevenLabsClient):
+    """ElevenLabsClient that saves every synthesized clip for the fake backend to replay."""
+
+    def __init__(self, store: RecordingStore, api_key: Optional[str] = None):
+        super().__init__(api_key=api_key)
+        self.store = store
+
+    def _record(self, text: str, voice_id: Optional[str], model_id: Optional[str], audio: bytes) -> None:
+        try:
+            self.store.save("tts", _voice_group(voice_id), _clip_key(text, voice_id, model_id), "mp3", audio)
+        except Exception as err:
+            logger.warning(f"Could not record TTS clip: {err}")
+
+    def stream_single(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        voice_id = voice_id or settings.VOICE_DEFAULT_SINGLE
+        model_id = model_id or settings.ELEVENLABS_DEFAULT_MODEL
+
+        recorded = bytearray()
+        for chunk in super().stream_single(text, voice_id, model_id):
+            recorded += chunk
+            yield chunk
+
+        self._record(text, voice_id, model_id, bytes(recorded))
+
+    def synthesize_single(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+    ) -> bytes:
+        voice_id = voice_id or settings.VOICE_DEFAULT_SINGLE
+        model_id = model_id or settings.ELEVENLABS_DEFAULT_MODEL
+
+        audio = super().synthesize_single(text, voice_id, model_id)
+        self._record(text, voice_id, model_id, audio)
+        return audio
+
+
+_fake_tts_conditions: Optional[SimulatedConditions] = None
+
+
+def fake_tts_conditions() -> SimulatedConditions:
+    """Shared across clients so the seeded random stream and failure rate are process-wide."""
+    global _fake_tts_conditions
+    if _fake_tts_conditions is None:
+        _fake_tts_conditions = SimulatedConditions(
+            backend="tts",
+            latency=LatencyDistribution.parse(settings.FAKE_TTS_LATENCY),
+            failure_rate=settings.FAKE_TTS_FAILURE_RATE,
+            seed=settings.FAKE_BACKEND_SEED
+        )
+    return _fake_tts_conditions
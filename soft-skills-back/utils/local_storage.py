@@ -0,0 +1,137 @@
+"""Local-filesystem backend for challenge audio, served by the /audio route."""
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+from enums.listening_game import AudioStorage
+from utils.audio_manifest import audio_manifest
+from utils.config import get_settings
+from utils.storage import AudioStorageBackend, _normalize_path
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class LocalFileStorage(AudioStorageBackend):
+    """
+    Store objects under `root_dir/<bucket>/<dir>/<aa>/<bb>/<filename>`.
+
+    The two shard levels come from a hash of the filename, so no directory grows past
+    a few hundred entries. Writes go to a temporary file in the target directory that
+    is fsynced and renamed into place, so readers never see a partial file.
+    """
+    storage_type = AudioStorage.local
+    upload_part_size = 256 * 1024
+
+    def __init__(self, root_dir: Optional[str] = None, public_base_url: Optional[str] = None):
+        self.root_dir = Path(root_dir or settings.AUDIO_LOCAL_ROOT).resolve()
+        self.public_base_url = public_base_url if public_base_url is not None else settings.AUDIO_LOCAL_BASE_URL
+
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+    def resolve_path(self, bucket_name: str, file_path: str) -> Path:
+        """Map a logical (bucket, path) key to its sharded location on disk."""
+        normalized_path = _normalize_path(file_path)
+        logical = Path(normalized_path)
+
+        if ".." in logical.parts or "/" in bucket_name or bucket_name in ("", ".", ".."):
+            raise ValueError(f"Invalid storage path: {bucket_name}/{normalized_path}")
+
+        digest = hashlib.sha1(logical.name.encode("utf-8")).hexdigest()
+        resolved = (self.root_dir / bucket_name / logical.parent / digest[:2] / digest[2:4] / logical.name).resolve()
+
+        if self.root_dir not in resolved.parents:
+            raise ValueError(f"Invalid storage path: {bucket_name}/{normalized_path}")
+
+        return resolved
+
+    def exists(self, bucket_name: str, file_path: str) -> bool:
+        try:
+            return self.resolve_path(bucket_name, file_path).is_file()
+        except ValueError:
+            return False
+
+    def _write_atomically(self, target: Path, parts: Iterable[bytes], upsert: bool) -> int:
+        if not upsert and target.exists():
+            raise FileExistsError(f"File already exists: {target}")
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        written = 0
+
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                for part in parts:
+                    temp_file.write(part)
+                    written += len(part)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+
+            if written == 0:
+                raise ValueError("Cannot upload empty data")
+
+            os.replace(temp_path, target)
+            return written
+
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def upload(
+        self,
+        bucket_name: str,
+        file_path: str,
+        data: bytes,
+        content_type: Optional[str] = None,
+        upsert: bool = True,
+    ) -> str:
+        """Write bytes to local storage atomically and return the serving URL."""
+        if not data:
+            raise ValueError("Cannot upload empty data")
+
+        return self.upload_stream(bucket_name, file_path, [data], content_type, upsert)
+
+    def upload_stream(
+        self,
+        bucket_name: str,
+        file_path: str,
+        parts: Iterable[bytes],
+        content_type: Optional[str] = None,
+        upsert: bool = True,
+    ) -> str:
+        """Write a stream of parts to local storage atomically and return the serving URL."""
+        target = self.resolve_path(bucket_name, file_path)
+
+        try:
+            self._write_atomically(target, parts, upsert)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to upload file: {str(e)}")
+
+        return self.get_public_url(bucket_name, file_path)
+
+    def get_public_url(self, bucket_name: str, file_path: str) -> str:
+        normalized_path = _normalize_path(file_path)
+        base_url = (self.public_base_url or "").rstrip("/")
+
+        return f"{base_url}/api/v1/audio/{bucket_name}/{normalized_path}"
+
+    def delete(self, bucket_name: str, file_path: str) -> bool:
+        try:
+            self.resolve_path(bucket_name, file_path).unlink()
+            audio_manifest.invalidate(bucket_name, _normalize_path(file_path))
+
+            logger.info(f"File deleted successfully: {file_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting file: {str(e)}")
+            return False
@@ -0,0 +1,384 @@
+"""
+Frame-level MP3 utilities for stitching multi-speaker audio without re-encoding.
+
+Only MPEG Layer III is handled, which is what ElevenLabs returns. Frames are copied
+as-is; the parser only reads the 4-byte frame headers to find frame boundaries.
+"""
+import logging
+import struct
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MPEG1 = 3
+_MPEG2 = 2
+_MPEG25 = 0
+
+_BITRATES_KBPS = {
+    _MPEG1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    _MPEG2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_BITRATES_KBPS[_MPEG25] = _BITRATES_KBPS[_MPEG2]
+
+_SAMPLE_RATES = {
+    _MPEG1: (44100, 48000, 32000),
+    _MPEG2: (22050, 24000, 16000),
+    _MPEG25: (11025, 12000, 8000),
+}
+
+_MONO = 3
+_XING_FLAGS_FRAMES = 0x1
+_XING_FLAGS_BYTES = 0x2
+_XING_FLAGS_TOC = 0x4
+_ID3V2_HEADER_LENGTH = 10
+
+
+class Mp3FrameHeader:
+    """Decoded 4-byte MPEG Layer III frame header."""
+    __slots__ = ("raw", "version", "protected", "bitrate_index", "sample_rate_index", "padding", "channel_mode")
+
+    def __init__(self, raw: bytes):
+        self.raw = bytes(raw[:4])
+        b1, b2, b3 = self.raw[1], self.raw[2], self.raw[3]
+        self.version = (b1 >> 3) & 0x03
+        self.protected = not (b1 & 0x01)
+        self.bitrate_index = (b2 >> 4) & 0x0F
+        self.sample_rate_index = (b2 >> 2) & 0x03
+        self.padding = (b2 >> 1) & 0x01
+        self.channel_mode = (b3 >> 6) & 0x03
+
+    @classmethod
+    def parse(cls, data, offset: int = 0) -> Optional["Mp3FrameHeader"]:
+        """Return the header at `offset`, or None if the bytes are not a Layer III frame header."""
+        if len(data) - offset < 4:
+            return None
+
+        b0, b1, b2 = data[offset], data[offset + 1], data[offset + 2]
+        if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+            return None
+        if (b1 >> 3) & 0x03 == 1:  # reserved version
+            return None
+        if (b1 >> 1) & 0x03 != 1:  # not Layer III
+            return None
+        bitrate_index = (b2 >> 4) & 0x0F
+        if bitrate_index in (0, 15):  # free format / invalid
+            return None
+        if (b2 >> 2) & 0x03 == 3:  # reserved sample rate
+            return None
+
+        return cls(data[offset:offset + 4])
+
+    @property
+    def bitrate_kbps(self) -> int:
+        return _BITRATES_KBPS[self.version][self.bitrate_index]
+
+    @property
+    def sample_rate(self) -> int:
+        return _SAMPLE_RATES[self.version][self.sample_rate_index]
+
+    @property
+    def samples_per_frame(self) -> int:
+        return 1152 if self.version == _MPEG1 else 576
+
+    @property
+    def side_info_length(self) -> int:
+        if self.version == _MPEG1:
+            return 17 if self.channel_mode == _MONO else 32
+        return 9 if self.channel_mode == _MONO else 17
+
+    @property
+    def frame_length(self) -> int:
+        coefficient = 144 if self.version == _MPEG1 else 72
+        return coefficient * self.bitrate_kbps * 1000 // self.sample_rate + self.padding
+
+    def is_compatible(self, other: "Mp3FrameHeader") -> bool:
+        """Frames can share one stream when version, sample rate and channel layout match."""
+        return (
+            self.version == other.version
+            and self.sample_rate_index == other.sample_rate_index
+            and (self.channel_mode == _MONO) == (other.channel_mode == _MONO)
+        )
+
+    def with_fields(self, bitrate_index: Optional[int] = None, padding: int = 0) -> "Mp3FrameHeader":
+        """Copy of this header without CRC, with the given bitrate index and padding bit."""
+        raw = bytearray(self.raw)
+        raw[1] |= 0x01
+        index = self.bitrate_index if bitrate_index is None else bitrate_index
+        raw[2] = (index << 4) | (self.sample_rate_index << 2) | (padding << 1) | (raw[2] & 0x01)
+        return Mp3FrameHeader(raw)
+
+
+def _is_info_frame(frame: bytes, header: Mp3FrameHeader) -> bool:
+    """Detect a Xing/Info or VBRI metadata frame (which carries no audio)."""
+    tag_offset = 4 + (2 if header.protected else 0) + header.side_info_length
+    if frame[tag_offset:tag_offset + 4] in (b"Xing", b"Info"):
+        return True
+    return frame[36:40] == b"VBRI"
+
+
+def _id3v2_tag_length(data, offset: int) -> Optional[int]:
+    """Total length of an ID3v2 tag at `offset` (None if more bytes are needed, 0 if no tag)."""
+    if len(data) - offset < 3:
+        return None
+    if bytes(data[offset:offset + 3]) != b"ID3":
+        return 0
+    if len(data) - offset < _ID3V2_HEADER_LENGTH:
+        return None
+
+    flags = data[offset + 5]
+    size_bytes = data[offset + 6:offset + 10]
+    size = 0
+    for byte in size_bytes:
+        size = (size << 7) | (byte & 0x7F)
+
+    footer = _ID3V2_HEADER_LENGTH if flags & 0x10 else 0
+    return _ID3V2_HEADER_LENGTH + size + footer
+
+
+class Mp3FrameReader:
+    """
+    Incremental frame reader for a single MP3 segment.
+
+    Feed raw bytes as they arrive; complete audio frames are returned in order. ID3v2
+    tags, the Xing/Info/VBRI frame and any trailing tags (ID3v1, APE) are dropped.
+    """
+    def __init__(self):
+        self._buffer = bytearray()
+        self._skip = 0
+        self._audio_frames_seen = 0
+        self._at_start = True
+        self._resyncing = False
+        self.first_header: Optional[Mp3FrameHeader] = None
+
+    def feed(self, chunk: bytes) -> List[Tuple[Mp3FrameHeader, bytes]]:
+        self._buffer += chunk
+        return self._drain(final=False)
+
+    def close(self) -> List[Tuple[Mp3FrameHeader, bytes]]:
+        frames = self._drain(final=True)
+        self._buffer.clear()
+        return frames
+
+    @staticmethod
+    def _is_frame_boundary(buffer, offset: int) -> bool:
+        if Mp3FrameHeader.parse(buffer, offset):
+            return True
+        return bytes(buffer[offset:offset + 3]) in (b"TAG", b"APE", b"ID3")
+
+    def _find_sync(self, start: int) -> int:
+        """Position of the next plausible frame header (or a partial one at the end of the buffer)."""
+        buffer = self._buffer
+        position = buffer.find(b"\xff", start)
+        while position != -1:
+            if len(buffer) - position < 4 or Mp3FrameHeader.parse(buffer, position):
+                return position
+            position = buffer.find(b"\xff", position + 1)
+        return len(buffer)
+
+    def _drain(self, final: bool) -> List[Tuple[Mp3FrameHeader, bytes]]:
+        buffer = self._buffer
+        frames: List[Tuple[Mp3FrameHeader, bytes]] = []
+        position = 0
+
+        if self._skip:
+            consumed = min(self._skip, len(buffer))
+            self._skip -= consumed
+            position = consumed
+
+        while position < len(buffer):
+            if self._at_start:
+                tag_length = _id3v2_tag_length(buffer, position)
+                if tag_length is None and not final:
+                    break
+                if tag_length:
+                    self._skip = max(0, position + tag_length - len(buffer))
+                    position = min(len(buffer), position + tag_length)
+                    continue
+                self._at_start = False
+
+            header = Mp3FrameHeader.parse(buffer, position)
+            if header is None:
+                if len(buffer) - position < 4:
+                    if final:
+                        position = len(buffer)
+                    break
+                self._resyncing = True
+                position = self._find_sync(position + 1)
+                continue
+
+            end = position + header.frame_length
+            if end > len(buffer):
+                if final:
+                    position = len(buffer)
+                break
+
+            # After skipping garbage, only trust a sync word once the next frame lines up too.
+            if self._resyncing:
+                if end + 4 > len(buffer) and not final:
+                    break
+                if end + 4 <= len(buffer) and not self._is_frame_boundary(buffer, end):
+                    position = self._find_sync(position + 1)
+                    continue
+                self._resyncing = False
+
+            frame = bytes(buffer[position:end])
+            position = end
+
+            if self._audio_frames_seen == 0 and _is_info_frame(frame, header):
+                continue
+
+            if self.first_header is None:
+                self.first_header = header
+            self._audio_frames_seen += 1
+            frames.append((header, frame))
+
+        del buffer[:position]
+        return frames
+
+
+def iter_frames(data: bytes) -> List[Tuple[Mp3FrameHeader, bytes]]:
+    """Split a complete MP3 file into its audio frames, dropping tags and metadata frames."""
+    reader = Mp3FrameReader()
+    return reader.feed(data) + reader.close()
+
+
+def build_silence_frames(reference: Mp3FrameHeader, duration_ms: int) -> bytes:
+    """
+    Build digital-silence frames matching `reference`.
+
+    A Layer III frame whose side info is all zero has no main data and decodes to silence,
+    so no encoder is needed.
+    """
+    if duration_ms <= 0:
+        return b""
+
+    header = reference.with_fields(padding=0)
+    frame_count = round(duration_ms / 1000 * header.sample_rate / header.samples_per_frame)
+    frame = header.raw + bytes(header.frame_length - 4)
+    return frame * frame_count
+
+
+def build_xing_frame(
+    reference: Mp3FrameHeader,
+    frame_sizes: Sequence[int],
+    is_vbr: bool,
+) -> bytes:
+    """
+    Build a Xing ("Info" for constant bitrate) frame describing the audio frames that follow:
+    frame count, byte count and a 100-entry seek table.
+    """
+    tag_size = 4 + 4 + 4 + 4 + 100
+    bitrate_index = reference.bitrate_index
+    header = reference.with_fields(bitrate_index=bitrate_index)
+    while header.frame_length < 4 + header.side_info_length + tag_size and bitrate_index < 14:
+        bitrate_index += 1
+        header = reference.with_fields(bitrate_index=bitrate_index)
+
+    xing_length = header.frame_length
+    audio_bytes = sum(frame_sizes)
+    total_bytes = xing_length + audio_bytes
+    frame_count = len(frame_sizes)
+
+    offsets = []
+    running = xing_length
+    for size in frame_sizes:
+        offsets.append(running)
+        running += size
+
+    toc = bytearray(100)
+    if frame_count:
+        for percent in range(100):
+            frame_index = min(frame_count - 1, percent * frame_count // 100)
+            toc[percent] = min(255, offsets[frame_index] * 256 // total_bytes)
+
+    flags = _XING_FLAGS_FRAMES | _XING_FLAGS_BYTES | _XING_FLAGS_TOC
+    tag = (
+        (b"Xing" if is_vbr else b"Info")
+        + struct.pack(">III", flags, frame_count, total_bytes)
+        + bytes(toc)
+    )
+
+    frame = bytearray(xing_length)
+    frame[:4] = header.raw
+    tag_offset = 4 + header.side_info_length
+    frame[tag_offset:tag_offset + len(tag)] = tag
+    return bytes(frame)
+
+
+class _FrameStitcher:
+    """Collects the audio frames of consecutive segments, with silence between them."""
+    def __init__(self, silence_ms: int):
+        self.silence_ms = silence_ms
+        self.frames: List[bytes] = []
+        self.reference: Optional[Mp3FrameHeader] = None
+        self.bitrates = set()
+
+    def start_segment(self, header: Mp3FrameHeader, index: int) -> None:
+        if self.reference is None:
+            self.reference = header
+        elif not self.reference.is_compatible(header):
+            raise ValueError(f"Segment {index} has an incompatible MP3 format")
+        elif self.silence_ms > 0:
+            silence = build_silence_frames(self.reference, self.silence_ms)
+            frame_length = self.reference.with_fields(padding=0).frame_length
+            self.frames.extend(silence[i:i + frame_length] for i in range(0, len(silence), frame_length))
+
+    def add(self, frames: List[Tuple[Mp3FrameHeader, bytes]]) -> None:
+        for header, frame in frames:
+            self.bitrates.add(header.bitrate_index)
+            self.frames.append(frame)
+
+    def xing_frame(self) -> bytes:
+        if self.reference is None:
+            raise ValueError("No MP3 frames found in segments")
+        return build_xing_frame(self.reference, [len(frame) for frame in self.frames], is_vbr=len(self.bitrates) > 1)
+
+
+def concatenate_mp3(segments: Sequence[bytes], silence_ms: int = 0) -> bytes:
+    """
+    Stitch MP3 segments into one stream with a single, correct Xing/Info header.
+
+    Per-segment ID3 tags and Xing headers are stripped, and `silence_ms` of silent frames
+    is inserted between segments. Raises ValueError if segments have incompatible formats.
+    """
+    stitcher = _FrameStitcher(silence_ms)
+
+    for index, segment in enumerate(segments):
+        segment_frames = iter_frames(segment)
+        if not segment_frames:
+            continue
+
+        stitcher.start_segment(segment_frames[0][0], index)
+        stitcher.add(segment_frames)
+
+    return b"".join([stitcher.xing_frame(), *stitcher.frames])
+
+
+def stitch_mp3_stream(segments: Iterable[Iterable[bytes]], silence_ms: int = 0) -> Iterator[bytes]:
+    """
+    Variant of concatenate_mp3 for segments that arrive in chunks.
+
+    Each segment is parsed as its chunks arrive, so tags and headers are stripped while the
+    next one is still being produced. The Xing/Info header carries the frame and byte totals
+    and must come before the audio, so the stitched frames are held until the last segment
+    ends and yielded after it; memory grows with the compressed audio (about 1 MB per minute
+    at 128 kbps), not with the chunking.
+    """
+    stitcher = _FrameStitcher(silence_ms)
+
+    for index, segment in enumerate(segments):
+        reader = Mp3FrameReader()
+        started = False
+
+        for chunk in chain(segment, [None]):
+            frames = reader.close() if chunk is None else reader.feed(chunk)
+            if not frames:
+                continue
+            if not started:
+                started = True
+                stitcher.start_segment(frames[0][0], index)
+            stitcher.add(frames)
+
+    yield stitcher.xing_frame()
+    yield b"".join(stitcher.frames)
@@ -26,6 +26,8 @@ GAME_SESSION_READ_EXAMPLE = {
     "status": "pending",
     "current_round": 1,
     "total_score": 0.0,
+    "total_max_score": 0.0,
+    "attempted_rounds": 0,
     "created_at": "2025-10-26T08:30:00Z",
     "started_at": None,
     "finished_at": None
@@ -38,6 +40,8 @@ GAME_SESSION_DETAIL_EXAMPLE = {
     "status": "active",
     "current_round": 3,
     "total_score": 245.5,
+    "total_max_score": 300.0,
+    "attempted_rounds": 2,
     "created_at": "2025-10-26T08:30:00Z",
     "started_at": "2025-10-26T08:32:00Z",
     "finished_at": None,
@@ -90,6 +94,7 @@ GAME_SESSION_CONFIG_READ_EXAMPLE = {
     },
     "selected_modes": ["focus", "cloze", "paraphrase", "summarize"],
     "allowed_types": ["descriptive", "historical_event", "instructional"],
+    "grading_mode": "sync",
     "audio_effects": {
         "reverb": 0.3,
         "echo": 0.15,
@@ -104,6 +109,8 @@ GAME_SESSION_SUMMARY_EXAMPLE = {
     "status": "finished",
     "current_round": 5,
     "total_score": 487.5,
+    "total_max_score": 500.0,
+    "attempted_rounds": 5,
     "created_at": "2025-10-26T08:30:00Z"
 }
 
@@ -136,6 +143,17 @@ CHALLENGE_READ_EXAMPLE = {
     "created_at": "2025-10-26T08:30:00Z"
 }
 
+CHALLENGE_BATCH_CREATE_EXAMPLE = {
+    **CHALLENGE_CREATE_EXAMPLE,
+    "count": 5
+}
+
+CHALLENGE_BATCH_READ_EXAMPLE = {
+    "requested": 5,
+    "rejected": 1,
+    "created": [CHALLENGE_READ_EXAMPLE]
+}
+
 CHALLENGE_AUDIO_RESPONSE_EXAMPLE = {
     "audio_url": "https://cdn.example.com/challenges-audio/123e4567-e89b-12d3-a456-426614174000.mp3"
 }
@@ -153,6 +171,7 @@ CURRENT_ROUND_CONFIG_EXAMPLE = {
 CURRENT_ROUND_RESPONSE_EXAMPLE = {
     "round_id": "550e8400-e29b-41d4-a716-446655440000",
     "audio_url": "https://storage.supabase.co/audio/challenge_001.mp3",
+    "audio_effects_applied": False,
     "config": CURRENT_ROUND_CONFIG_EXAMPLE,
     "current_round": 1,
     "status": "served",
@@ -402,7 +421,17 @@ ATTEMPT_SUBMISSION_RESPONSE_EXAMPLE = {
     "score": 8.5,
     "feedback_short": "Excellent paraphrase!",
     "client_elapsed_ms": 45000,
-    "can_advance": True
+    "can_advance": True,
+    "evaluation_status": "evaluated"
+}
+
+ROUND_GRADING_RESPONSE_EXAMPLE = {
+    "round_number": 3,
+    "evaluation_status": "pending_evaluation",
+    "is_correct": None,
+    "score": None,
+    "max_score": 10.0,
+    "feedback_short": "Tu respuesta se está evaluando."
 }
 
 ROUND_ADVANCE_RESPONSE_EXAMPLE = {
@@ -414,7 +443,8 @@ SESSION_FINISH_RESPONSE_EXAMPLE = {
     "final_score": 85.5,
     "final_max_score": 100.0,
     "started_at": "2025-10-26T08:32:00Z",
-    "finished_at": "2025-10-26T09:15:00Z"
+    "finished_at": "2025-10-26T09:15:00Z",
+    "pending_evaluations": 0
 }
 
 SESSION_RESULT_RESPONSE_EXAMPLE = {
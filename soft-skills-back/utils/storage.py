@@ -1,17 +1,27 @@
-"""Supabase client for file storage operations."""
+"""Storage backends for challenge audio files (Supabase and local disk)."""
+import base64
 import logging
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 
+import httpx
 from supabase import Client, create_client
 from supabase.lib.client_options import ClientOptions
 
 from utils.config import get_settings
+from utils.audio_manifest import audio_manifest
+from enums.listening_game import AudioStorage
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# Supabase's resumable (TUS) endpoint only accepts 6 MB chunks, except for the last one.
+RESUMABLE_CHUNK_SIZE = 6 * 1024 * 1024
+TUS_VERSION = "1.0.0"
+
 
 def _normalize_path(path: str) -> str:
     """Normalize file path for Supabase storage."""
@@ -19,7 +29,80 @@ def _normalize_path(path: str) -> str:
     return normalized.lstrip("/")
 
 
-class SupabaseStorage:
+def infer_content_type(file_path: str) -> str:
+    """
+    Infer MIME type from file extension.
+    """
+    extension = Path(file_path).suffix.lower()
+
+    content_types = {
+        ".mp3": "audio/mpeg",
+        ".wav": "audio/wav",
+        ".ogg": "audio/ogg",
+        ".m4a": "audio/mp4",
+        ".mp4": "video/mp4",
+        ".webm": "video/webm",
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".png": "image/png",
+        ".gif": "image/gif",
+        ".webp": "image/webp",
+        ".pdf": "application/pdf",
+        ".json": "application/json",
+        ".txt": "text/plain",
+    }
+
+    return content_types.get(extension, "application/octet-stream")
+
+
+class AudioStorageBackend(ABC):
+    """
+    Interface shared by the audio storage backends.
+
+    `upload_part_size` is the part size `upload_stream` expects from its iterator.
+    """
+    storage_type: AudioStorage = AudioStorage.none
+    upload_part_size: int = 1024 * 1024
+
+    @abstractmethod
+    def exists(self, bucket_name: str, file_path: str) -> bool:
+        ...
+
+    @abstractmethod
+    def upload(
+        self,
+        bucket_name: str,
+        file_path: str,
+        data: bytes,
+        content_type: Optional[str] = None,
+        upsert: bool = True,
+    ) -> str:
+        ...
+
+    @abstractmethod
+    def upload_stream(
+        self,
+        bucket_name: str,
+        file_path: str,
+        parts: Iterable[bytes],
+        content_type: Optional[str] = None,
+        upsert: bool = True,
+    ) -> str:
+        ...
+
+    @abstractmethod
+    def get_public_url(self, bucket_name: str, file_path: str) -> str:
+        ...
+
+    @abstractmethod
+    def delete(self, bucket_name: str, file_path: str) -> bool:
+        ...
+
+
+class SupabaseStorage(AudioStorageBackend):
+    storage_type = AudioStorage.supabase
+    upload_part_size = RESUMABLE_CHUNK_SIZE
+
     def __init__(
         self,
         supabase_url: Optional[str] = None,
@@ -39,22 +122,26 @@ class SupabaseStorage:
 
     def exists(self, bucket_name: str, file_path: str) -> bool:
         """
-        Check if a file exists in the storage bucket with pagination support.
+        Check if a file exists in the storage bucket with a single HEAD request
+        on the object, instead of listing its directory.
         """
         try:
             normalized_path = _normalize_path(file_path)
-            directory = str(Path(normalized_path).parent)
-            filename = Path(normalized_path).name
 
-            files = self.client.storage.from_(bucket_name).list(
-                path=directory,
-                search=filename,
-                limit=None,
+            response = httpx.head(
+                f"{self.supabase_url.rstrip('/')}/storage/v1/object/{bucket_name}/{normalized_path}",
+                headers={
+                    "authorization": f"Bearer {self.supabase_key}",
+                    "apikey": self.supabase_key,
+                },
+                timeout=10.0,
             )
 
-            file_exists = any(item.get("name") == filename for item in files)
+            if response.status_code in (400, 404):
+                return False
 
-            return file_exists
+            response.raise_for_status()
+            return True
 
         except Exception as e:
             logger.error(f"Error checking if file exists: {str(e)}")
@@ -75,7 +162,7 @@ class SupabaseStorage:
             raise ValueError("Cannot upload empty data")
 
         if not content_type:
-            content_type = self._infer_content_type(file_path)
+            content_type = infer_content_type(file_path)
 
         try:
             normalized_path = _normalize_path(file_path)
@@ -96,6 +183,145 @@ class SupabaseStorage:
         except Exception as e:
             raise Exception(f"Failed to upload file: {str(e)}")
 
+    def _tus_headers(self, **extra: str) -> dict:
+        return {
+            "authorization": f"Bearer {self.supabase_key}",
+            "apikey": self.supabase_key,
+            "tus-resumable": TUS_VERSION,
+            **extra,
+        }
+
+    def _create_resumable_upload(
+        self,
+        http: httpx.Client,
+        bucket_name: str,
+        normalized_path: str,
+        content_type: str,
+        upsert: bool,
+    ) -> str:
+        """Open a TUS upload with deferred length and return its location URL."""
+        def _b64(value: str) -> str:
+            return base64.b64encode(value.encode("utf-8")).decode("ascii")
+
+        metadata = ",".join([
+            f"bucketName {_b64(bucket_name)}",
+            f"objectName {_b64(normalized_path)}",
+            f"contentType {_b64(content_type)}",
+        ])
+
+        response = http.post(
+            f"{self.supabase_url.rstrip('/')}/storage/v1/upload/resumable",
+            headers=self._tus_headers(**{
+                "upload-defer-length": "1",
+                "upload-metadata": metadata,
+                "x-upsert": "true" if upsert else "false",
+            }),
+        )
+        response.raise_for_status()
+
+        location = response.headers.get("location")
+        if not location:
+            raise Exception("Resumable upload did not return a location")
+
+        return location
+
+    def _get_remote_offset(self, http: httpx.Client, location: str) -> int:
+        response = http.head(location, headers=self._tus_headers())
+        response.raise_for_status()
+        return int(response.headers.get("upload-offset", "0"))
+
+    def _patch_part(
+        self,
+        http: httpx.Client,
+        location: str,
+        part: bytes,
+        offset: int,
+        is_last: bool,
+        max_retries: int,
+    ) -> int:
+        """
+        Send one part, resuming from the server-side offset if the request fails.
+        Returns the new upload offset.
+        """
+        part_start = offset
+        attempt = 0
+
+        while True:
+            sent = offset - part_start
+            headers = self._tus_headers(**{
+                "upload-offset": str(offset),
+                "content-type": "application/offset+octet-stream",
+            })
+            if is_last:
+                headers["upload-length"] = str(part_start + len(part))
+
+            try:
+                response = http.patch(location, headers=headers, content=part[sent:])
+                response.raise_for_status()
+                return int(response.headers.get("upload-offset", part_start + len(part)))
+
+            except httpx.HTTPError as e:
+                attempt += 1
+                if attempt > max_retries:
+                    raise
+
+                logger.warning(f"Resumable upload part failed ({str(e)}), resuming (attempt {attempt})")
+                offset = self._get_remote_offset(http, location)
+
+                if not (part_start <= offset <= part_start + len(part)):
+                    raise Exception(f"Unexpected resumable upload offset {offset}")
+
+    def upload_stream(
+        self,
+        bucket_name: str,
+        file_path: str,
+        parts: Iterable[bytes],
+        content_type: Optional[str] = None,
+        upsert: bool = True,
+        max_retries: int = 3,
+    ) -> str:
+        """
+        Upload a stream of parts through Supabase's resumable (TUS) endpoint.
+
+        `parts` must yield RESUMABLE_CHUNK_SIZE byte parts (the last may be shorter),
+        e.g. `BoundedChunkBuffer.parts(RESUMABLE_CHUNK_SIZE)`. At most the part being sent and
+        the next one are held in memory (the next one tells us whether the current part is
+        the last), and a failed part is resumed from the offset the server reports.
+        """
+        if not content_type:
+            content_type = infer_content_type(file_path)
+
+        normalized_path = _normalize_path(file_path)
+
+        try:
+            with httpx.Client(timeout=httpx.Timeout(60.0, connect=10.0)) as http:
+                location = self._create_resumable_upload(
+                    http, bucket_name, normalized_path, content_type, upsert
+                )
+
+                offset = 0
+                part_iter = iter(parts)
+                current = next(part_iter, None)
+
+                if current is None:
+                    raise ValueError("Cannot upload empty data")
+
+                while current is not None:
+                    upcoming = next(part_iter, None)
+                    offset = self._patch_part(
+                        http, location, current, offset,
+                        is_last=upcoming is None,
+                        max_retries=max_retries,
+                    )
+                    current = upcoming
+
+            return self.get_public_url(bucket_name, normalized_path)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to upload file stream: {str(e)}")
+
     def get_public_url(self, bucket_name: str, file_path: str) -> str:
         """
         Get the public URL for a file in the storage bucket.
@@ -139,6 +365,7 @@ class SupabaseStorage:
             normalized_path = _normalize_path(file_path)
 
             self.client.storage.from_(bucket_name).remove([normalized_path])
+            audio_manifest.invalidate(bucket_name, normalized_path)
 
             logger.info(f"File deleted successfully: {normalized_path}")
             return True
@@ -147,32 +374,20 @@ class SupabaseStorage:
             logger.error(f"Error deleting file: {str(e)}")
             return False
 
-    def _infer_content_type(self, file_path: str) -> str:
-        """
-        Infer MIME type from file extension.
-        """
-        extension = Path(file_path).suffix.lower()
-
-        content_types = {
-            ".mp3": "audio/mpeg",
-            ".wav": "audio/wav",
-            ".ogg": "audio/ogg",
-            ".m4a": "audio/mp4",
-            ".mp4": "video/mp4",
-            ".webm": "video/webm",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
-            ".pdf": "application/pdf",
-            ".json": "application/json",
-            ".txt": "text/plain",
-        }
 
-        return content_types.get(extension, "application/octet-stream")
+@lru_cache
+def get_storage_client() -> AudioStorageBackend:
+    """
+    Get the configured audio storage backend (AUDIO_STORAGE_TYPE: "supabase" or "local").
+    The instance is shared, so the underlying HTTP client is created once per process.
+    """
+    storage_type = (settings.AUDIO_STORAGE_TYPE or AudioStorage.supabase.value).lower()
+
+    if storage_type == AudioStorage.local.value:
+        from utils.local_storage import LocalFileStorage
+        return LocalFileStorage()
 
+    if storage_type != AudioStorage.supabase.value:
+        raise ValueError(f"Unsupported audio storage type: {settings.AUDIO_STORAGE_TYPE}")
 
-def get_storage_client() -> SupabaseStorage:
-    """Get a configured Supabase storage client instance."""
     return SupabaseStorage()
@@ -0,0 +1,142 @@
+"""
+Usage and cost instrumentation for paid LLM and TTS calls.
+
+Callers describe what a call is for with `usage_context(...)` (session,
+play mode, difficulty, prompt type); the clients report each call through
+`record_llm_call`/`record_tts_call`, which update the metrics registry and,
+when USAGE_RECORDING_ENABLED, store a UsageRecord row for per-session cost.
+"""
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from sqlmodel import Session
+
+from enums.listening_game import UsageProvider
+from model.listening_core.usage_record import UsageRecord
+from utils.config import settings
+from utils.db import engine
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# USD per million tokens (input, output)
+LLM_PRICES_PER_MILLION_TOKENS: Dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+}
+
+CONTEXT_LABELS = ("play_mode", "difficulty", "prompt_type")
+
+_usage_context: ContextVar[Dict[str, Any]] = ContextVar("listening_usage_context", default={})
+
+
+@contextmanager
+def usage_context(**labels: Any) -> Iterator[None]:
+    """Attach labels (game_session_id, play_mode, difficulty, prompt_type) to calls made inside the block."""
+    merged = {**_usage_context.get(), **{key: value for key, value in labels.items() if value is not None}}
+    token = _usage_context.set(merged)
+    try:
+        yield
+    finally:
+        _usage_context.reset(token)
+
+
+def current_usage_context() -> Dict[str, Any]:
+    return dict(_usage_context.get())
+
+
+def estimate_llm_cost(model_name: str, input_tokens: int, output_tokens: int) -> float:
+    input_price, output_price = LLM_PRICES_PER_MILLION_TOKENS.get(model_name, (0.0, 0.0))
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+def estimate_tts_cost(characters: int) -> float:
+    return characters * settings.TTS_COST_PER_1K_CHARACTERS / 1000
+
+
+def _metric_labels(context: Dict[str, Any]) -> Dict[str, str]:
+    return {label: str(context.get(label) or "none") for label in CONTEXT_LABELS}
+
+
+def _store(record: UsageRecord) -> None:
+    if not settings.USAGE_RECORDING_ENABLED:
+        return
+
+    try:
+        with Session(engine) as db_session:
+            db_session.add(record)
+            db_session.commit()
+    except Exception as err:
+        logger.warning(f"Could not store usage record: {err}")
+
+
+def record_llm_call(
+    model_name: str,
+    operation: str,
+    latency_ms: float,
+    input_tokens: int,
+    output_tokens: int,
+    succeeded: bool
+) -> None:
+    """Report one LLM call. Never raises."""
+    context = current_usage_context()
+    labels = _metric_labels(context)
+    cost = estimate_llm_cost(model_name, input_tokens, output_tokens)
+    status = "ok" if succeeded else "error"
+
+    metrics.observe("llm_call_latency_ms", latency_ms, model=model_name, operation=operation, status=status, **labels)
+    metrics.increment("llm_tokens_total", input_tokens, model=model_name, operation=operation, kind="input", **labels)
+    metrics.increment("llm_tokens_total", output_tokens, model=model_name, operation=operation, kind="output", **labels)
+    metrics.increment("llm_cost_usd_total", cost, model=model_name, operation=operation, **labels)
+
+    _store(UsageRecord(
+        game_session_id=context.get("game_session_id"),
+        provider=UsageProvider.llm,
+        operation=operation,
+        model_name=model_name,
+        play_mode=context.get("play_mode"),
+        difficulty=context.get("difficulty"),
+        prompt_type=context.get("prompt_type"),
+        latency_ms=round(latency_ms, 1),
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        estimated_cost_usd=cost,
+        succeeded=succeeded
+    ))
+
+
+def record_tts_call(
+    model_name: Optional[str],
+    operation: str,
+    latency_ms: float,
+    characters: int,
+    succeeded: bool
+) -> None:
+    """Report one TTS synthesis. Never raises."""
+    context = current_usage_context()
+    labels = _metric_labels(context)
+    model_name = model_name or "unknown"
+    cost = estimate_tts_cost(characters) if succeeded else 0.0
+    status = "ok" if succeeded else "error"
+
+    metrics.observe("tts_call_latency_ms", latency_ms, model=model_name, operation=operation, status=status, **labels)
+    metrics.increment("tts_characters_total", characters, model=model_name, **labels)
+    metrics.increment("tts_cost_usd_total", cost, model=model_name, **labels)
+
+    _store(UsageRecord(
+        game_session_id=context.get("game_session_id"),
+        provider=UsageProvider.tts,
+        operation=operation,
+        model_name=model_name,
+        play_mode=context.get("play_mode"),
+        difficulty=context.get("difficulty"),
+        prompt_type=context.get("prompt_type"),
+        latency_ms=round(latency_ms, 1),
+        characters=characters,
+        estimated_cost_usd=cost,
+        succeeded=succeeded
+    ))